@@ -6,6 +6,8 @@ Configures all application settings from environment variables with
 validation and defaults. Supports .env files for local development.
 """
 
+from typing import Optional
+
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -56,6 +58,33 @@ class Settings(BaseSettings):
         le=30,
         description="HTTP timeout in seconds for delivery attempts"
     )
+    delivery_concurrency: int = Field(
+        default=20,
+        ge=1,
+        le=100,
+        description="Maximum concurrent push deliveries within a batch request"
+    )
+
+    # Idempotency cache settings
+    redis_url: Optional[str] = Field(
+        default=None,
+        description="Redis URL for the idempotency-key cache (cache disabled when unset)"
+    )
+    idempotency_cache_ttl: int = Field(
+        default=86400,
+        ge=1,
+        description="TTL in seconds for cached idempotency-key lookups"
+    )
+    idempotency_local_cache_ttl: int = Field(
+        default=60,
+        ge=1,
+        description="TTL in seconds for the in-process idempotency-key cache"
+    )
+    idempotency_local_cache_size: int = Field(
+        default=10000,
+        ge=1,
+        description="Maximum entries in the in-process idempotency-key cache"
+    )
 
     # Security settings
     bcrypt_work_factor: int = Field(
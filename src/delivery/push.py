@@ -3,11 +3,16 @@ Module: push.py
 Description: Push event delivery to Zapier webhook.
 
 Implements HTTP push delivery with timeout handling and
-error recovery for transient failures.
+error recovery for transient failures. Deliveries share one pooled
+httpx.AsyncClient so keep-alive connections and TLS sessions are reused
+across events; HTTP/2 is used when the h2 package is installed.
 """
 
+import asyncio
 import httpx
+import socket
 from typing import Optional
+from urllib.parse import urlsplit
 from datetime import datetime, timezone
 
 from models.event import Event
@@ -15,22 +20,47 @@ from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+try:
+    import h2  # noqa: F401 - only needed so httpx can negotiate HTTP/2
+    HTTP2_AVAILABLE = True
+except ImportError:  # pragma: no cover - h2 is optional
+    HTTP2_AVAILABLE = False
+
+# Connection pool limits for the shared webhook client. Sized for a full
+# batch (100 events) delivered concurrently.
+MAX_KEEPALIVE_CONNECTIONS = 100
+MAX_CONNECTIONS = 200
+
+# Idle pooled connections are kept for this many seconds, and the OS probes
+# them with TCP keepalive (as the DynamoDB and SQS clients do) so a dropped
+# connection is noticed before a delivery is sent on it
+KEEPALIVE_EXPIRY_SECONDS = 30.0
+SOCKET_OPTIONS = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+
 
 class PushDeliveryClient:
     """
     HTTP client for pushing events to Zapier.
 
     Handles delivery attempts with proper timeout and
-    error handling for network issues.
+    error handling for network issues. Holds one httpx.AsyncClient
+    for its lifetime so repeated deliveries reuse pooled connections.
     """
 
-    def __init__(self, webhook_url: str, timeout_seconds: int = 10):
+    def __init__(
+        self,
+        webhook_url: str,
+        timeout_seconds: int = 10,
+        http_client: Optional[httpx.AsyncClient] = None
+    ):
         """
         Initialize push delivery client.
 
         Args:
             webhook_url: Zapier webhook URL for delivery
             timeout_seconds: HTTP timeout in seconds
+            http_client: Optional externally managed AsyncClient; when
+                omitted a pooled client is created on first delivery
 
         Raises:
             ValueError: If webhook_url is invalid
@@ -42,13 +72,61 @@ class PushDeliveryClient:
 
         self.webhook_url = webhook_url
         self.timeout = httpx.Timeout(timeout_seconds, connect=timeout_seconds)
+        self._http_client = http_client
 
         logger.info(
             "Push delivery client initialized",
             webhook_url=webhook_url,
-            timeout_seconds=timeout_seconds
+            timeout_seconds=timeout_seconds,
+            http2=HTTP2_AVAILABLE
         )
 
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """Shared AsyncClient, created lazily on first use."""
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(
+                timeout=self.timeout,
+                transport=httpx.AsyncHTTPTransport(
+                    http2=HTTP2_AVAILABLE,
+                    limits=httpx.Limits(
+                        max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                        max_connections=MAX_CONNECTIONS,
+                        keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS
+                    ),
+                    socket_options=SOCKET_OPTIONS
+                )
+            )
+        return self._http_client
+
+    async def aclose(self) -> None:
+        """Close the shared AsyncClient and its pooled connections."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+
+    async def warmup(self) -> None:
+        """
+        Build the shared AsyncClient and resolve the webhook host ahead of the first delivery.
+
+        No request is sent: the webhook treats any request as a trigger. This
+        moves client/SSL context setup and the first DNS lookup off the first
+        delivery. Failures are logged and ignored.
+        """
+        try:
+            self.http_client
+            url = urlsplit(self.webhook_url)
+            await asyncio.get_running_loop().getaddrinfo(
+                url.hostname,
+                url.port or (443 if url.scheme == 'https' else 80),
+                type=socket.SOCK_STREAM
+            )
+        except Exception as e:
+            logger.warning(
+                "Delivery client warmup failed",
+                webhook_url=self.webhook_url,
+                error=str(e)
+            )
+
     async def deliver_event(self, event: Event) -> bool:
         """
         Deliver event to Zapier via HTTP POST.
@@ -62,69 +140,69 @@ class PushDeliveryClient:
         if not isinstance(event, Event):
             raise ValueError("event must be an Event instance")
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                payload = {
-                    'event_id': event.event_id,
-                    'event_type': event.event_type,
-                    'payload': event.payload,
-                    'metadata': event.metadata,
-                    'created_at': event.created_at.isoformat() + 'Z'
-                }
-
-                logger.debug(
-                    "Attempting event delivery",
-                    event_id=event.event_id,
-                    webhook_url=self.webhook_url
-                )
-
-                response = await client.post(
-                    self.webhook_url,
-                    json=payload,
-                    headers={'Content-Type': 'application/json'}
-                )
-
-                response.raise_for_status()
-
-                logger.info(
-                    "Event delivered successfully",
-                    event_id=event.event_id,
-                    status_code=response.status_code,
-                    response_time_ms=response.elapsed.total_seconds() * 1000
-                )
-
-                return True
-
-            except httpx.TimeoutException:
-                logger.warning(
-                    "Event delivery timeout",
-                    event_id=event.event_id,
-                    webhook_url=self.webhook_url
-                )
-                return False
-
-            except httpx.HTTPStatusError as e:
-                logger.warning(
-                    "Event delivery HTTP error",
-                    event_id=event.event_id,
-                    status_code=e.response.status_code,
-                    response=e.response.text[:500]  # Truncate large responses
-                )
-                return False
-
-            except httpx.NetworkError as e:
-                logger.warning(
-                    "Event delivery network error",
-                    event_id=event.event_id,
-                    error=str(e)
-                )
-                return False
-
-            except Exception as e:
-                logger.error(
-                    "Event delivery failed",
-                    event_id=event.event_id,
-                    error=str(e),
-                    error_type=type(e).__name__
-                )
-                return False
+        client = self.http_client
+        try:
+            payload = {
+                'event_id': event.event_id,
+                'event_type': event.event_type,
+                'payload': event.payload,
+                'metadata': event.metadata,
+                'created_at': event.created_at.isoformat() + 'Z'
+            }
+
+            logger.debug(
+                "Attempting event delivery",
+                event_id=event.event_id,
+                webhook_url=self.webhook_url
+            )
+
+            response = await client.post(
+                self.webhook_url,
+                json=payload,
+                headers={'Content-Type': 'application/json'}
+            )
+
+            response.raise_for_status()
+
+            logger.info(
+                "Event delivered successfully",
+                event_id=event.event_id,
+                status_code=response.status_code,
+                response_time_ms=response.elapsed.total_seconds() * 1000
+            )
+
+            return True
+
+        except httpx.TimeoutException:
+            logger.warning(
+                "Event delivery timeout",
+                event_id=event.event_id,
+                webhook_url=self.webhook_url
+            )
+            return False
+
+        except httpx.HTTPStatusError as e:
+            logger.warning(
+                "Event delivery HTTP error",
+                event_id=event.event_id,
+                status_code=e.response.status_code,
+                response=e.response.text[:500]  # Truncate large responses
+            )
+            return False
+
+        except httpx.NetworkError as e:
+            logger.warning(
+                "Event delivery network error",
+                event_id=event.event_id,
+                error=str(e)
+            )
+            return False
+
+        except Exception as e:
+            logger.error(
+                "Event delivery failed",
+                event_id=event.event_id,
+                error=str(e),
+                error_type=type(e).__name__
+            )
+            return False
@@ -13,52 +13,140 @@ Key Components:
 - Event ID generation and validation
 - Comprehensive error handling with HTTP status codes
 
-Dependencies: FastAPI, datetime, uuid, typing
+Dependencies: FastAPI, asyncio, botocore, datetime, functools, itertools, json, logging, os, typing
 Author: Triggers API Team
 """
 
+import asyncio
+import json
+import logging
+import os
+from botocore.exceptions import ClientError
 from datetime import datetime, timezone
-from uuid import uuid4
 from fastapi import APIRouter, HTTPException, Depends, Request
 from fastapi import status as status_codes
-from fastapi.responses import JSONResponse, Response
-from typing import Dict, List, Optional, Union
+from fastapi.responses import Response
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Dict, List, Optional, Tuple, Union
 
-from models.request import CreateEventRequest, UpdateEventRequest, BatchCreateEventRequest, BatchUpdateEventRequest, BatchDeleteEventRequest, ReplayEventRequest, BatchReplayEventRequest, GetEventsByListRequest
+from models.request import CreateEventRequest, UpdateEventRequest, BatchCreateEventRequest, BatchUpdateEventRequest, BatchUpdateEventItem, BatchDeleteEventRequest, ReplayEventRequest, BatchReplayEventRequest, GetEventsByListRequest
 from models.response import EventResponse, BatchCreateResponse, BatchUpdateResponse, BatchDeleteResponse, BatchCreateItemResult, BatchUpdateItemResult, BatchDeleteItemResult, BatchItemError, BatchOperationSummary, ReplayResponse, BatchReplayItemResult, BatchReplayResponse
 from models.event import Event
 from storage.dynamodb import DynamoDBClient
+from storage.cache import ExhaustedReplayCache, LocalIdempotencyCache, create_idempotency_cache
 from sqs_queue.sqs import SQSClient
 from delivery.push import PushDeliveryClient
 from config.settings import settings
 from utils.logger import get_logger
 from utils.metrics import MetricsClient
-from utils.filters import parse_filter_params
+from utils.batch_helpers import validate_batch_size
+from utils.filters import parse_filter_query
 
 router = APIRouter(prefix="/events", tags=["events"])
 logger = get_logger(__name__)
 
+# Events with this many delivery attempts can no longer be replayed
+MAX_REPLAY_ATTEMPTS = 10
+
+# Replay metadata shared by every event in a batch replay (copied per event)
+_BATCH_REPLAY_METADATA = {
+    'is_replay': True,
+    'replay_reason': 'batch_replay'
+}
+
+# Fixed per-item errors are immutable and shared instead of rebuilt per failure
+_FORBIDDEN_DELETE_ERROR = BatchItemError(
+    code="FORBIDDEN",
+    message="You can only delete your own events"
+)
+_STORAGE_DELETE_ERROR = BatchItemError(
+    code="STORAGE_ERROR",
+    message="Failed to delete event from database"
+)
+_NOT_FOUND_REPLAY_ERROR = BatchItemError(
+    code="NOT_FOUND",
+    message="Event not found"
+)
+_FORBIDDEN_REPLAY_ERROR = BatchItemError(
+    code="FORBIDDEN",
+    message="You can only replay your own events"
+)
+_MAX_ATTEMPTS_REPLAY_ERROR = BatchItemError(
+    code="MAX_ATTEMPTS_EXCEEDED",
+    message=f"Event has exceeded maximum replay attempts ({MAX_REPLAY_ATTEMPTS})"
+)
+# Reported for a batch item that never received an outcome (should not happen)
+_UNPROCESSED_ITEM_ERROR = BatchItemError(
+    code="INTERNAL_ERROR",
+    message="Item was not processed"
+)
+
+# Shared across requests: an in-process TTL cache in front of the optional Redis
+# cache (whose connection pool is reused), so retries hitting a warm container
+# are answered without a network round trip
+idempotency_cache = LocalIdempotencyCache(
+    backend=create_idempotency_cache(
+        settings.redis_url,
+        ttl_seconds=settings.idempotency_cache_ttl
+    ),
+    maxsize=settings.idempotency_local_cache_size,
+    ttl_seconds=settings.idempotency_local_cache_ttl
+)
+
+# Events recently rejected for reaching MAX_REPLAY_ATTEMPTS; repeat replays of
+# them are rejected without a DynamoDB call
+exhausted_replay_cache = ExhaustedReplayCache()
+
+
+# Client factories are cached per configuration so boto3/aioboto3/httpx setup and
+# credential resolution happen once per process instead of once per request.
+# Keying on the settings values keeps patched or reloaded settings effective.
+@lru_cache(maxsize=None)
+def _cached_db_client(table_name: str) -> DynamoDBClient:
+    """Build the DynamoDBClient for a table once and reuse it."""
+    return DynamoDBClient(
+        table_name=table_name,
+        idempotency_cache=idempotency_cache
+    )
+
+
+@lru_cache(maxsize=None)
+def _cached_sqs_client(queue_url: str) -> SQSClient:
+    """Build the SQSClient for a queue once and reuse it."""
+    return SQSClient(queue_url=queue_url)
+
+
+@lru_cache(maxsize=None)
+def _cached_delivery_client(webhook_url: str, timeout_seconds: int) -> PushDeliveryClient:
+    """Build the PushDeliveryClient for a webhook once and reuse it."""
+    return PushDeliveryClient(
+        webhook_url=webhook_url,
+        timeout_seconds=timeout_seconds
+    )
+
 
 def get_db_client() -> DynamoDBClient:
     """
     Dependency to get DynamoDB client.
 
-    Creates and returns a configured DynamoDBClient instance
-    for event storage operations. Uses singleton pattern via
-    global settings.
+    Returns the shared DynamoDBClient for the configured events table,
+    creating it on first use. Attaches the shared idempotency cache when
+    Redis is configured.
 
     Returns:
         Configured DynamoDBClient instance
     """
-    return DynamoDBClient(table_name=settings.events_table_name)
+    return _cached_db_client(settings.events_table_name)
 
 
+@lru_cache(maxsize=1)
 def get_metrics_client() -> MetricsClient:
     """
     Dependency to get CloudWatch metrics client.
 
-    Creates and returns a configured MetricsClient instance
-    for publishing custom metrics.
+    Returns the shared MetricsClient instance for publishing custom
+    metrics, creating it on first use.
 
     Returns:
         Configured MetricsClient instance
@@ -70,37 +158,55 @@ def get_sqs_client() -> SQSClient:
     """
     Dependency to get SQS client.
 
-    Creates and returns a configured SQSClient instance
-    for queueing failed deliveries.
+    Returns the shared SQSClient for the configured inbox queue,
+    creating it on first use. Used for queueing failed deliveries.
 
     Returns:
         Configured SQSClient instance
     """
-    return SQSClient(queue_url=settings.inbox_queue_url)
+    return _cached_sqs_client(settings.inbox_queue_url)
 
 
 def get_delivery_client() -> PushDeliveryClient:
     """
     Dependency to get push delivery client.
 
-    Creates and returns a configured PushDeliveryClient instance
-    for delivering events to Zapier webhooks.
+    Returns the shared PushDeliveryClient for the configured Zapier
+    webhook, creating it on first use.
 
     Returns:
         Configured PushDeliveryClient instance
     """
-    return PushDeliveryClient(
-        webhook_url=settings.zapier_webhook_url,
-        timeout_seconds=settings.delivery_timeout
+    return _cached_delivery_client(
+        settings.zapier_webhook_url,
+        settings.delivery_timeout
     )
 
 
+def generate_event_id() -> str:
+    """
+    Generate a new event ID.
+
+    IDs are "evt_" followed by 12 random lowercase hex characters (48 bits),
+    matching the evt_[a-z0-9]{12} pattern enforced by the Event and request
+    models. IDs are deliberately random rather than time-ordered: event_id is
+    the table's hash key, so ordering gives no range-scan benefit, and a
+    timestamp prefix would leave too few random bits in 12 characters to keep
+    concurrent writers from colliding.
+
+    Returns:
+        New event ID
+    """
+    return f"evt_{os.urandom(6).hex()}"
+
+
 def get_user_id_from_request(request: Request) -> Optional[str]:
     """
     Extract user_id from API Gateway authorizer context.
 
     When auth is enabled, the authorizer sets user_id in the context.
-    This function extracts it from the request scope.
+    This function extracts it from the request scope. The result is
+    cached on request.state so the scope is only walked once per request.
 
     Args:
         request: FastAPI Request object
@@ -108,6 +214,22 @@ def get_user_id_from_request(request: Request) -> Optional[str]:
     Returns:
         user_id if available from authorizer, None otherwise
     """
+    try:
+        return request.state.user_id
+    except AttributeError:
+        pass
+
+    user_id = _resolve_user_id(request)
+    try:
+        request.state.user_id = user_id
+    except Exception:
+        # Request objects without state (e.g. in tests) just skip the cache
+        pass
+    return user_id
+
+
+def _resolve_user_id(request: Request) -> Optional[str]:
+    """Walk the Lambda authorizer context in request.scope for the user_id."""
     try:
         # Access the raw Lambda event from Mangum
         # The event is stored in request.scope by Mangum
@@ -135,7 +257,7 @@ async def create_event(
     sqs_client: SQSClient = Depends(get_sqs_client),
     delivery_client: PushDeliveryClient = Depends(get_delivery_client),
     metrics_client: MetricsClient = Depends(get_metrics_client)
-) -> Union[EventResponse, JSONResponse]:
+) -> Union[EventResponse, Response]:
     """
     Create and ingest a new event with automatic delivery attempt.
 
@@ -187,7 +309,7 @@ async def create_event(
         
         # Check for idempotency key before creating new event
         if request.idempotency_key:
-            existing_event = await db_client.get_event_by_idempotency_key(
+            existing_event = await db_client.get_event_by_idempotency_key_cached(
                 user_id=user_id,
                 idempotency_key=request.idempotency_key
             )
@@ -202,33 +324,32 @@ async def create_event(
                 )
 
                 # Return existing event with HTTP 200 (idempotent response)
-                response_data = EventResponse(
-                    event_id=existing_event.event_id,
-                    event_type=existing_event.event_type,
-                    payload=existing_event.payload,
-                    metadata=existing_event.metadata,
-                    status=existing_event.status,
-                    created_at=existing_event.created_at,
-                    delivered_at=existing_event.delivered_at,
-                    delivery_attempts=existing_event.delivery_attempts,
-                    user_id=existing_event.user_id,
-                    idempotency_key=existing_event.idempotency_key,
+                response_data = EventResponse.from_event(
+                    existing_event,
                     message="Event already exists with this user_id and idempotency key"
                 )
-                return JSONResponse(
-                    content=response_data.model_dump(mode='json'),
+                # Serialized straight to JSON bytes by pydantic-core
+                return Response(
+                    content=response_data.model_dump_json(),
+                    media_type="application/json",
                     status_code=status_codes.HTTP_200_OK
                 )
 
         # Generate unique event ID
-        event_id = f"evt_{uuid4().hex[:12]}"
+        event_id = generate_event_id()
 
         logger.info(
             "Creating new event",
             event_type=request.event_type,
-            has_metadata=bool(request.metadata),
-            payload_size=len(str(request.payload))
+            has_metadata=bool(request.metadata)
         )
+        # Serializing the payload just to measure it is only worth it when debugging
+        if logger.is_enabled_for(logging.DEBUG):
+            logger.debug(
+                "New event payload size",
+                event_type=request.event_type,
+                payload_bytes=len(json.dumps(request.payload))
+            )
 
         # Create event model
         event = Event(
@@ -244,8 +365,22 @@ async def create_event(
             idempotency_key=request.idempotency_key
         )
 
-        # Store in DynamoDB first
-        await db_client.put_event(event)
+        # Store in DynamoDB (never overwriting an existing event) and attempt push
+        # delivery concurrently. The delivery outcome is only acted on once the
+        # store has succeeded; a failed store still fails the request.
+        store_result, delivery_result = await asyncio.gather(
+            db_client.put_event(event, only_if_new=True),
+            delivery_client.deliver_event(event),
+            return_exceptions=True
+        )
+        if isinstance(store_result, BaseException):
+            if delivery_result is True:
+                logger.warning(
+                    "Event was delivered but could not be stored",
+                    event_id=event_id,
+                    event_type=request.event_type
+                )
+            raise store_result
 
         logger.info(
             "Event stored in database",
@@ -253,9 +388,15 @@ async def create_event(
             event_type=request.event_type
         )
 
-        # Attempt immediate push delivery
+        # Serialized once for SQS, and only if the event needs queueing; shared by
+        # the "not delivered" branch and the exception fallback below
+        queued_event_data: Optional[str] = None
+
+        # Handle the push delivery outcome
         try:
-            delivery_success = await delivery_client.deliver_event(event)
+            if isinstance(delivery_result, BaseException):
+                raise delivery_result
+            delivery_success = delivery_result
 
             if delivery_success:
                 # Update to delivered status
@@ -268,7 +409,7 @@ async def create_event(
 
                 # Publish delivery metrics
                 try:
-                    metrics_client.put_metric(
+                    metrics_client.enqueue_metric(
                         metric_name="EventDelivered",
                         value=1.0,
                         dimensions={"EventType": request.event_type}
@@ -278,9 +419,10 @@ async def create_event(
 
             else:
                 # Queue to SQS for retry
+                queued_event_data = event.model_dump_json()
                 await sqs_client.send_message(
                     event_id=event_id,
-                    event_data=event.model_dump(mode='json')
+                    event_data=queued_event_data
                 )
 
                 logger.info("Event queued for retry", event_id=event_id)
@@ -293,9 +435,11 @@ async def create_event(
                 error=str(e)
             )
             try:
+                if queued_event_data is None:
+                    queued_event_data = event.model_dump_json()
                 await sqs_client.send_message(
                     event_id=event_id,
-                    event_data=event.model_dump(mode='json')
+                    event_data=queued_event_data
                 )
             except Exception as queue_error:
                 logger.error(
@@ -306,7 +450,7 @@ async def create_event(
 
         # Publish creation metrics
         try:
-            metrics_client.put_metric(
+            metrics_client.enqueue_metric(
                 metric_name="EventCreated",
                 value=1.0,
                 dimensions={"EventType": request.event_type}
@@ -315,19 +459,7 @@ async def create_event(
             # Metrics failure shouldn't break event creation
             pass
 
-        return EventResponse(
-            event_id=event.event_id,
-            event_type=event.event_type,
-            payload=event.payload,
-            metadata=event.metadata,
-            status=event.status,
-            created_at=event.created_at,
-            delivered_at=event.delivered_at,
-            delivery_attempts=event.delivery_attempts,
-            user_id=event.user_id,
-            idempotency_key=event.idempotency_key,
-            message=f"Event {event.status}"
-        )
+        return EventResponse.from_event(event, message=f"Event {event.status}")
 
     except ValueError as e:
         # Validation error
@@ -437,7 +569,6 @@ async def batch_create_events(
         user_id = get_user_id_from_request(http_request)
 
         # Validate batch size
-        from utils.batch_helpers import validate_batch_size
         validate_batch_size(request.events, 100)
 
         logger.info(
@@ -446,12 +577,47 @@ async def batch_create_events(
             user_id=user_id
         )
 
-        results: List[BatchCreateItemResult] = []
+        # Results are placed by original index, so no final sort is needed
+        results: List[Optional[BatchCreateItemResult]] = [None] * len(request.events)
         events_to_store: List[Event] = []
         events_to_deliver: List[Event] = []
         index_map: Dict[str, int] = {}  # event_id -> original index
         idempotent_indices: set[int] = set()  # Track which indices are idempotent matches
 
+        # Resolve idempotency keys for the whole batch up front: cached hits in one
+        # round trip, then concurrent exact IdempotencyIndex queries per user for the
+        # rest (the batch usually has a single user). A failed lookup is kept as its
+        # exception and fails only the items of that user that carry a key.
+        idempotency_pairs = list(dict.fromkeys(
+            (item.user_id or user_id, item.idempotency_key)
+            for item in request.events
+            if item.idempotency_key and (item.user_id or user_id)
+        ))
+        existing_by_key: Dict[Tuple[str, str], Union[Event, None, Exception]] = dict(
+            await db_client.get_cached_events_by_idempotency_keys(idempotency_pairs)
+        )
+        uncached_keys_by_user: Dict[str, List[str]] = {}
+        for pair_user_id, idempotency_key in idempotency_pairs:
+            if (pair_user_id, idempotency_key) not in existing_by_key:
+                uncached_keys_by_user.setdefault(pair_user_id, []).append(idempotency_key)
+        if uncached_keys_by_user:
+            lookups = await asyncio.gather(
+                *(
+                    db_client.batch_get_events_by_idempotency_keys(pair_user_id, keys)
+                    for pair_user_id, keys in uncached_keys_by_user.items()
+                ),
+                return_exceptions=True
+            )
+            for (pair_user_id, keys), found in zip(uncached_keys_by_user.items(), lookups):
+                for idempotency_key in keys:
+                    existing_by_key[(pair_user_id, idempotency_key)] = (
+                        found if isinstance(found, Exception) else found.get(idempotency_key)
+                    )
+
+        # One creation timestamp for the whole batch; items are prepared within
+        # microseconds of each other
+        created_at = datetime.now(timezone.utc)
+
         # Process each event in the batch
         for idx, item in enumerate(request.events):
             try:
@@ -460,13 +626,12 @@ async def batch_create_events(
 
                 # Check for idempotency key duplicate (per event, since user_id may vary)
                 if item.idempotency_key and event_user_id:
-                    existing_event = await db_client.get_event_by_idempotency_key(
-                        user_id=event_user_id,
-                        idempotency_key=item.idempotency_key
-                    )
+                    existing_event = existing_by_key.get((event_user_id, item.idempotency_key))
+                    if isinstance(existing_event, Exception):
+                        raise existing_event
 
                     if existing_event:
-                        logger.info(
+                        logger.debug(
                             "Duplicate event creation prevented by idempotency key",
                             idempotency_key=item.idempotency_key,
                             user_id=event_user_id,
@@ -475,30 +640,21 @@ async def batch_create_events(
                         )
 
                         # Return existing event as successful result (but mark as idempotent)
-                        event_response = EventResponse(
-                            event_id=existing_event.event_id,
-                            event_type=existing_event.event_type,
-                            payload=existing_event.payload,
-                            metadata=existing_event.metadata,
-                            status=existing_event.status,
-                            created_at=existing_event.created_at,
-                            delivered_at=existing_event.delivered_at,
-                            delivery_attempts=existing_event.delivery_attempts,
-                            user_id=existing_event.user_id,
-                            idempotency_key=existing_event.idempotency_key,
+                        event_response = EventResponse.from_event(
+                            existing_event,
                             message="Event already exists with this idempotency key"
                         )
 
-                        results.append(BatchCreateItemResult(
+                        results[idx] = BatchCreateItemResult(
                             index=idx,
                             success=True,
                             event=event_response
-                        ))
+                        )
                         idempotent_indices.add(idx)
                         continue
 
                 # Generate unique event ID
-                event_id = f"evt_{uuid4().hex[:12]}"
+                event_id = generate_event_id()
 
                 # Create event model
                 event = Event(
@@ -507,7 +663,7 @@ async def batch_create_events(
                     payload=item.payload,
                     metadata=item.metadata,
                     status="pending",
-                    created_at=datetime.now(timezone.utc),
+                    created_at=created_at,
                     delivered_at=None,
                     delivery_attempts=0,
                     user_id=event_user_id,
@@ -519,7 +675,7 @@ async def batch_create_events(
                 events_to_deliver.append(event)
                 index_map[event_id] = idx
 
-                logger.info(
+                logger.debug(
                     "Prepared event for batch processing",
                     event_id=event_id,
                     event_type=item.event_type,
@@ -536,137 +692,152 @@ async def batch_create_events(
                     event_type=getattr(item, 'event_type', 'unknown')
                 )
 
-                results.append(BatchCreateItemResult(
+                results[idx] = BatchCreateItemResult(
                     index=idx,
                     success=False,
                     error=BatchItemError(
                         code="VALIDATION_ERROR",
                         message=str(e)
                     )
-                ))
+                )
+
+        # Per-item preparation is logged at debug; one info line covers the batch
+        logger.info(
+            "Batch prepared",
+            total=len(request.events),
+            to_store=len(events_to_store),
+            idempotent=len(idempotent_indices),
+            with_keys=len(idempotency_pairs),
+            user_id=user_id
+        )
 
         # Batch store events in DynamoDB
-        successful_event_ids = []
+        successful_event_ids: set[str] = set()
         if events_to_store:
             batch_result = await db_client.batch_put_events(events_to_store)
-            successful_event_ids = batch_result["successful_event_ids"]
+            successful_event_ids = set(batch_result["successful_event_ids"])
 
             # Process failed events from batch storage
+            failed_event_ids: set[str] = set()
             for failed_item in batch_result["failed_items"]:
                 failed_event_id = failed_item["event_id"]
                 original_idx = index_map.get(failed_event_id)
 
                 if original_idx is not None:
-                    results.append(BatchCreateItemResult(
+                    results[original_idx] = BatchCreateItemResult(
                         index=original_idx,
                         success=False,
                         error=BatchItemError(
                             code="STORAGE_ERROR",
                             message=failed_item["reason"]
                         )
-                    ))
+                    )
+                    failed_event_ids.add(failed_event_id)
 
-                    # Remove from delivery list
-                    events_to_deliver = [e for e in events_to_deliver if e.event_id != failed_event_id]
+            # Remove failed events from the delivery list in one pass
+            if failed_event_ids:
+                events_to_deliver = [e for e in events_to_deliver if e.event_id not in failed_event_ids]
 
-        # Attempt delivery for successful events
+        # Attempt delivery for successful events concurrently, bounded so a large
+        # batch does not open one webhook connection per event at once
         delivered_event_ids = []
+        delivered_events: List[Event] = []
         if events_to_deliver:
-            for event in events_to_deliver:
-                try:
-                    delivery_success = await delivery_client.deliver_event(event)
-
-                    if delivery_success:
-                        event.status = "delivered"
-                        event.delivered_at = datetime.now(timezone.utc)
-                        event.delivery_attempts = 1
-                        delivered_event_ids.append(event.event_id)
-
-                        # Publish delivery metrics
-                        try:
-                            metrics_client.put_metric(
-                                metric_name="EventDelivered",
-                                value=1.0,
-                                dimensions={"EventType": event.event_type}
-                            )
-                        except Exception:
-                            pass
-
-                        logger.info("Event delivered immediately in batch", event_id=event.event_id)
-                    else:
-                        # Queue to SQS for retry
-                        await sqs_client.send_message(
-                            event_id=event.event_id,
-                            event_data=event.model_dump(mode='json')
-                        )
-                        logger.info("Event queued for retry in batch", event_id=event.event_id)
-
-                except Exception as e:
-                    logger.warning(
-                        "Push delivery failed in batch, queueing to SQS",
-                        event_id=event.event_id,
-                        error=str(e)
-                    )
-                    try:
-                        await sqs_client.send_message(
-                            event_id=event.event_id,
-                            event_data=event.model_dump(mode='json')
-                        )
-                    except Exception as queue_error:
-                        logger.error(
-                            "Failed to queue event to SQS in batch",
-                            event_id=event.event_id,
-                            error=str(queue_error)
-                        )
+            delivery_semaphore = asyncio.Semaphore(settings.delivery_concurrency)
 
-        # Update delivered events in DynamoDB
-        if delivered_event_ids:
-            delivered_events = [e for e in events_to_deliver if e.event_id in delivered_event_ids]
-            if delivered_events:
-                # Note: We could batch update these, but for simplicity we'll update individually
-                # In a production system, you might want to add a batch_update_events method
-                for event in delivered_events:
+            async def deliver(event: Event) -> bool:
+                """Push one event. Returns True if delivered, False if it needs queueing."""
+                async with delivery_semaphore:
                     try:
-                        await db_client.update_event(event)
+                        delivery_success = await delivery_client.deliver_event(event)
                     except Exception as e:
-                        logger.error(
-                            "Failed to update delivered event status in batch",
+                        logger.warning(
+                            "Push delivery failed in batch, queueing to SQS",
                             event_id=event.event_id,
                             error=str(e)
                         )
+                        return False
+
+                if delivery_success:
+                    logger.debug("Event delivered immediately in batch", event_id=event.event_id)
+                return delivery_success
+
+            delivery_outcomes = await asyncio.gather(
+                *(deliver(event) for event in events_to_deliver)
+            )
 
-        # Build final results for successful events
+            # All deliveries have completed by now, so one timestamp covers them
+            delivered_at = datetime.now(timezone.utc)
+            events_to_queue = []
+            for event, delivered in zip(events_to_deliver, delivery_outcomes):
+                if delivered:
+                    event.status = "delivered"
+                    event.delivered_at = delivered_at
+                    event.delivery_attempts = 1
+                    delivered_event_ids.append(event.event_id)
+                    delivered_events.append(event)
+                else:
+                    events_to_queue.append(event)
+
+            # Queue undelivered events for retry with SendMessageBatch (10 per call)
+            if events_to_queue:
+                try:
+                    queue_result = await sqs_client.send_message_batch([
+                        (event.event_id, event.model_dump_json())
+                        for event in events_to_queue
+                    ])
+                    logger.info(
+                        "Events queued for retry in batch",
+                        queued=len(queue_result["successful_event_ids"]),
+                        failed=len(queue_result["failed_event_ids"])
+                    )
+                except Exception as queue_error:
+                    logger.error(
+                        "Failed to queue events to SQS in batch",
+                        event_ids=[event.event_id for event in events_to_queue],
+                        error=str(queue_error)
+                    )
+
+        # Update delivered events in DynamoDB with one batch write
+        if delivered_events:
+            try:
+                update_result = await db_client.batch_update_events(delivered_events)
+                for failed_item in update_result["failed_items"]:
+                    logger.error(
+                        "Failed to update delivered event status in batch",
+                        event_id=failed_item["event_id"],
+                        error=failed_item["reason"]
+                    )
+            except Exception as e:
+                logger.error(
+                    "Failed to update delivered event statuses in batch",
+                    event_ids=delivered_event_ids,
+                    error=str(e)
+                )
+
+        # Build final results for successful events, counting them as they are placed
+        successful_count = 0  # Newly created events (not idempotent)
         for event in events_to_store:
             if event.event_id in successful_event_ids:
                 original_idx = index_map[event.event_id]
-                event_response = EventResponse(
-                    event_id=event.event_id,
-                    event_type=event.event_type,
-                    payload=event.payload,
-                    metadata=event.metadata,
-                    status=event.status,
-                    created_at=event.created_at,
-                    delivered_at=event.delivered_at,
-                    delivery_attempts=event.delivery_attempts,
-                    user_id=event.user_id,
-                    idempotency_key=event.idempotency_key,
-                    message=f"Event {event.status}"
-                )
+                event_response = EventResponse.from_event(event, message=f"Event {event.status}")
 
-                results.append(BatchCreateItemResult(
+                results[original_idx] = BatchCreateItemResult(
                     index=original_idx,
                     success=True,
                     event=event_response
-                ))
+                )
+                successful_count += 1
 
-        # Sort results by original index
-        results.sort(key=lambda r: r.index)
+        # Report any slot that never received an outcome (should not happen) as
+        # failed, so every request item has a result and is counted in the summary
+        for idx, result in enumerate(results):
+            if result is None:
+                results[idx] = BatchCreateItemResult(index=idx, success=False, error=_UNPROCESSED_ITEM_ERROR)
 
         # Calculate summary
-        # Successful = newly created events (not idempotent)
-        successful_count = sum(1 for r in results if r.success and r.index not in idempotent_indices)
         idempotent_count = len(idempotent_indices)
-        failed_count = sum(1 for r in results if not r.success)
+        failed_count = len(results) - successful_count - idempotent_count
 
         summary = BatchOperationSummary(
             total=len(results),
@@ -675,13 +846,23 @@ async def batch_create_events(
             failed=failed_count
         )
 
-        # Publish batch metrics
+        # Buffer batch and per-event delivery metrics for the background flush
         try:
-            metrics_client.put_metric(
-                metric_name="BatchCreateEvents",
-                value=1.0,
-                dimensions={"BatchSize": str(len(request.events))}
-            )
+            metrics_client.enqueue_metrics([
+                {
+                    "metric_name": "BatchCreateEvents",
+                    "value": 1.0,
+                    "dimensions": {"BatchSize": str(len(request.events))}
+                },
+                *(
+                    {
+                        "metric_name": "EventDelivered",
+                        "value": 1.0,
+                        "dimensions": {"EventType": event.event_type}
+                    }
+                    for event in delivered_events
+                )
+            ])
         except Exception:
             pass
 
@@ -691,6 +872,7 @@ async def batch_create_events(
             successful=successful_count,
             idempotent=idempotent_count,
             failed=failed_count,
+            delivered=len(delivered_events),
             user_id=user_id
         )
 
@@ -704,7 +886,7 @@ async def batch_create_events(
         logger.warning(
             "Batch create validation failed",
             error=str(e),
-            batch_size=len(getattr(request, 'events', []))
+            batch_size=len(request.events)
         )
         raise HTTPException(
             status_code=status_codes.HTTP_400_BAD_REQUEST,
@@ -716,7 +898,7 @@ async def batch_create_events(
         logger.error(
             "Critical error in batch create",
             error=str(e),
-            batch_size=len(getattr(request, 'events', []))
+            batch_size=len(request.events)
         )
         raise HTTPException(
             status_code=status_codes.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -807,10 +989,9 @@ async def batch_update_events(
         
         if is_filter_mode:
             # Filter mode: Parse query parameters and get matching events
-            query_params = dict(http_request.query_params)
-            filters = parse_filter_params(query_params)
+            filters, status_filter = parse_filter_query(http_request.url.query)
             
-            if not filters and 'status' not in query_params:
+            if not filters and status_filter is None:
                 raise ValueError(
                     "Filter mode requires at least one query parameter filter "
                     "(e.g., ?payload.field=value or ?status=pending)"
@@ -819,32 +1000,37 @@ async def batch_update_events(
             logger.info(
                 "Starting filtered batch update",
                 filters=bool(filters),
-                status_filter=query_params.get('status'),
+                status_filter=status_filter,
                 user_id=user_id
             )
             
-            # Get matching events (up to 100)
+            # Get matching events owned by this user (up to 100); ownership is
+            # filtered by DynamoDB (no-op when auth is disabled and user_id is None)
             matching_events = await db_client.list_events(
-                status=query_params.get('status'),
+                status=status_filter,
                 limit=100,
                 cursor=None,
-                filters=filters
+                filters=filters,
+                user_id=user_id
             )
             
-            # Build batch update items from filter results, filtering by user_id for ownership
-            from models.request import BatchUpdateEventItem
-            batch_items = []
-            for event in matching_events:
-                # Skip events that don't belong to this user (if auth is enabled)
-                if user_id is not None and event.user_id != user_id:
-                    continue
-                item = BatchUpdateEventItem(
+            # Build batch update items from filter results. list_events returns full
+            # items (StatusIndex projects ALL attributes), so the matched events are
+            # used directly instead of being fetched again.
+            events_by_id: Dict[str, Event] = {event.event_id: event for event in matching_events}
+
+            # The shared fields were already validated on the request (same validators
+            # as BatchUpdateEventItem), so the items are built without re-validating
+            payload, metadata, idempotency_key = request.payload, request.metadata, request.idempotency_key
+            batch_items = [
+                BatchUpdateEventItem.model_construct(
                     event_id=event.event_id,
-                    payload=request.payload,
-                    metadata=request.metadata,
-                    idempotency_key=request.idempotency_key
+                    payload=payload,
+                    metadata=metadata,
+                    idempotency_key=idempotency_key
                 )
-                batch_items.append(item)
+                for event in matching_events
+            ]
             
             if not batch_items:
                 # No events matched the filter (after user filtering)
@@ -868,7 +1054,6 @@ async def batch_update_events(
             batch_items = request.events
             
             # Validate batch size
-            from utils.batch_helpers import validate_batch_size
             validate_batch_size(batch_items, 100)
             
             logger.info(
@@ -877,81 +1062,101 @@ async def batch_update_events(
                 user_id=user_id
             )
 
-        results: List[BatchUpdateItemResult] = []
-
-        # Extract all event_ids for batch retrieval
-        event_ids = [item.event_id for item in batch_items]
+        # Results are placed by original index, so no final sort is needed
+        results: List[Optional[BatchUpdateItemResult]] = [None] * len(batch_items)
 
-        # Batch get existing events from DynamoDB
-        existing_events = await db_client.batch_get_events(event_ids)
-        events_by_id = {event.event_id: event for event in existing_events}
+        if not is_filter_mode:
+            # Batch get existing events from DynamoDB, once per event_id
+            # (BatchGetItem rejects requests with duplicate keys)
+            existing_events = await db_client.batch_get_events(
+                list(dict.fromkeys(item.event_id for item in batch_items))
+            )
+            events_by_id = {event.event_id: event for event in existing_events}
 
         # Process each update in the batch
         events_to_update: List[Event] = []
+        events_to_redeliver: List[Event] = []
         index_map: Dict[str, int] = {}  # event_id -> original index
+        fields_by_id: Dict[str, List[str]] = {}  # event_id -> Event fields to write
+        seen_event_ids: set[str] = set()
+        not_found_ids: List[str] = []
+        forbidden_ids: List[str] = []
 
         for idx, item in enumerate(batch_items):
             try:
+                # Only the first occurrence of an event_id is applied, so an event
+                # is never written or queued for redelivery twice
+                if item.event_id in seen_event_ids:
+                    results[idx] = BatchUpdateItemResult(
+                        index=idx,
+                        success=False,
+                        error=BatchItemError(
+                            code="VALIDATION_ERROR",
+                            message=f"Duplicate event_id {item.event_id} in batch"
+                        )
+                    )
+                    continue
+                seen_event_ids.add(item.event_id)
+
                 # Check if event exists
                 event = events_by_id.get(item.event_id)
                 if not event:
-                    results.append(BatchUpdateItemResult(
+                    not_found_ids.append(item.event_id)
+                    results[idx] = BatchUpdateItemResult(
                         index=idx,
                         success=False,
                         error=BatchItemError(
                             code="NOT_FOUND",
                             message=f"Event {item.event_id} not found"
                         )
-                    ))
+                    )
                     continue
 
                 # Verify ownership (only check if auth is enabled and user_id is set)
                 if user_id is not None and event.user_id != user_id:
-                    logger.warning(
-                        "Unauthorized batch event update attempt",
-                        event_id=item.event_id,
-                        requested_by=user_id,
-                        event_owner=event.user_id,
-                        index=idx
-                    )
-                    results.append(BatchUpdateItemResult(
+                    forbidden_ids.append(item.event_id)
+                    results[idx] = BatchUpdateItemResult(
                         index=idx,
                         success=False,
                         error=BatchItemError(
                             code="FORBIDDEN",
                             message="You can only update your own events"
                         )
-                    ))
+                    )
                     continue
 
                 # Check which fields were explicitly provided
-                provided_fields = item.model_dump(exclude_unset=True)
+                provided_fields = item.model_fields_set
 
                 # Validate at least one field is provided
                 update_fields = []
+                changed_fields = []
                 if 'payload' in provided_fields:
                     if item.payload is not None:
                         event.payload = item.payload
                         update_fields.append("payload")
+                        changed_fields.append("payload")
                     else:
-                        results.append(BatchUpdateItemResult(
+                        results[idx] = BatchUpdateItemResult(
                             index=idx,
                             success=False,
                             error=BatchItemError(
                                 code="VALIDATION_ERROR",
                                 message="payload cannot be null"
                             )
-                        ))
+                        )
                         continue
 
                 if 'metadata' in provided_fields:
                     # metadata can be set to None to remove it
                     event.metadata = item.metadata
                     update_fields.append("metadata")
+                    changed_fields.append("metadata")
 
                 if 'idempotency_key' in provided_fields:
                     # idempotency_key can be set to None to remove it
                     event.idempotency_key = item.idempotency_key
+                    changed_fields.append("idempotency_key")
                     if item.idempotency_key is None:
                         update_fields.append("idempotency_key (removed)")
                     else:
@@ -959,14 +1164,14 @@ async def batch_update_events(
 
                 # Validate that at least one field was provided
                 if not update_fields:
-                    results.append(BatchUpdateItemResult(
+                    results[idx] = BatchUpdateItemResult(
                         index=idx,
                         success=False,
                         error=BatchItemError(
                             code="VALIDATION_ERROR",
                             message="At least one of payload, metadata, or idempotency_key must be provided"
                         )
-                    ))
+                    )
                     continue
 
                 # Smart status handling for redelivery
@@ -976,8 +1181,9 @@ async def batch_update_events(
                     # Reset to pending for redelivery
                     event.status = "pending"
                     event.delivered_at = None
+                    changed_fields.extend(("status", "delivered_at"))
 
-                    logger.info(
+                    logger.debug(
                         "Event updated and reset for redelivery",
                         event_id=event.event_id,
                         previous_status=previous_status,
@@ -985,22 +1191,10 @@ async def batch_update_events(
                         index=idx
                     )
 
-                    # Queue to SQS for immediate redelivery
-                    try:
-                        await sqs_client.send_message(
-                            event_id=event.event_id,
-                            event_data=event.model_dump(mode='json')
-                        )
-                        logger.info("Updated event queued for redelivery", event_id=event.event_id)
-                    except Exception as queue_error:
-                        logger.error(
-                            "Failed to queue updated event for redelivery",
-                            event_id=event.event_id,
-                            error=str(queue_error)
-                        )
-                        # Don't fail the update, just log the error
+                    # Queued to SQS for redelivery once the update is stored
+                    events_to_redeliver.append(event)
                 else:
-                    logger.info(
+                    logger.debug(
                         "Event updated without status change",
                         event_id=event.event_id,
                         status=event.status,
@@ -1011,6 +1205,7 @@ async def batch_update_events(
                 # Add to batch update list
                 events_to_update.append(event)
                 index_map[event.event_id] = idx
+                fields_by_id[event.event_id] = changed_fields
 
             except Exception as e:
                 # Unexpected error for this item
@@ -1021,80 +1216,124 @@ async def batch_update_events(
                     error=str(e)
                 )
 
-                results.append(BatchUpdateItemResult(
+                results[idx] = BatchUpdateItemResult(
                     index=idx,
                     success=False,
                     error=BatchItemError(
                         code="VALIDATION_ERROR",
                         message=str(e)
                     )
-                ))
-
-        # Batch update events in DynamoDB (using individual put_item for now)
-        # Note: In a production system, you might want to add a batch_update_events method
-        successful_event_ids = []
-        for event in events_to_update:
-            try:
-                await db_client.update_event(event)
-                successful_event_ids.append(event.event_id)
-                logger.info(
-                    "Event updated in batch",
-                    event_id=event.event_id,
-                    status=event.status
                 )
-            except Exception as e:
-                logger.error(
-                    "Failed to update event in DynamoDB batch",
-                    event_id=event.event_id,
-                    error=str(e)
-                )
-                # Mark as failed
-                original_idx = index_map[event.event_id]
-                results.append(BatchUpdateItemResult(
-                    index=original_idx,
-                    success=False,
-                    error=BatchItemError(
-                        code="STORAGE_ERROR",
-                        message=f"Failed to update event: {str(e)}"
+
+        # Write only the changed attributes of each event with UpdateItem, conditioned
+        # on the event still existing and belonging to the caller. Attributes not
+        # touched by the update (e.g. a concurrent delivery marking the event
+        # delivered) are not overwritten. The writes run concurrently in the
+        # default thread pool, which bounds how many are in flight. Each outcome
+        # is placed in results as soon as it is known.
+        successful_event_ids = set()
+        successful_count = 0
+        if events_to_update:
+            update_outcomes = await asyncio.gather(
+                *(
+                    db_client.update_event_fields(
+                        event,
+                        fields_by_id[event.event_id],
+                        expected_user_id=user_id
                     )
-                ))
+                    for event in events_to_update
+                ),
+                return_exceptions=True
+            )
 
-        # Build final results for successful updates
-        for event in events_to_update:
-            if event.event_id in successful_event_ids:
+            for event, outcome in zip(events_to_update, update_outcomes):
                 original_idx = index_map[event.event_id]
+                if not isinstance(outcome, Exception):
+                    successful_event_ids.add(event.event_id)
+                    successful_count += 1
+
+                    message = "Event updated"
+                    if event.status == "pending":
+                        message += " and queued for redelivery"
+                    else:
+                        message += " successfully"
+
+                    results[original_idx] = BatchUpdateItemResult(
+                        index=original_idx,
+                        success=True,
+                        event=EventResponse.from_event(event, message=message)
+                    )
+                    continue
 
-                message = "Event updated"
-                if event.status == "pending":
-                    message += " and queued for redelivery"
+                if (
+                    isinstance(outcome, ClientError)
+                    and outcome.response['Error']['Code'] == 'ConditionalCheckFailedException'
+                ):
+                    # Deleted, or not the caller's, since it was read
+                    if 'Item' in outcome.response:
+                        forbidden_ids.append(event.event_id)
+                        error = BatchItemError(
+                            code="FORBIDDEN",
+                            message="You can only update your own events"
+                        )
+                    else:
+                        not_found_ids.append(event.event_id)
+                        error = BatchItemError(
+                            code="NOT_FOUND",
+                            message=f"Event {event.event_id} not found"
+                        )
                 else:
-                    message += " successfully"
+                    logger.error(
+                        "Failed to update event in DynamoDB batch",
+                        event_id=event.event_id,
+                        error=str(outcome)
+                    )
+                    error = BatchItemError(
+                        code="STORAGE_ERROR",
+                        message=f"Failed to update event: {str(outcome)}"
+                    )
 
-                event_response = EventResponse(
-                    event_id=event.event_id,
-                    event_type=event.event_type,
-                    payload=event.payload,
-                    metadata=event.metadata,
-                    status=event.status,
-                    created_at=event.created_at,
-                    delivered_at=event.delivered_at,
-                    delivery_attempts=event.delivery_attempts,
-                    user_id=event.user_id,
-                    idempotency_key=event.idempotency_key,
-                    message=message
+                results[original_idx] = BatchUpdateItemResult(
+                    index=original_idx,
+                    success=False,
+                    error=error
                 )
 
-                results.append(BatchUpdateItemResult(
-                    index=original_idx,
-                    success=True,
-                    event=event_response
-                ))
+            logger.info(
+                "Events updated in batch",
+                updated=successful_count,
+                failed=len(events_to_update) - successful_count
+            )
+
+        # Queue stored events that were reset to pending for redelivery with
+        # SendMessageBatch (10 per call); queueing failures don't fail the update
+        redeliver_messages = [
+            (event.event_id, event.model_dump_json())
+            for event in events_to_redeliver
+            if event.event_id in successful_event_ids
+        ]
+        if redeliver_messages:
+            try:
+                queue_result = await sqs_client.send_message_batch(redeliver_messages)
+                logger.info(
+                    "Updated events queued for redelivery",
+                    queued=len(queue_result["successful_event_ids"]),
+                    failed=len(queue_result["failed_event_ids"])
+                )
+            except Exception as queue_error:
+                logger.error(
+                    "Failed to queue updated events for redelivery",
+                    event_ids=[event_id for event_id, _ in redeliver_messages],
+                    error=str(queue_error)
+                )
 
-        # Sort results by original index
-        results.sort(key=lambda r: r.index)
+        # Report any slot that never received an outcome (should not happen) as
+        # failed, so every request item has a result and is counted in the summary
+        for idx, result in enumerate(results):
+            if result is None:
+                results[idx] = BatchUpdateItemResult(index=idx, success=False, error=_UNPROCESSED_ITEM_ERROR)
 
         # Calculate summary
-        successful_count = sum(1 for r in results if r.success)
         failed_count = len(results) - successful_count
 
         summary = BatchOperationSummary(
@@ -1106,7 +1345,7 @@ async def batch_update_events(
 
         # Publish batch metrics
         try:
-            metrics_client.put_metric(
+            metrics_client.enqueue_metric(
                 metric_name="BatchUpdateEvents",
                 value=1.0,
                 dimensions={"BatchSize": str(len(batch_items))}
@@ -1114,11 +1353,21 @@ async def batch_update_events(
         except Exception:
             pass
 
+        # Per-item outcomes are reported once here rather than logged per item
+        if forbidden_ids:
+            logger.warning(
+                "Unauthorized batch event update attempts",
+                event_ids=forbidden_ids,
+                requested_by=user_id
+            )
+
         logger.info(
             "Batch update completed",
             total=len(results),
             successful=successful_count,
             failed=failed_count,
+            redelivered_ids=[event_id for event_id, _ in redeliver_messages],
+            not_found_ids=not_found_ids,
             user_id=user_id,
             filter_mode=is_filter_mode
         )
@@ -1133,7 +1382,7 @@ async def batch_update_events(
         logger.warning(
             "Batch update validation failed",
             error=str(e),
-            batch_size=len(getattr(request, 'events', []))
+            batch_size=len(request.events or ())
         )
         raise HTTPException(
             status_code=status_codes.HTTP_400_BAD_REQUEST,
@@ -1145,7 +1394,7 @@ async def batch_update_events(
         logger.error(
             "Critical error in batch update",
             error=str(e),
-            batch_size=len(getattr(request, 'events', []))
+            batch_size=len(request.events or ())
         )
         raise HTTPException(
             status_code=status_codes.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -1219,29 +1468,36 @@ async def batch_delete_events(
         user_id = get_user_id_from_request(http_request)
 
         # Parse query parameters for filter mode
-        query_params = dict(http_request.query_params)
-        filters = parse_filter_params(query_params)
-        has_filters = bool(filters) or 'status' in query_params
+        filters, status_filter = parse_filter_query(http_request.url.query)
+        has_filters = bool(filters) or status_filter is not None
         
-        # Collect event IDs from both filters and request body
-        event_ids_set = set()
+        # Collect event IDs from both filters and request body. A dict is used as an
+        # insertion-ordered set: duplicates collapse to their first occurrence, so each
+        # event is checked and deleted once and result order follows the request
+        event_ids_seen: Dict[str, None] = {}
+        # Events already loaded by list_events (full items: StatusIndex projects ALL)
+        events_by_id: Dict[str, Event] = {}
         
         if has_filters:
             # Filter mode: Get matching events
             logger.info(
                 "Starting filtered batch delete",
                 filters=bool(filters),
-                status_filter=query_params.get('status'),
+                status_filter=status_filter,
                 has_body_event_ids=request.event_ids is not None,
                 user_id=user_id
             )
             
-            # Get matching events (up to 100)
+            # Get matching events owned by this user (up to 100); ownership is
+            # filtered by DynamoDB (no-op when auth is disabled and user_id is None).
+            # The limit counts items read before that filter, so it is not reduced
+            # by the body event_ids; the merged list is capped at 100 below.
             matching_events = await db_client.list_events(
-                status=query_params.get('status'),
+                status=status_filter,
                 limit=100,
                 cursor=None,
-                filters=filters
+                filters=filters,
+                user_id=user_id
             )
             
             logger.info(
@@ -1250,49 +1506,25 @@ async def batch_delete_events(
                 event_ids=[e.event_id for e in matching_events] if matching_events else []
             )
             
-            # Add filtered event IDs to the set, filtering by user_id for ownership
-            for event in matching_events:
-                # Skip events that don't belong to this user (if auth is enabled)
-                if user_id is not None and event.user_id != user_id:
-                    logger.debug(
-                        "Skipping event from different user in filtered batch delete",
-                        event_id=event.event_id,
-                        event_user=event.user_id,
-                        requested_by=user_id
-                    )
-                    continue
-                
-                # Defensive check: skip events with missing critical fields
-                if not event.event_id or not hasattr(event, 'payload'):
-                    logger.warning(
-                        "Skipping malformed event in filtered batch delete",
-                        event_id=getattr(event, 'event_id', 'UNKNOWN'),
-                        has_payload=hasattr(event, 'payload')
-                    )
-                    continue
-                    
-                event_ids_set.add(event.event_id)
-                logger.debug(
-                    "Added event to filtered batch delete",
-                    event_id=event.event_id,
-                    event_type=getattr(event, 'event_type', 'UNKNOWN')
-                )
+            # Add filtered event IDs to the set
+            events_by_id.update((event.event_id, event) for event in matching_events)
+            event_ids_seen.update(dict.fromkeys(events_by_id))
             
             logger.info(
                 "Filtered batch delete found matching events",
-                matched_count=len(event_ids_set)
+                matched_count=len(event_ids_seen)
             )
         
         # Add event IDs from request body if provided (union with filtered results)
         if request.event_ids:
-            event_ids_set.update(request.event_ids)
+            event_ids_seen.update(dict.fromkeys(request.event_ids))
             logger.info(
                 "Combined filter results with body event_ids",
-                total_count=len(event_ids_set)
+                total_count=len(event_ids_seen)
             )
         
         # Check if we have any event IDs to delete
-        if not event_ids_set:
+        if not event_ids_seen:
             if has_filters:
                 # No events matched the filter
                 logger.info("No events matched the filter criteria")
@@ -1312,13 +1544,13 @@ async def batch_delete_events(
                     "(e.g., ?payload.field=value or ?status=pending)"
                 )
         
-        # Convert to list and enforce batch size limit
-        event_ids_list = list(event_ids_set)[:100]  # Cap at 100 events
+        # Take the first 100 ids in insertion order without copying the whole set
+        event_ids_list = list(islice(event_ids_seen, 100))  # Cap at 100 events
         
-        if len(event_ids_set) > 100:
+        if len(event_ids_seen) > 100:
             logger.warning(
                 "Batch delete exceeded 100 events, capping at 100",
-                requested_count=len(event_ids_set)
+                requested_count=len(event_ids_seen)
             )
         
         logger.info(
@@ -1328,24 +1560,35 @@ async def batch_delete_events(
             filter_mode=has_filters
         )
 
-        results: List[BatchDeleteItemResult] = []
+        # Per-item outcomes as (success, message, error) tuples, placed by original
+        # index so no final sort is needed. Response models are built once at the end.
+        outcomes: List[Optional[Tuple[bool, str, Optional[BatchItemError]]]] = [None] * len(event_ids_list)
+        successful_count = 0
+        idempotent_count = 0
 
-        # Batch get existing events from DynamoDB to check ownership
-        existing_events = await db_client.batch_get_events(event_ids_list)
-        events_by_id = {event.event_id: event for event in existing_events}
-        
-        # Check for events that were in list_events but not in batch_get_events (stale index)
-        missing_event_ids = set(event_ids_list) - set(events_by_id.keys())
-        if missing_event_ids:
-            logger.warning(
-                "Events from list_events not found in batch_get_events (stale index or concurrent deletion)",
-                count=len(missing_event_ids),
-                event_ids=list(missing_event_ids),
-                note="These will be treated as idempotent deletes"
-            )
+        # event_id -> original index (event_ids_list is already de-duplicated)
+        id_to_idx: Dict[str, int] = {event_id: idx for idx, event_id in enumerate(event_ids_list)}
+
+        # Batch get, to check ownership, only the events list_events did not already return
+        unloaded_event_ids = [event_id for event_id in event_ids_list if event_id not in events_by_id]
+        if unloaded_event_ids:
+            existing_events = await db_client.batch_get_events(unloaded_event_ids)
+            events_by_id.update((event.event_id, event) for event in existing_events)
+
+            # Requested events that no longer exist
+            missing_event_ids = set(unloaded_event_ids) - events_by_id.keys()
+            if missing_event_ids:
+                logger.warning(
+                    "Requested events not found (already deleted or never existed)",
+                    count=len(missing_event_ids),
+                    event_ids=list(missing_event_ids),
+                    note="These will be treated as idempotent deletes"
+                )
 
-        # Process each deletion in the batch
+        # Process each deletion in the batch. Outcomes are not logged per item;
+        # they are reported once after the loop and in the "Batch delete completed" summary.
         event_ids_to_delete = []
+        forbidden_ids: List[str] = []
 
         for idx, event_id in enumerate(event_ids_list):
             try:
@@ -1353,48 +1596,20 @@ async def batch_delete_events(
                 event = events_by_id.get(event_id)
                 if not event:
                     # Event doesn't exist - idempotent delete (already deleted)
-                    logger.info(
-                        "Delete requested for non-existent event (idempotent)",
-                        event_id=event_id,
-                        index=idx,
-                        requested_by=user_id
-                    )
-                    results.append(BatchDeleteItemResult(
-                        index=idx,
-                        success=True,
-                        event_id=event_id,
-                        message="Event already deleted (idempotent)"
-                    ))
+                    exhausted_replay_cache.discard(event_id)
+                    outcomes[idx] = (True, "Event already deleted (idempotent)", None)
+                    successful_count += 1
+                    idempotent_count += 1
                     continue
 
                 # Verify ownership (only check if auth is enabled and user_id is set)
                 if user_id is not None and event.user_id != user_id:
-                    logger.warning(
-                        "Unauthorized batch event delete attempt",
-                        event_id=event_id,
-                        requested_by=user_id,
-                        event_owner=event.user_id,
-                        index=idx
-                    )
-                    results.append(BatchDeleteItemResult(
-                        index=idx,
-                        success=False,
-                        event_id=event_id,
-                        error=BatchItemError(
-                            code="FORBIDDEN",
-                            message="You can only delete your own events"
-                        )
-                    ))
+                    forbidden_ids.append(event_id)
+                    outcomes[idx] = (False, _FORBIDDEN_DELETE_ERROR.message, _FORBIDDEN_DELETE_ERROR)
                     continue
 
                 # Add to deletion list
                 event_ids_to_delete.append(event_id)
-                logger.info(
-                    "Event marked for batch deletion",
-                    event_id=event_id,
-                    event_type=event.event_type,
-                    index=idx
-                )
 
             except Exception as e:
                 # Unexpected error for this item
@@ -1405,75 +1620,58 @@ async def batch_delete_events(
                     error=str(e)
                 )
 
-                results.append(BatchDeleteItemResult(
-                    index=idx,
-                    success=False,
-                    event_id=event_id,
-                    error=BatchItemError(
-                        code="VALIDATION_ERROR",
-                        message=str(e)
-                    )
-                ))
-
-        # Batch delete events from DynamoDB
-        successful_event_ids = []
-        if event_ids_to_delete:
-            batch_result = await db_client.batch_delete_events(event_ids_to_delete)
-            successful_event_ids = batch_result["successful_event_ids"]
-
-            # Process failed deletions
-            failed_event_ids = batch_result["failed_event_ids"]
-            for failed_event_id in failed_event_ids:
-                # Find original index for this event_id
-                original_idx = None
-                for idx, event_id in enumerate(event_ids_list):
-                    if event_id == failed_event_id:
-                        original_idx = idx
-                        break
-
-                if original_idx is not None:
-                    results.append(BatchDeleteItemResult(
-                        index=original_idx,
-                        success=False,
-                        event_id=failed_event_id,
-                        error=BatchItemError(
-                            code="STORAGE_ERROR",
-                            message="Failed to delete event from database"
-                        )
-                    ))
-
-        # Build final results for successful deletions
-        for event_id in event_ids_to_delete:
-            if event_id in successful_event_ids:
-                # Find original index for this event_id
-                original_idx = None
-                for idx, req_event_id in enumerate(event_ids_list):
-                    if req_event_id == event_id:
-                        original_idx = idx
-                        break
-
-                if original_idx is not None:
-                    results.append(BatchDeleteItemResult(
-                        index=original_idx,
-                        success=True,
-                        event_id=event_id,
-                        message="Event deleted"
-                    ))
+                outcomes[idx] = (
+                    False,
+                    str(e),
+                    BatchItemError(code="VALIDATION_ERROR", message=str(e))
+                )
 
-                    logger.info(
-                        "Event deleted successfully in batch",
-                        event_id=event_id,
-                        index=original_idx
-                    )
+        if forbidden_ids:
+            logger.warning(
+                "Unauthorized batch event delete attempts",
+                event_ids=forbidden_ids,
+                requested_by=user_id
+            )
 
-        # Sort results by original index
-        results.sort(key=lambda r: r.index)
+        # Batch delete events from DynamoDB and record per-item outcomes in a single pass.
+        # When nothing was queued every slot was already filled during validation
+        # (idempotent, forbidden or invalid), so the delete and reconciliation are skipped.
+        if event_ids_to_delete:
+            batch_result = await db_client.batch_delete_events(
+                event_ids_to_delete,
+                events=[events_by_id[event_id] for event_id in event_ids_to_delete]
+            )
+            successful_set = set(batch_result["successful_event_ids"])
+            failed_set = set(batch_result["failed_event_ids"])
+
+            for event_id in event_ids_to_delete:
+                original_idx = id_to_idx[event_id]
+
+                if event_id in successful_set:
+                    # A replay of the deleted event must now get a 404, not a cached 400
+                    exhausted_replay_cache.discard(event_id)
+                    outcomes[original_idx] = (True, "Event deleted", None)
+                    successful_count += 1
+                elif event_id in failed_set:
+                    outcomes[original_idx] = (False, _STORAGE_DELETE_ERROR.message, _STORAGE_DELETE_ERROR)
+
+        # Build response models once; every field was produced by this handler, so
+        # validation is skipped. Slots that never received an outcome (should not
+        # happen) are reported as failed.
+        unprocessed = (False, _UNPROCESSED_ITEM_ERROR.message, _UNPROCESSED_ITEM_ERROR)
+        results = [
+            BatchDeleteItemResult.model_construct(
+                index=idx,
+                success=outcome[0],
+                event_id=event_ids_list[idx],
+                message=outcome[1],
+                error=outcome[2]
+            )
+            for idx, outcome in enumerate(outcome or unprocessed for outcome in outcomes)
+        ]
 
-        # Calculate summary
-        successful_count = sum(1 for r in results if r.success)
+        # Calculate summary (successes were tallied as results were emitted)
         failed_count = len(results) - successful_count
-        # Count idempotent deletions (events that were already deleted)
-        idempotent_count = sum(1 for r in results if r.success and r.message == "Event already deleted (idempotent)")
 
         summary = BatchOperationSummary(
             total=len(results),
@@ -1484,7 +1682,7 @@ async def batch_delete_events(
 
         # Publish batch metrics
         try:
-            metrics_client.put_metric(
+            metrics_client.enqueue_metric(
                 metric_name="BatchDeleteEvents",
                 value=1.0,
                 dimensions={"BatchSize": str(len(event_ids_list))}
@@ -1498,6 +1696,7 @@ async def batch_delete_events(
             successful=successful_count,
             idempotent=idempotent_count,
             failed=failed_count,
+            event_ids_marked=len(event_ids_to_delete),
             user_id=user_id,
             filter_mode=has_filters
         )
@@ -1512,7 +1711,7 @@ async def batch_delete_events(
         logger.warning(
             "Batch delete validation failed",
             error=str(e),
-            batch_size=len(getattr(request, 'event_ids', []))
+            batch_size=len(request.event_ids or ())
         )
         raise HTTPException(
             status_code=status_codes.HTTP_400_BAD_REQUEST,
@@ -1524,7 +1723,7 @@ async def batch_delete_events(
         logger.error(
             "Critical error in batch delete",
             error=str(e),
-            batch_size=len(getattr(request, 'event_ids', []))
+            batch_size=len(request.event_ids or ())
         )
         raise HTTPException(
             status_code=status_codes.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -1581,19 +1780,7 @@ async def get_event(
             detail=f"Event {event_id} not found"
         )
 
-    return EventResponse(
-        event_id=event.event_id,
-        event_type=event.event_type,
-        payload=event.payload,
-        metadata=event.metadata,
-        status=event.status,
-        created_at=event.created_at,
-        delivered_at=event.delivered_at,
-        delivery_attempts=event.delivery_attempts,
-        user_id=event.user_id,
-        idempotency_key=event.idempotency_key,
-        message="Event retrieved successfully"
-    )
+    return EventResponse.from_event(event, message="Event retrieved successfully")
 
 
 @router.post("/list", response_model=List[EventResponse])
@@ -1651,19 +1838,7 @@ async def get_events_by_list(
         
         # Convert Event objects to EventResponse objects
         response_events = [
-            EventResponse(
-                event_id=event.event_id,
-                event_type=event.event_type,
-                payload=event.payload,
-                metadata=event.metadata,
-                status=event.status,
-                created_at=event.created_at,
-                delivered_at=event.delivered_at,
-                delivery_attempts=event.delivery_attempts,
-                user_id=event.user_id,
-                idempotency_key=event.idempotency_key,
-                message="Event retrieved successfully"
-            )
+            EventResponse.from_event(event, message="Event retrieved successfully")
             for event in events
         ]
         
@@ -1686,6 +1861,7 @@ async def get_events_by_list(
 @router.get("", response_model=List[EventResponse])
 async def list_events(
     request: Request,
+    response: Response,
     status: Optional[str] = None,
     limit: int = 50,
     cursor: Optional[str] = None,
@@ -1697,26 +1873,33 @@ async def list_events(
     Returns a paginated list of events with support for complex filtering by
     payload fields, metadata, dates, and various comparison operators.
 
+    Pagination is keyset-based: when more events are available, the opaque
+    cursor for the next page is returned in the X-Next-Cursor response
+    header. Pass it back as ?cursor= with the same filters to continue.
+
     Supports filtering operators: eq (default), gt, gte, lt, lte, ne, contains, startswith
     Special date filters: created_after, created_before, delivered_after, delivered_before
 
     Args:
         request: FastAPI Request object for accessing all query parameters
+        response: FastAPI Response used to set the X-Next-Cursor header
         status: Optional status filter (pending, delivered, failed, replayed)
         limit: Maximum number of events to return (default 50, max 100)
-        cursor: Pagination cursor from previous response (not supported with custom filters)
+        cursor: Pagination cursor from a previous response's X-Next-Cursor header
         db_client: DynamoDB client (injected via dependency)
 
     Returns:
         List of EventResponse objects
 
     Raises:
-        HTTPException: 400 if invalid parameters
+        HTTPException: 400 if invalid parameters or cursor
         HTTPException: 500 if database error
 
     Examples:
         GET /events?status=pending&limit=10
 
+        GET /events?status=pending&limit=10&cursor=eyJldmVudF9pZCI6...
+
         GET /events?payload.order_id=12345
 
         GET /events?metadata.source=ecommerce&payload.amount[gte]=100
@@ -1740,17 +1923,21 @@ async def list_events(
             detail="Limit cannot exceed 100"
         )
 
-    # Parse filter parameters from query string
-    query_params = dict(request.query_params)
-    filters = parse_filter_params(query_params)
+    # Parse filter parameters from query string (status is bound above)
+    filters, _ = parse_filter_query(request.url.query)
 
     try:
-        events = await db_client.list_events(
+        events, next_cursor = await db_client.list_events_page(
             status=status,
             limit=limit,
             cursor=cursor,
             filters=filters
         )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status_codes.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         logger.error("Database error listing events", error=str(e), filters=bool(filters))
         raise HTTPException(
@@ -1758,20 +1945,11 @@ async def list_events(
             detail="Failed to list events"
         )
 
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+
     return [
-        EventResponse(
-            event_id=event.event_id,
-            event_type=event.event_type,
-            payload=event.payload,
-            metadata=event.metadata,
-            status=event.status,
-            created_at=event.created_at,
-            delivered_at=event.delivered_at,
-            delivery_attempts=event.delivery_attempts,
-            user_id=event.user_id,
-            idempotency_key=event.idempotency_key,
-            message="Event retrieved successfully"
-        )
+        EventResponse.from_event(event, message="Event retrieved successfully")
         for event in events
     ]
 
@@ -1839,30 +2017,9 @@ async def update_event(
         # Get user_id from authorizer context
         user_id = get_user_id_from_request(http_request)
 
-        # Fetch existing event
-        event = await db_client.get_event(event_id)
-        if not event:
-            raise HTTPException(
-                status_code=status_codes.HTTP_404_NOT_FOUND,
-                detail=f"Event {event_id} not found"
-            )
-
-        # Verify ownership (only check if auth is enabled and user_id is set)
-        if user_id is not None and event.user_id != user_id:
-            logger.warning(
-                "Unauthorized event update attempt",
-                event_id=event_id,
-                requested_by=user_id,
-                event_owner=event.user_id
-            )
-            raise HTTPException(
-                status_code=status_codes.HTTP_403_FORBIDDEN,
-                detail="You can only update your own events"
-            )
-
         # Check which fields were explicitly provided in the request
         # This allows us to distinguish between "not provided" and "explicitly set to None"
-        provided_fields = request.model_dump(exclude_unset=True)
+        provided_fields = request.model_fields_set
         
         # Validate that at least one field was provided
         if not provided_fields:
@@ -1871,11 +2028,12 @@ async def update_event(
                 detail="At least one of payload, metadata, or idempotency_key must be provided"
             )
 
-        # Update the provided fields
+        # Collect the provided fields
+        updates: Dict[str, Any] = {}
         updated_fields = []
         if 'payload' in provided_fields:
             if request.payload is not None:
-                event.payload = request.payload
+                updates['payload'] = request.payload
                 updated_fields.append("payload")
             else:
                 raise HTTPException(
@@ -1885,17 +2043,43 @@ async def update_event(
         
         if 'metadata' in provided_fields:
             # metadata can be set to None to remove it
-            event.metadata = request.metadata
+            updates['metadata'] = request.metadata
             updated_fields.append("metadata")
         
         if 'idempotency_key' in provided_fields:
             # idempotency_key can be set to None to remove it
-            event.idempotency_key = request.idempotency_key
+            updates['idempotency_key'] = request.idempotency_key
             if request.idempotency_key is None:
                 updated_fields.append("idempotency_key (removed)")
             else:
                 updated_fields.append("idempotency_key")
 
+        # Write the fields with one UpdateItem conditioned on the event existing and
+        # belonging to the caller; no read beforehand. A failed condition returns the
+        # stored item when the event exists, which tells 403 apart from 404.
+        try:
+            event = await db_client.update_event_attributes(
+                event_id, updates, expected_user_id=user_id
+            )
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                raise
+            if 'Item' not in e.response:
+                raise HTTPException(
+                    status_code=status_codes.HTTP_404_NOT_FOUND,
+                    detail=f"Event {event_id} not found"
+                )
+            logger.warning(
+                "Unauthorized event update attempt",
+                event_id=event_id,
+                requested_by=user_id,
+                event_owner=e.response['Item'].get('user_id')
+            )
+            raise HTTPException(
+                status_code=status_codes.HTTP_403_FORBIDDEN,
+                detail="You can only update your own events"
+            )
+
         # Smart status handling for redelivery
         previous_status = event.status
         should_redeliver = event.status in ["delivered", "replayed"]
@@ -1903,6 +2087,9 @@ async def update_event(
             # Reset to pending for redelivery
             event.status = "pending"
             event.delivered_at = None
+            await db_client.update_event_fields(
+                event, ["status", "delivered_at"], expected_user_id=user_id
+            )
 
             logger.info(
                 "Event updated and reset for redelivery",
@@ -1915,7 +2102,7 @@ async def update_event(
             try:
                 await sqs_client.send_message(
                     event_id=event_id,
-                    event_data=event.model_dump(mode='json')
+                    event_data=event.model_dump_json()
                 )
                 logger.info("Updated event queued for redelivery", event_id=event_id)
             except Exception as queue_error:
@@ -1933,28 +2120,13 @@ async def update_event(
                 updated_fields=updated_fields
             )
 
-        # Save updated event
-        await db_client.update_event(event)
-
         message = "Event updated"
         if should_redeliver:
             message += " and queued for redelivery"
         else:
             message += " successfully"
 
-        return EventResponse(
-            event_id=event.event_id,
-            event_type=event.event_type,
-            payload=event.payload,
-            metadata=event.metadata,
-            status=event.status,
-            created_at=event.created_at,
-            delivered_at=event.delivered_at,
-            delivery_attempts=event.delivery_attempts,
-            user_id=event.user_id,
-            idempotency_key=event.idempotency_key,
-            message=message
-        )
+        return EventResponse.from_event(event, message=message)
 
     except HTTPException:
         raise
@@ -2004,32 +2176,34 @@ async def delete_event(
         # Get user_id from authorizer context
         user_id = get_user_id_from_request(http_request)
 
-        # Fetch existing event
-        event = await db_client.get_event(event_id)
-        if not event:
-            # Event doesn't exist - idempotent delete (already deleted)
-            logger.info(
-                "Delete requested for non-existent event (idempotent)",
-                event_id=event_id,
-                requested_by=user_id
-            )
-            return Response(status_code=status_codes.HTTP_204_NO_CONTENT)
-
-        # Verify ownership (only check if auth is enabled and user_id is set)
-        if user_id is not None and event.user_id != user_id:
+        # Delete in one conditional DeleteItem: it succeeds if the event is the
+        # caller's or already gone, and returns the deleted item if there was one
+        try:
+            event = await db_client.delete_event(event_id, expected_user_id=user_id)
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                raise
             logger.warning(
                 "Unauthorized event delete attempt",
                 event_id=event_id,
-                requested_by=user_id,
-                event_owner=event.user_id
+                requested_by=user_id
             )
             raise HTTPException(
                 status_code=status_codes.HTTP_403_FORBIDDEN,
                 detail="You can only delete your own events"
             )
 
-        # Delete the event
-        await db_client.delete_event(event_id)
+        # A replay of the deleted event must now get a 404, not a cached 400
+        exhausted_replay_cache.discard(event_id)
+
+        if not event:
+            # Event doesn't exist - idempotent delete (already deleted)
+            logger.info(
+                "Delete requested for non-existent event (idempotent)",
+                event_id=event_id,
+                requested_by=user_id
+            )
+            return Response(status_code=status_codes.HTTP_204_NO_CONTENT)
 
         logger.info(
             "Event deleted successfully",
@@ -2081,20 +2255,21 @@ async def acknowledge_event(
         Response (204): No Content
     """
     try:
-        # Get event
-        event = await db_client.get_event(event_id)
-        if not event:
+        # Mark delivered with one conditional UpdateItem (no read first); the
+        # updated event comes back for the metric dimensions
+        try:
+            event = await db_client.update_event_attributes(
+                event_id,
+                {"status": "delivered", "delivered_at": datetime.now(timezone.utc)}
+            )
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                raise
             raise HTTPException(
                 status_code=status_codes.HTTP_404_NOT_FOUND,
                 detail=f"Event {event_id} not found"
             )
 
-        # Update status
-        event.status = "delivered"
-        event.delivered_at = datetime.now(timezone.utc)
-
-        await db_client.update_event(event)
-
         logger.info(
             "Event acknowledged",
             event_id=event_id,
@@ -2103,7 +2278,7 @@ async def acknowledge_event(
 
         # Publish metrics
         try:
-            metrics_client.put_metric(
+            metrics_client.enqueue_metric(
                 metric_name="EventDelivered",
                 value=1.0,
                 dimensions={"EventType": event.event_type}
@@ -2177,80 +2352,60 @@ async def batch_replay_events(
         user_id = get_user_id_from_request(http_request)
         
         # Parse query parameters for filter mode
-        query_params = dict(http_request.query_params)
-        filters = parse_filter_params(query_params)
-        has_filters = bool(filters) or 'status' in query_params
+        filters, status_filter = parse_filter_query(http_request.url.query)
+        has_filters = bool(filters) or status_filter is not None
         
-        # Collect event IDs from both filters and request body
-        event_ids_set = set()
+        # Collect event IDs from both filters and request body, deduplicated in
+        # insertion order (filter matches first) so capping is deterministic
+        event_ids_seen: Dict[str, None] = {}
+        listed_events: Dict[str, Event] = {}
         
         if has_filters:
             # Filter mode: Get matching events
             logger.info(
                 "Starting filtered batch replay",
                 filters=bool(filters),
-                status_filter=query_params.get('status'),
+                status_filter=status_filter,
                 has_body_event_ids=request.event_ids is not None,
                 user_id=user_id
             )
             
-            # Get matching events (up to 100)
+            # Get matching events (up to 100). Other users' events and events at the
+            # replay limit are dropped by DynamoDB, so every listed event is replayable
+            # and the listed records are used as-is (no second read below)
             matching_events = await db_client.list_events(
-                status=query_params.get('status'),
+                status=status_filter,
                 limit=100,
                 cursor=None,
-                filters=filters
+                filters=filters,
+                user_id=user_id,
+                max_delivery_attempts=MAX_REPLAY_ATTEMPTS
             )
             
             logger.info(
                 "list_events returned results for filtered batch replay",
-                count=len(matching_events),
-                event_ids=[e.event_id for e in matching_events] if matching_events else []
+                count=len(matching_events)
             )
             
-            # Add filtered event IDs to the set, filtering by user_id for ownership
             for event in matching_events:
-                # Skip events that don't belong to this user (if auth is enabled)
-                if user_id is not None and event.user_id != user_id:
-                    logger.debug(
-                        "Skipping event from different user in filtered batch replay",
-                        event_id=event.event_id,
-                        event_user=event.user_id,
-                        requested_by=user_id
-                    )
-                    continue
-                
-                # Defensive check: skip events with missing critical fields
-                if not event.event_id or not hasattr(event, 'payload'):
-                    logger.warning(
-                        "Skipping malformed event in filtered batch replay",
-                        event_id=getattr(event, 'event_id', 'UNKNOWN'),
-                        has_payload=hasattr(event, 'payload')
-                    )
-                    continue
-                    
-                event_ids_set.add(event.event_id)
-                logger.debug(
-                    "Added event to filtered batch replay",
-                    event_id=event.event_id,
-                    event_type=getattr(event, 'event_type', 'UNKNOWN')
-                )
+                listed_events[event.event_id] = event
+                event_ids_seen[event.event_id] = None
             
             logger.info(
                 "Filtered batch replay found matching events",
-                matched_count=len(event_ids_set)
+                matched_count=len(event_ids_seen)
             )
         
         # Add event IDs from request body if provided (union with filtered results)
         if request.event_ids:
-            event_ids_set.update(request.event_ids)
+            event_ids_seen.update(dict.fromkeys(request.event_ids))
             logger.info(
                 "Combined filter results with body event_ids",
-                total_count=len(event_ids_set)
+                total_count=len(event_ids_seen)
             )
         
         # Check if we have any event IDs to replay
-        if not event_ids_set:
+        if not event_ids_seen:
             if has_filters:
                 # No events matched the filter
                 logger.info("No events matched the filter criteria for replay")
@@ -2270,13 +2425,13 @@ async def batch_replay_events(
                     detail="Either provide event_ids or use query parameters to filter events"
                 )
         
-        # Convert to list and cap at 100
-        event_ids = list(event_ids_set)[:100]
+        # Take the first 100 ids in insertion order without copying the whole set
+        event_ids = list(islice(event_ids_seen, 100))
         
-        if len(event_ids_set) > 100:
+        if len(event_ids_seen) > 100:
             logger.warning(
                 "Batch replay size exceeded 100, capped",
-                requested=len(event_ids_set),
+                requested=len(event_ids_seen),
                 processed=100
             )
         
@@ -2286,72 +2441,87 @@ async def batch_replay_events(
             user_id=user_id
         )
         
-        results: List[BatchReplayItemResult] = []
+        # Results are placed by original index as outcomes become known
+        results: List[Optional[BatchReplayItemResult]] = [None] * len(event_ids)
         
-        # Batch get existing events from DynamoDB
-        existing_events = await db_client.batch_get_events(event_ids)
-        events_by_id = {event.event_id: event for event in existing_events}
+        # Events found by the filter were already read; fetch only body-supplied ids
+        events_by_id = {
+            event_id: listed_events[event_id]
+            for event_id in event_ids
+            if event_id in listed_events
+        }
+        missing_ids = [event_id for event_id in event_ids if event_id not in events_by_id]
+        if missing_ids:
+            existing_events = await db_client.batch_get_events(missing_ids)
+            events_by_id.update((event.event_id, event) for event in existing_events)
         
-        # Process each replay in the batch
+        # Validate each replay in the batch; eligible events are replayed below.
+        # The whole batch is replayed at once, so one timestamp covers it.
         successful = 0
         failed = 0
+        events_to_replay: List[Tuple[int, Event]] = []
+        replayed_at = datetime.now(timezone.utc).isoformat()
+        
+        def replay_failed(idx: int, event_id: str, reason: str) -> BatchReplayItemResult:
+            """Build the failed result for an event whose replay could not complete."""
+            return BatchReplayItemResult.model_construct(
+                index=idx,
+                success=False,
+                event_id=event_id,
+                status="failed",
+                message=f"Replay failed: {reason}",
+                error=BatchItemError.model_construct(
+                    code="REPLAY_FAILED",
+                    message=reason
+                )
+            )
         
         for idx, event_id in enumerate(event_ids):
             try:
                 # Check if event exists
                 event = events_by_id.get(event_id)
                 if not event:
-                    results.append(BatchReplayItemResult(
+                    results[idx] = BatchReplayItemResult.model_construct(
                         index=idx,
                         success=False,
                         event_id=event_id,
                         status="failed",
-                        message="Event not found",
-                        error=BatchItemError(
-                            code="NOT_FOUND",
-                            message="Event not found"
-                        )
-                    ))
+                        message=_NOT_FOUND_REPLAY_ERROR.message,
+                        error=_NOT_FOUND_REPLAY_ERROR
+                    )
                     failed += 1
                     continue
                 
                 # Check ownership
                 if user_id is not None and event.user_id != user_id:
-                    results.append(BatchReplayItemResult(
+                    results[idx] = BatchReplayItemResult.model_construct(
                         index=idx,
                         success=False,
                         event_id=event_id,
                         status="failed",
-                        message="You can only replay your own events",
-                        error=BatchItemError(
-                            code="FORBIDDEN",
-                            message="You can only replay your own events"
-                        )
-                    ))
+                        message=_FORBIDDEN_REPLAY_ERROR.message,
+                        error=_FORBIDDEN_REPLAY_ERROR
+                    )
                     failed += 1
                     continue
                 
                 # Check replay limits
-                if event.delivery_attempts >= 10:
-                    results.append(BatchReplayItemResult(
+                if event.delivery_attempts >= MAX_REPLAY_ATTEMPTS:
+                    results[idx] = BatchReplayItemResult.model_construct(
                         index=idx,
                         success=False,
                         event_id=event_id,
                         status="failed",
-                        message="Event has exceeded maximum replay attempts (10)",
-                        error=BatchItemError(
-                            code="MAX_ATTEMPTS_EXCEEDED",
-                            message="Event has exceeded maximum replay attempts (10)"
-                        )
-                    ))
+                        message=_MAX_ATTEMPTS_REPLAY_ERROR.message,
+                        error=_MAX_ATTEMPTS_REPLAY_ERROR
+                    )
                     failed += 1
                     continue
                 
                 # Add replay metadata
                 replay_metadata = {
-                    'is_replay': True,
-                    'replayed_at': datetime.now(timezone.utc).isoformat(),
-                    'replay_reason': 'batch_replay',
+                    **_BATCH_REPLAY_METADATA,
+                    'replayed_at': replayed_at,
                     'original_created_at': event.created_at.isoformat(),
                     'original_status': event.status
                 }
@@ -2362,43 +2532,7 @@ async def batch_replay_events(
                 else:
                     event.metadata = replay_metadata
                 
-                # Attempt immediate delivery
-                delivery_success = await delivery_client.deliver_event(event)
-                
-                if delivery_success:
-                    # Update replay status
-                    event.status = "replayed"
-                    event.delivery_attempts += 1
-                    event.delivered_at = datetime.now(timezone.utc)
-                    await db_client.update_event(event)
-                    
-                    results.append(BatchReplayItemResult(
-                        index=idx,
-                        success=True,
-                        event_id=event_id,
-                        status="replayed",
-                        message="Event replayed successfully"
-                    ))
-                    successful += 1
-                else:
-                    # Queue for retry
-                    event.status = "pending"
-                    event.delivery_attempts += 1
-                    await db_client.update_event(event)
-                    
-                    await sqs_client.send_message(
-                        event_id=event_id,
-                        event_data=event.model_dump(mode='json')
-                    )
-                    
-                    results.append(BatchReplayItemResult(
-                        index=idx,
-                        success=True,
-                        event_id=event_id,
-                        status="pending",
-                        message="Event replay queued for retry"
-                    ))
-                    successful += 1
+                events_to_replay.append((idx, event))
                     
             except Exception as e:
                 logger.error(
@@ -2407,17 +2541,120 @@ async def batch_replay_events(
                     index=idx,
                     error=str(e)
                 )
-                results.append(BatchReplayItemResult(
+                results[idx] = replay_failed(idx, event_id, str(e))
+                failed += 1
+        
+        # Push eligible events concurrently, bounded like batch create deliveries so
+        # a large batch does not open one webhook connection per event at once
+        replay_semaphore = asyncio.Semaphore(settings.delivery_concurrency)
+        
+        async def deliver(event: Event) -> bool:
+            """Push one replayed event. Returns True if delivered."""
+            async with replay_semaphore:
+                return await delivery_client.deliver_event(event)
+        
+        delivery_outcomes = await asyncio.gather(
+            *(deliver(event) for _, event in events_to_replay),
+            return_exceptions=True
+        )
+        
+        # All deliveries have completed by now, so one timestamp covers them
+        delivered_at = datetime.now(timezone.utc)
+        events_to_store: List[Event] = []
+        index_map: Dict[str, int] = {}  # event_id -> original index
+        for (idx, event), outcome in zip(events_to_replay, delivery_outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(
+                    "Failed to replay event in batch",
+                    event_id=event.event_id,
+                    index=idx,
+                    error=str(outcome)
+                )
+                results[idx] = replay_failed(idx, event.event_id, str(outcome))
+                failed += 1
+                continue
+            
+            if outcome:
+                event.status = "replayed"
+                event.delivered_at = delivered_at
+            else:
+                # Queued for retry once stored
+                event.status = "pending"
+            event.delivery_attempts += 1
+            events_to_store.append(event)
+            index_map[event.event_id] = idx
+        
+        # Store the new replay state with BatchWriteItem (25 per request, unprocessed
+        # items retried) instead of one PutItem per event; like update_event(), each
+        # write replaces the whole item
+        stored_events: List[Event] = []
+        if events_to_store:
+            write_result = await db_client.batch_update_events(events_to_store)
+            for failed_item in write_result["failed_items"]:
+                idx = index_map[failed_item["event_id"]]
+                results[idx] = replay_failed(idx, failed_item["event_id"], failed_item["reason"])
+                failed += 1
+            stored_ids = set(write_result["successful_event_ids"])
+            stored_events = [event for event in events_to_store if event.event_id in stored_ids]
+        
+        # Queue stored, undelivered events for retry with SendMessageBatch (10 per call)
+        events_to_queue = [event for event in stored_events if event.status == "pending"]
+        queue_failures: Dict[str, str] = {}
+        if events_to_queue:
+            try:
+                queue_result = await sqs_client.send_message_batch([
+                    (event.event_id, event.model_dump_json())
+                    for event in events_to_queue
+                ])
+                queue_failures = dict.fromkeys(
+                    queue_result["failed_event_ids"], "Failed to queue event for retry"
+                )
+            except Exception as queue_error:
+                logger.error(
+                    "Failed to queue replayed events for retry",
+                    event_ids=[event.event_id for event in events_to_queue],
+                    error=str(queue_error)
+                )
+                queue_failures = dict.fromkeys(
+                    (event.event_id for event in events_to_queue), str(queue_error)
+                )
+        
+        for event in stored_events:
+            idx = index_map[event.event_id]
+            if event.event_id in queue_failures:
+                results[idx] = replay_failed(idx, event.event_id, queue_failures[event.event_id])
+                failed += 1
+            elif event.status == "replayed":
+                results[idx] = BatchReplayItemResult.model_construct(
+                    index=idx,
+                    success=True,
+                    event_id=event.event_id,
+                    status="replayed",
+                    message="Event replayed successfully"
+                )
+                successful += 1
+            else:
+                results[idx] = BatchReplayItemResult.model_construct(
+                    index=idx,
+                    success=True,
+                    event_id=event.event_id,
+                    status="pending",
+                    message="Event replay queued for retry"
+                )
+                successful += 1
+        
+        # Report any slot that never received an outcome (should not happen) as
+        # failed, so every requested event has a result and is counted in the summary
+        for idx, result in enumerate(results):
+            if result is None:
+                results[idx] = BatchReplayItemResult.model_construct(
                     index=idx,
                     success=False,
-                    event_id=event_id,
+                    event_id=event_ids[idx],
                     status="failed",
-                    message=f"Replay failed: {str(e)}",
-                    error=BatchItemError(
-                        code="REPLAY_FAILED",
-                        message=str(e)
-                    )
-                ))
+                    message=f"Replay failed: {_UNPROCESSED_ITEM_ERROR.message}",
+                    error=_UNPROCESSED_ITEM_ERROR
+                )
                 failed += 1
         
         logger.info(
@@ -2479,43 +2716,45 @@ async def replay_event(
         HTTPException: 500 if replay fails
     """
     try:
-        # Retrieve original event
-        event = await db_client.get_event(event_id)
-        
-        if not event:
+        if event_id in exhausted_replay_cache:
             raise HTTPException(
-                status_code=status_codes.HTTP_404_NOT_FOUND,
-                detail=f"Event {event_id} not found"
+                status_code=status_codes.HTTP_400_BAD_REQUEST,
+                detail=_MAX_ATTEMPTS_REPLAY_ERROR.message
             )
         
-        # Check if event is replayable (max 10 attempts)
-        if event.delivery_attempts >= 10:
+        # Count this replay attempt and fetch the event in one conditional
+        # UpdateItem; concurrent replays cannot both slip under the limit. A failed
+        # condition returns the stored item when the event exists (limit reached).
+        try:
+            event = await db_client.claim_replay(event_id, MAX_REPLAY_ATTEMPTS)
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                raise
+            if 'Item' not in e.response:
+                raise HTTPException(
+                    status_code=status_codes.HTTP_404_NOT_FOUND,
+                    detail=f"Event {event_id} not found"
+                )
+            exhausted_replay_cache.add(event_id)
             raise HTTPException(
                 status_code=status_codes.HTTP_400_BAD_REQUEST,
-                detail="Event has exceeded maximum replay attempts (10)"
+                detail=_MAX_ATTEMPTS_REPLAY_ERROR.message
             )
         
         # Use defaults if no request body provided
         if request is None:
             request = ReplayEventRequest()
         
-        # Add replay metadata
-        replay_metadata = {
-            'is_replay': True,
-            'replayed_at': datetime.now(timezone.utc).isoformat(),
-            'replay_reason': request.reason,
-            'original_created_at': event.created_at.isoformat(),
-            'original_status': event.status
-        }
-        
+        # Add replay metadata, written directly into the existing metadata dict
+        metadata = event.metadata if event.metadata else {}
+        metadata['is_replay'] = True
+        metadata['replayed_at'] = datetime.now(timezone.utc).isoformat()
+        metadata['replay_reason'] = request.reason
+        metadata['original_created_at'] = event.created_at.isoformat()
+        metadata['original_status'] = event.status
         if request.workflow_id:
-            replay_metadata['target_workflow_id'] = request.workflow_id
-        
-        # Merge with existing metadata
-        if event.metadata:
-            event.metadata.update(replay_metadata)
-        else:
-            event.metadata = replay_metadata
+            metadata['target_workflow_id'] = request.workflow_id
+        event.metadata = metadata
         
         logger.info(
             "Attempting event replay",
@@ -2528,12 +2767,13 @@ async def replay_event(
         # Attempt immediate delivery
         delivery_success = await delivery_client.deliver_event(event)
         
+        # delivery_attempts was already incremented by the claim, so only the
+        # outcome fields are written back
         if delivery_success:
             # Update replay status
             event.status = "replayed"
-            event.delivery_attempts += 1
             event.delivered_at = datetime.now(timezone.utc)
-            await db_client.update_event(event)
+            await db_client.update_event_fields(event, ["status", "delivered_at", "metadata"])
             
             logger.info(
                 "Event replayed successfully",
@@ -2543,7 +2783,8 @@ async def replay_event(
                 delivery_attempts=event.delivery_attempts
             )
             
-            return ReplayResponse(
+            # Every field comes from the stored event, so skip re-validation
+            return ReplayResponse.model_construct(
                 event_id=event.event_id,
                 status="replayed",
                 created_at=event.created_at,
@@ -2554,12 +2795,16 @@ async def replay_event(
         else:
             # Queue for retry
             event.status = "pending"
-            event.delivery_attempts += 1
-            await db_client.update_event(event)
             
-            await sqs_client.send_message(
+            # Store the new state before queueing the retry: the delivery worker
+            # reloads the event from DynamoDB, so the queued retry must find the
+            # replayed state there. A failed store fails the replay.
+            await db_client.update_event_fields(event, ["status", "metadata"])
+            
+            # Coalesced with concurrent replays into SendMessageBatch calls
+            await sqs_client.batcher.send(
                 event_id=event_id,
-                event_data=event.model_dump(mode='json')
+                event_data=event.model_dump_json()
             )
             
             logger.info(
@@ -2569,7 +2814,7 @@ async def replay_event(
                 delivery_attempts=event.delivery_attempts
             )
             
-            return ReplayResponse(
+            return ReplayResponse.model_construct(
                 event_id=event.event_id,
                 status="pending",
                 created_at=event.created_at,
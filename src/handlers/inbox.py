@@ -10,10 +10,11 @@ Key Components:
 - get_db_client(): Dependency injection for DynamoDB client
 - Event filtering by status and sorting by creation time
 
-Dependencies: FastAPI, typing, models, storage, config, utils
+Dependencies: FastAPI, functools, typing, models, storage, config, utils
 Author: Triggers API Team
 """
 
+from functools import lru_cache
 from typing import List
 from fastapi import APIRouter, HTTPException, Depends
 from fastapi import status as status_codes
@@ -28,17 +29,24 @@ router = APIRouter(prefix="/inbox", tags=["inbox"])
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _cached_db_client(table_name: str) -> DynamoDBClient:
+    """Build the DynamoDBClient for a table once and reuse it."""
+    return DynamoDBClient(table_name=table_name)
+
+
 def get_db_client() -> DynamoDBClient:
-    """Dependency to get DynamoDB client."""
-    return DynamoDBClient(table_name=settings.events_table_name)
+    """Dependency to get the shared DynamoDB client."""
+    return _cached_db_client(settings.events_table_name)
 
 
+@lru_cache(maxsize=1)
 def get_metrics_client() -> MetricsClient:
     """
     Dependency to get CloudWatch metrics client.
 
-    Creates and returns a configured MetricsClient instance
-    for publishing custom metrics.
+    Returns the shared MetricsClient instance for publishing custom
+    metrics, creating it on first use.
     """
     return MetricsClient()
 
@@ -101,7 +109,7 @@ async def get_inbox(
 
         # Publish metrics
         try:
-            metrics_client.put_metric(
+            metrics_client.enqueue_metric(
                 metric_name="InboxDepth",
                 value=float(len(pending_events))
             )
@@ -110,19 +118,7 @@ async def get_inbox(
             pass
 
         return [
-            EventResponse(
-                event_id=event.event_id,
-                event_type=event.event_type,
-                payload=event.payload,
-                metadata=event.metadata,
-                status=event.status,
-                created_at=event.created_at,
-                delivered_at=event.delivered_at,
-                delivery_attempts=event.delivery_attempts,
-                user_id=event.user_id,
-                idempotency_key=event.idempotency_key,
-                message="Event retrieved successfully"
-            )
+            EventResponse.from_event(event, message="Event retrieved successfully")
             for event in pending_events
         ]
 
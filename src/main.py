@@ -6,14 +6,28 @@ Initializes the FastAPI application with all routes, middleware,
 and error handlers for the Triggers API.
 """
 
+import asyncio
+
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from mangum import Mangum
 
-from handlers.events import router as events_router, replay_router
+from handlers.events import (
+    router as events_router,
+    replay_router,
+    get_delivery_client,
+    get_sqs_client,
+    get_metrics_client
+)
 from handlers.inbox import router as inbox_router
 from config.settings import settings
 from utils.logger import get_logger
+from utils.responses import SafeORJSONResponse
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is optional
+    uvloop = None
 
 logger = get_logger(__name__)
 
@@ -23,7 +37,10 @@ app = FastAPI(
     description="Event ingestion and delivery API for real-time automation",
     version=settings.app_version,
     docs_url="/docs",  # Swagger UI
-    redoc_url="/redoc"  # ReDoc
+    redoc_url="/redoc",  # ReDoc
+    # orjson renders response bodies faster than stdlib json (with a stdlib
+    # fallback for integers orjson cannot encode)
+    default_response_class=SafeORJSONResponse
 )
 
 # Configure CORS
@@ -108,6 +125,14 @@ async def general_exception_handler(request: Request, exc: Exception):
     }
 
 
+async def _warm_clients():
+    """Prime the shared webhook and SQS clients concurrently."""
+    await asyncio.gather(
+        get_delivery_client().warmup(),
+        get_sqs_client().warmup()
+    )
+
+
 # Startup event
 @app.on_event("startup")
 async def startup_event():
@@ -118,6 +143,10 @@ async def startup_event():
         stage=settings.stage,
         region=settings.aws_region
     )
+    # Prime the webhook and SQS clients in the background so the first request
+    # does not pay for client setup, DNS and TLS; startup is not held up by it.
+    # Mangum runs with lifespan="off", so this only applies to server deployments.
+    app.state.warmup_task = asyncio.create_task(_warm_clients())
 
 
 # Shutdown event
@@ -125,8 +154,52 @@ async def startup_event():
 async def shutdown_event():
     """Application shutdown event handler."""
     logger.info("Shutting down Triggers API")
+    # Stop a warmup still in flight before its clients are closed
+    warmup_task = getattr(app.state, "warmup_task", None)
+    if warmup_task is not None:
+        warmup_task.cancel()
+    # Release pooled webhook and SQS connections held by the shared clients
+    await get_delivery_client().aclose()
+    await get_sqs_client().aclose()
+    # Publish metrics still buffered for the background flush
+    await get_metrics_client().flush()
+
+
+# Lambda handler. Mangum runs each invocation on the thread's current event
+# loop; handler() makes that a uvloop loop when uvloop is installed. Uvicorn
+# deployments pick up uvloop through uvicorn[standard] instead.
+_mangum_handler = Mangum(app, lifespan="off")
+_invocation_loop = None
+
+
+def _get_invocation_loop():
+    """Return the event loop shared by Lambda invocations, creating it on first use."""
+    global _invocation_loop
+    if _invocation_loop is None or _invocation_loop.is_closed():
+        if uvloop is not None:
+            _invocation_loop = uvloop.new_event_loop()
+        else:
+            _invocation_loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(_invocation_loop)
+    return _invocation_loop
+
+
+def handler(event, context):
+    """
+    Lambda entry point.
 
+    Lambda freezes the container as soon as the handler returns and Mangum
+    never runs the shutdown event, so metrics buffered by the request are
+    published on the invocation's event loop before returning.
 
-# Lambda handler
-handler = Mangum(app, lifespan="off")
+    Args:
+        event: Lambda event
+        context: Lambda context
 
+    Returns:
+        Mangum response for the invocation
+    """
+    loop = _get_invocation_loop()
+    response = _mangum_handler(event, context)
+    loop.run_until_complete(get_metrics_client().flush())
+    return response
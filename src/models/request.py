@@ -166,7 +166,7 @@ class UpdateEventRequest(BaseModel):
         # Check if at least one field is explicitly set (not None)
         # Note: idempotency_key can be explicitly set to None to remove it
         # We need to check the raw input to see if it was provided
-        # This will be handled in the handler by checking model_dump(exclude_unset=True)
+        # This will be handled in the handler by checking model_fields_set
         return self
 
 
@@ -297,7 +297,7 @@ class BatchUpdateEventItem(BaseModel):
         # Check if at least one field is explicitly set (not None)
         # Note: idempotency_key can be explicitly set to None to remove it
         # We need to check the raw input to see if it was provided
-        # This will be handled in the handler by checking model_dump(exclude_unset=True)
+        # This will be handled in the handler by checking model_fields_set
         return self
 
 
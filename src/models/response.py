@@ -7,6 +7,7 @@ the JSON responses returned by API endpoints.
 
 Key Components:
 - EventResponse: Model for event creation responses
+- EventResponse.from_event(): Build a response from a stored Event
 
 Dependencies: pydantic, datetime, typing
 Author: Triggers API Team
@@ -16,6 +17,8 @@ from datetime import datetime
 from typing import Dict, Any, Optional, List
 from pydantic import BaseModel, Field, ConfigDict
 
+from .event import Event
+
 
 class EventResponse(BaseModel):
     """
@@ -87,13 +90,43 @@ class EventResponse(BaseModel):
         description="Human-readable status message"
     )
 
+    @classmethod
+    def from_event(cls, event: Event, message: str) -> "EventResponse":
+        """
+        Build a response from an Event.
+
+        The Event's fields were validated when the Event was created, so
+        the response is constructed without re-running validation.
+
+        Args:
+            event: Event to describe
+            message: Human-readable status message
+
+        Returns:
+            EventResponse mirroring the event's fields
+        """
+        return cls.model_construct(
+            event_id=event.event_id,
+            event_type=event.event_type,
+            payload=event.payload,
+            metadata=event.metadata,
+            status=event.status,
+            created_at=event.created_at,
+            delivered_at=event.delivered_at,
+            delivery_attempts=event.delivery_attempts,
+            user_id=event.user_id,
+            idempotency_key=event.idempotency_key,
+            message=message
+        )
+
 
 class BatchItemError(BaseModel):
     """
     Error information for a failed batch operation item.
 
     Contains error code and human-readable message for debugging
-    failed batch operations.
+    failed batch operations. Instances are immutable so fixed errors
+    can be shared across results.
 
     Attributes:
         code: Error code for programmatic handling
@@ -101,6 +134,7 @@ class BatchItemError(BaseModel):
     """
 
     model_config = ConfigDict(
+        frozen=True,
         json_encoders={
             datetime: lambda v: v.isoformat() + 'Z'
         }
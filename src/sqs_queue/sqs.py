@@ -4,17 +4,39 @@ Description: SQS client for event queue operations.
 
 Handles sending events to inbox queue, receiving messages for
 processing, and deleting messages after successful delivery.
+Concurrent single-message sends can be coalesced into SendMessageBatch
+calls through SQSMessageBatcher.
 """
 
+import asyncio
 import json
-from typing import Dict, Any, Optional
+from contextlib import AsyncExitStack
+from typing import Dict, Any, List, Optional, Tuple, Union
 from aioboto3 import Session
+from aiobotocore.config import AioConfig
 from botocore.exceptions import ClientError
 
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# SendMessageBatch accepts at most 10 entries per call
+SQS_BATCH_SIZE = 10
+
+# ...and at most 256 KB of message bodies and attributes per call
+SQS_BATCH_MAX_BYTES = 256 * 1024
+
+# Connection settings for the long-lived SQS client: keep TLS connections
+# alive between calls and pool enough of them for concurrent batch chunks
+SQS_CLIENT_CONFIG = AioConfig(
+    tcp_keepalive=True,
+    max_pool_connections=50,
+    connect_timeout=5,
+    read_timeout=10,
+    retries={'max_attempts': 3, 'mode': 'standard'},
+    connector_args={'keepalive_timeout': 30}
+)
+
 
 class SQSClient:
     """
@@ -36,16 +58,142 @@ class SQSClient:
 
         self.queue_url = queue_url
         self.session = Session()
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._client_task: Optional[asyncio.Task] = None
+        self._exit_stack: Optional[AsyncExitStack] = None
+        self._batcher: Optional["SQSMessageBatcher"] = None
 
         logger.info(
             "SQS client initialized",
             queue_url=queue_url
         )
 
+    async def _open_client(self, stale_exit_stack: Optional[AsyncExitStack] = None):
+        """
+        Open the aioboto3 SQS client that _get_client() shares.
+
+        Args:
+            stale_exit_stack: Exit stack of the client being replaced (opened on
+                another event loop), closed first so its session is not leaked
+        """
+        if stale_exit_stack is not None:
+            try:
+                await stale_exit_stack.aclose()
+            except Exception as e:
+                logger.warning(
+                    "Failed to close SQS client from a previous event loop",
+                    error=str(e)
+                )
+        self._exit_stack = AsyncExitStack()
+        return await self._exit_stack.enter_async_context(
+            self.session.client('sqs', config=SQS_CLIENT_CONFIG)
+        )
+
+    async def _get_client(self):
+        """
+        Return the shared SQS client, opening it on first use.
+
+        Reusing one client keeps its pooled connections (and their TLS
+        sessions) across calls. The client's connections belong to the
+        event loop that opened it, so a new one is opened per loop and the
+        previous one is closed. The client is opened in a task so concurrent
+        first calls share it, and a failed open is retried on the next call.
+        """
+        loop = asyncio.get_running_loop()
+        task = self._client_task
+        if (
+            task is None
+            or self._client_loop is not loop
+            or (task.done() and (task.cancelled() or task.exception() is not None))
+        ):
+            stale_exit_stack, self._exit_stack = self._exit_stack, None
+            self._client_loop = loop
+            task = self._client_task = loop.create_task(self._open_client(stale_exit_stack))
+        return await task
+
+    @property
+    def batcher(self) -> "SQSMessageBatcher":
+        """Shared SQSMessageBatcher that coalesces single sends on this client."""
+        if self._batcher is None:
+            self._batcher = SQSMessageBatcher(self)
+        return self._batcher
+
+    async def aclose(self) -> None:
+        """Close the shared SQS client and its pooled connections."""
+        exit_stack = self._exit_stack
+        self._client_loop = self._client_task = self._exit_stack = None
+        if exit_stack is not None:
+            await exit_stack.aclose()
+
+    async def warmup(self) -> None:
+        """
+        Open the shared client and a pooled connection with a cheap GetQueueAttributes call.
+
+        Moves credential resolution and the TLS handshake off the first send.
+        Failures are logged and ignored.
+        """
+        try:
+            client = await self._get_client()
+            await client.get_queue_attributes(
+                QueueUrl=self.queue_url,
+                AttributeNames=['QueueArn']
+            )
+        except Exception as e:
+            logger.warning(
+                "SQS client warmup failed",
+                queue_url=self.queue_url,
+                error=str(e)
+            )
+
+    @staticmethod
+    def _message_body(event_data: Union[Dict[str, Any], str]) -> str:
+        """Return the SQS message body: pre-serialized JSON as-is, dicts via json."""
+        if isinstance(event_data, str):
+            return event_data
+        # Stdlib json, like the stored payloads, so big integers and NaN survive
+        return json.dumps(event_data)
+
+    @classmethod
+    def _batch_chunks(
+        cls,
+        messages: List[Tuple[str, Union[Dict[str, Any], str]]]
+    ) -> List[List[Tuple[str, str]]]:
+        """
+        Serialize messages and group them into SendMessageBatch-sized chunks.
+
+        A chunk holds at most SQS_BATCH_SIZE entries and SQS_BATCH_MAX_BYTES of
+        bodies plus EventId attributes. A message that alone exceeds the byte
+        limit gets a chunk of its own, which SQS then rejects.
+
+        Args:
+            messages: List of (event_id, event_data) tuples
+
+        Returns:
+            List of chunks of (event_id, message_body) tuples
+        """
+        chunks: List[List[Tuple[str, str]]] = []
+        chunk: List[Tuple[str, str]] = []
+        chunk_bytes = 0
+        for event_id, event_data in messages:
+            body = cls._message_body(event_data)
+            # Attribute size counts its name, type and value
+            size = (
+                (len(body) if body.isascii() else len(body.encode('utf-8')))
+                + len('EventId') + len('String') + len(event_id)
+            )
+            if chunk and (len(chunk) == SQS_BATCH_SIZE or chunk_bytes + size > SQS_BATCH_MAX_BYTES):
+                chunks.append(chunk)
+                chunk, chunk_bytes = [], 0
+            chunk.append((event_id, body))
+            chunk_bytes += size
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
     async def send_message(
         self,
         event_id: str,
-        event_data: Dict[str, Any],
+        event_data: Union[Dict[str, Any], str],
         delay_seconds: int = 0
     ) -> str:
         """
@@ -53,7 +201,8 @@ class SQSClient:
 
         Args:
             event_id: Unique event identifier
-            event_data: Event data to queue
+            event_data: Event data to queue, as a dict or an already
+                serialized JSON string (e.g. from Event.model_dump_json())
             delay_seconds: Optional delay before message becomes available
 
         Returns:
@@ -65,37 +214,164 @@ class SQSClient:
         """
         if not event_id or not isinstance(event_id, str):
             raise ValueError("event_id must be a non-empty string")
-        if not event_data or not isinstance(event_data, dict):
-            raise ValueError("event_data must be a non-empty dictionary")
+        if not event_data or not isinstance(event_data, (dict, str)):
+            raise ValueError("event_data must be a non-empty dictionary or JSON string")
 
         try:
-            async with self.session.client('sqs') as sqs:
-                response = await sqs.send_message(
-                    QueueUrl=self.queue_url,
-                    MessageBody=json.dumps(event_data),
-                    MessageAttributes={
+            sqs = await self._get_client()
+            response = await sqs.send_message(
+                QueueUrl=self.queue_url,
+                MessageBody=self._message_body(event_data),
+                MessageAttributes={
+                    'EventId': {
+                        'StringValue': event_id,
+                        'DataType': 'String'
+                    }
+                },
+                DelaySeconds=delay_seconds
+            )
+
+            message_id = response['MessageId']
+            logger.info(
+                "Message sent to SQS",
+                event_id=event_id,
+                message_id=message_id,
+                queue_url=self.queue_url
+            )
+
+            return message_id
+
+        except ClientError as e:
+            logger.error(
+                "Failed to send message to SQS",
+                event_id=event_id,
+                error_code=e.response['Error']['Code'],
+                error_message=e.response['Error']['Message']
+            )
+            raise
+
+        except Exception as e:
+            logger.error(
+                "Unexpected error sending message to SQS",
+                event_id=event_id,
+                error=str(e)
+            )
+            raise
+
+    async def send_message_batch(
+        self,
+        messages: List[Tuple[str, Union[Dict[str, Any], str]]],
+        delay_seconds: int = 0
+    ) -> Dict[str, List[str]]:
+        """
+        Send multiple events to the SQS queue using SendMessageBatch.
+
+        Messages are sent in chunks of at most 10 entries and 256 KB (the SQS
+        limits), concurrently over a single client. Entries rejected by SQS, and
+        every entry of a chunk whose call fails, are reported as failed rather
+        than raised, so one bad message or chunk does not fail the rest of the batch.
+
+        Args:
+            messages: List of (event_id, event_data) tuples to queue; event_data
+                is a dict or an already serialized JSON string
+            delay_seconds: Optional delay before messages become available
+
+        Returns:
+            Dict with keys:
+            - successful_event_ids: Event IDs that were queued
+            - failed_event_ids: Event IDs that SQS rejected or whose chunk failed
+
+        Raises:
+            ClientError: If the SQS client cannot be opened
+            ValueError: If parameters are invalid
+        """
+        if not isinstance(messages, list):
+            raise ValueError("messages must be a list")
+        for event_id, event_data in messages:
+            if not event_id or not isinstance(event_id, str):
+                raise ValueError("event_id must be a non-empty string")
+            if not event_data or not isinstance(event_data, (dict, str)):
+                raise ValueError("event_data must be a non-empty dictionary or JSON string")
+
+        successful_event_ids: List[str] = []
+        failed_event_ids: List[str] = []
+        if not messages:
+            return {
+                "successful_event_ids": successful_event_ids,
+                "failed_event_ids": failed_event_ids
+            }
+
+        async def send_chunk(sqs, chunk: List[Tuple[str, str]]) -> Tuple[List[str], List[str]]:
+            """Send one SendMessageBatch call and return its (successful, failed) event IDs."""
+            # Entry Ids only need to be unique within one call
+            entries = [
+                {
+                    'Id': str(entry_idx),
+                    'MessageBody': body,
+                    'MessageAttributes': {
                         'EventId': {
                             'StringValue': event_id,
                             'DataType': 'String'
                         }
                     },
-                    DelaySeconds=delay_seconds
+                    'DelaySeconds': delay_seconds
+                }
+                for entry_idx, (event_id, body) in enumerate(chunk)
+            ]
+
+            try:
+                response = await sqs.send_message_batch(
+                    QueueUrl=self.queue_url,
+                    Entries=entries
+                )
+            except Exception as e:
+                # A failed call fails only this chunk's messages
+                logger.error(
+                    "Failed to send message batch chunk to SQS",
+                    chunk_size=len(chunk),
+                    error=str(e)
                 )
+                return [], [event_id for event_id, _ in chunk]
 
-                message_id = response['MessageId']
-                logger.info(
-                    "Message sent to SQS",
+            chunk_successful = [chunk[int(entry['Id'])][0] for entry in response.get('Successful', [])]
+            chunk_failed = []
+            for entry in response.get('Failed', []):
+                event_id = chunk[int(entry['Id'])][0]
+                chunk_failed.append(event_id)
+                logger.error(
+                    "SQS rejected message in batch",
                     event_id=event_id,
-                    message_id=message_id,
-                    queue_url=self.queue_url
+                    error_code=entry.get('Code'),
+                    error_message=entry.get('Message')
                 )
+            return chunk_successful, chunk_failed
+
+        try:
+            sqs = await self._get_client()
+            # Chunks are independent calls, so send them concurrently
+            chunk_results = await asyncio.gather(
+                *(send_chunk(sqs, chunk) for chunk in self._batch_chunks(messages))
+            )
+            for chunk_successful, chunk_failed in chunk_results:
+                successful_event_ids.extend(chunk_successful)
+                failed_event_ids.extend(chunk_failed)
+
+            logger.info(
+                "Message batch sent to SQS",
+                successful=len(successful_event_ids),
+                failed=len(failed_event_ids),
+                queue_url=self.queue_url
+            )
 
-                return message_id
+            return {
+                "successful_event_ids": successful_event_ids,
+                "failed_event_ids": failed_event_ids
+            }
 
         except ClientError as e:
             logger.error(
-                "Failed to send message to SQS",
-                event_id=event_id,
+                "Failed to send message batch to SQS",
+                batch_size=len(messages),
                 error_code=e.response['Error']['Code'],
                 error_message=e.response['Error']['Message']
             )
@@ -103,8 +379,93 @@ class SQSClient:
 
         except Exception as e:
             logger.error(
-                "Unexpected error sending message to SQS",
-                event_id=event_id,
+                "Unexpected error sending message batch to SQS",
+                batch_size=len(messages),
                 error=str(e)
             )
             raise
+
+
+class SQSMessageBatcher:
+    """
+    Coalesces concurrent single-message sends into SendMessageBatch calls.
+
+    send() queues a message and waits for its own outcome. A flush task
+    sends everything queued with send_message_batch(); messages queued
+    while a flush is in flight go out together in the next one. There is no
+    batching window: a lone message is sent right away, so a quiet caller
+    pays no extra latency, while a burst of replays needs roughly a tenth
+    of the SQS calls.
+
+    Attributes:
+        sqs_client: SQSClient used to send the batches
+    """
+
+    def __init__(self, sqs_client: SQSClient):
+        """
+        Initialize message batcher.
+
+        Args:
+            sqs_client: SQSClient used to send the batches
+        """
+        self.sqs_client = sqs_client
+        self._pending: List[Tuple[str, Union[Dict[str, Any], str], asyncio.Future]] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def send(self, event_id: str, event_data: Union[Dict[str, Any], str]) -> None:
+        """
+        Queue one message and wait until it has been sent.
+
+        Args:
+            event_id: Unique event identifier
+            event_data: Event data to queue, as a dict or an already
+                serialized JSON string
+
+        Raises:
+            ClientError: If the SendMessageBatch call carrying the message fails
+            RuntimeError: If SQS rejects the message
+            ValueError: If parameters are invalid
+        """
+        if not event_id or not isinstance(event_id, str):
+            raise ValueError("event_id must be a non-empty string")
+        if not event_data or not isinstance(event_data, (dict, str)):
+            raise ValueError("event_data must be a non-empty dictionary or JSON string")
+
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Futures and tasks belong to one event loop
+            self._loop = loop
+            self._pending = []
+            self._flush_task = None
+
+        future = loop.create_future()
+        self._pending.append((event_id, event_data, future))
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = loop.create_task(self._flush())
+        await future
+
+    async def _flush(self) -> None:
+        """Send queued messages until none are left, resolving each sender."""
+        while self._pending:
+            batch, self._pending = self._pending, []
+            try:
+                result = await self.sqs_client.send_message_batch(
+                    [(event_id, event_data) for event_id, event_data, _ in batch]
+                )
+            except Exception as e:
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            failed_event_ids = set(result["failed_event_ids"])
+            for event_id, _, future in batch:
+                if future.done():
+                    continue
+                if event_id in failed_event_ids:
+                    future.set_exception(
+                        RuntimeError(f"SQS rejected message for event {event_id}")
+                    )
+                else:
+                    future.set_result(None)
@@ -0,0 +1,462 @@
+"""
+Module: cache.py
+Description: Caches for idempotency-key lookups and exhausted replays.
+
+Sits in front of the DynamoDB IdempotencyIndex GSI so repeated
+idempotency-key checks (client retries, replayed batches) can be served
+without a DynamoDB query. A small in-process TTL cache absorbs retries that
+land on the same container within seconds; the Redis cache behind it is
+optional and only enabled when a Redis URL is configured and the redis
+package is installed.
+
+Key Components:
+- IdempotencyCache: Get/set/invalidate cached events by (user_id, idempotency_key) in Redis
+- get_many(): Pipelined multi-key lookup for batch endpoints
+- LocalIdempotencyCache: Bounded in-process TTL/LRU cache, optionally backed by Redis
+- invalidate(): Drop the entry of a deleted or re-keyed event from a cache tier
+- create_idempotency_cache(): Build a Redis cache from a Redis URL (or None)
+- ExhaustedReplayCache: In-process TTL/LRU set of event IDs out of replay attempts;
+  discard() drops a deleted event
+
+Dependencies: redis (optional), json, time, collections, datetime, typing, logger
+Author: Triggers API Team
+"""
+
+import json
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from models.event import Event
+from utils.logger import get_logger
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # pragma: no cover - redis is optional
+    aioredis = None
+
+logger = get_logger(__name__)
+
+
+def create_idempotency_cache(
+    redis_url: Optional[str],
+    ttl_seconds: int = 86400
+) -> Optional["IdempotencyCache"]:
+    """
+    Create an idempotency cache backed by the Redis instance at redis_url.
+
+    Args:
+        redis_url: Redis connection URL (e.g. redis://host:6379/0)
+        ttl_seconds: Expiry for cached entries in seconds
+
+    Returns:
+        IdempotencyCache instance, or None if no URL is configured or the
+        redis package is not installed
+    """
+    if not redis_url:
+        return None
+
+    if aioredis is None:
+        logger.warning(
+            "Redis URL configured but redis package is not installed, idempotency cache disabled"
+        )
+        return None
+
+    return IdempotencyCache(aioredis.from_url(redis_url), ttl_seconds=ttl_seconds)
+
+
+class IdempotencyCache:
+    """
+    Redis cache of events keyed by user-scoped idempotency key.
+
+    Only positive results are cached: a miss always falls through to
+    DynamoDB, so a key that is created after a miss is never masked.
+    All Redis errors are logged and treated as misses - the cache must
+    never break event creation.
+
+    Attributes:
+        redis: asyncio Redis client
+        ttl_seconds: Expiry for cached entries
+
+    Example:
+        >>> cache = IdempotencyCache(redis_client, ttl_seconds=86400)
+        >>> await cache.set(event)
+        >>> cached = await cache.get("user_123", "order-12345")
+    """
+
+    def __init__(self, redis_client, ttl_seconds: int = 86400):
+        """
+        Initialize idempotency cache.
+
+        Args:
+            redis_client: asyncio Redis client
+            ttl_seconds: Expiry for cached entries in seconds
+
+        Raises:
+            ValueError: If ttl_seconds is not positive
+        """
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive")
+
+        self.redis = redis_client
+        self.ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def _key(user_id: str, idempotency_key: str) -> str:
+        """Build the Redis key for a (user_id, idempotency_key) pair."""
+        return f"idem:{user_id}:{idempotency_key}"
+
+    async def get(self, user_id: str, idempotency_key: str) -> Optional[Event]:
+        """
+        Look up a cached event by idempotency key.
+
+        Args:
+            user_id: User identifier
+            idempotency_key: Client-provided idempotency key
+
+        Returns:
+            Cached Event if present, None on miss or Redis error
+        """
+        try:
+            cached = await self.redis.get(self._key(user_id, idempotency_key))
+            if cached:
+                return Event.model_validate_json(cached)
+        except Exception as e:
+            logger.warning(
+                "Idempotency cache lookup failed",
+                user_id=user_id,
+                idempotency_key=idempotency_key,
+                error=str(e)
+            )
+        return None
+
+    async def get_many(
+        self,
+        pairs: List[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], Event]:
+        """
+        Look up multiple cached events in a single pipelined round trip.
+
+        Args:
+            pairs: List of (user_id, idempotency_key) tuples
+
+        Returns:
+            Dict mapping (user_id, idempotency_key) -> Event for cache hits
+        """
+        if not pairs:
+            return {}
+
+        try:
+            pipe = self.redis.pipeline()
+            for user_id, idempotency_key in pairs:
+                pipe.get(self._key(user_id, idempotency_key))
+            values = await pipe.execute()
+        except Exception as e:
+            logger.warning(
+                "Idempotency cache batch lookup failed",
+                keys_count=len(pairs),
+                error=str(e)
+            )
+            return {}
+
+        hits: Dict[Tuple[str, str], Event] = {}
+        for pair, cached in zip(pairs, values):
+            if not cached:
+                continue
+            # A corrupt entry counts as a miss rather than failing the whole batch
+            try:
+                hits[pair] = Event.model_validate_json(cached)
+            except Exception as e:
+                logger.warning(
+                    "Idempotency cache entry could not be parsed",
+                    user_id=pair[0],
+                    idempotency_key=pair[1],
+                    error=str(e)
+                )
+        return hits
+
+    async def set(self, event: Event) -> None:
+        """
+        Cache an event under its (user_id, idempotency_key) pair.
+
+        Events without a user_id or idempotency_key are ignored.
+
+        Args:
+            event: Event to cache
+        """
+        if not event.user_id or not event.idempotency_key:
+            return
+
+        try:
+            await self.redis.set(
+                self._key(event.user_id, event.idempotency_key),
+                # Serialize datetimes as plain ISO strings; the model's 'Z'-suffixed
+                # JSON encoder output does not round-trip through model_validate_json
+                json.dumps(event.model_dump(), default=datetime.isoformat),
+                ex=self.ttl_seconds
+            )
+        except Exception as e:
+            logger.warning(
+                "Idempotency cache write failed",
+                event_id=event.event_id,
+                error=str(e)
+            )
+
+    async def invalidate(self, user_id: Optional[str], idempotency_key: Optional[str]) -> None:
+        """
+        Drop the cached event for a (user_id, idempotency_key) pair.
+
+        Called when the event is deleted or its idempotency_key changes, so
+        the key no longer resolves to it. Missing user_id or key is ignored.
+
+        Args:
+            user_id: User identifier
+            idempotency_key: Client-provided idempotency key
+        """
+        if not user_id or not idempotency_key:
+            return
+
+        try:
+            await self.redis.delete(self._key(user_id, idempotency_key))
+        except Exception as e:
+            logger.warning(
+                "Idempotency cache invalidation failed",
+                user_id=user_id,
+                idempotency_key=idempotency_key,
+                error=str(e)
+            )
+
+
+class LocalIdempotencyCache:
+    """
+    Bounded in-process TTL cache of events keyed by user-scoped idempotency key.
+
+    Client retries after a network error usually arrive within seconds and
+    often hit the same warm container, so a short-lived local entry answers
+    them without a network round trip. Entries expire after ttl_seconds and
+    the least recently used entry is evicted once maxsize is reached. When a
+    backend (the Redis IdempotencyCache) is given, local misses fall through
+    to it and writes go to both tiers.
+
+    Like IdempotencyCache, only positive results are cached. Access happens
+    on the event loop thread, so no locking is needed.
+
+    Attributes:
+        backend: Optional shared cache consulted on local misses
+        maxsize: Maximum number of cached entries
+        ttl_seconds: Lifetime of a cached entry
+
+    Example:
+        >>> cache = LocalIdempotencyCache(backend=redis_cache, ttl_seconds=60)
+        >>> await cache.set(event)
+        >>> cached = await cache.get("user_123", "order-12345")
+    """
+
+    def __init__(
+        self,
+        backend: Optional[IdempotencyCache] = None,
+        maxsize: int = 10000,
+        ttl_seconds: int = 60
+    ):
+        """
+        Initialize local idempotency cache.
+
+        Args:
+            backend: Optional shared cache consulted on local misses
+            maxsize: Maximum number of cached entries
+            ttl_seconds: Lifetime of a cached entry in seconds
+
+        Raises:
+            ValueError: If maxsize or ttl_seconds is not positive
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive")
+
+        self.backend = backend
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, Event]]" = OrderedDict()
+
+    def _get_local(self, pair: Tuple[str, str]) -> Optional[Event]:
+        """Return the live local entry for pair, dropping it if expired."""
+        entry = self._entries.get(pair)
+        if entry is None:
+            return None
+        expires_at, event = entry
+        if expires_at <= time.monotonic():
+            del self._entries[pair]
+            return None
+        self._entries.move_to_end(pair)
+        return event
+
+    def _set_local(self, event: Event) -> None:
+        """Store event locally, evicting the least recently used entry if full."""
+        pair = (event.user_id, event.idempotency_key)
+        # Keep a copy so later in-place changes by the caller (e.g. marking the
+        # event delivered before it is persisted) do not leak into the cache
+        self._entries[pair] = (time.monotonic() + self.ttl_seconds, event.model_copy())
+        self._entries.move_to_end(pair)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    async def get(self, user_id: str, idempotency_key: str) -> Optional[Event]:
+        """
+        Look up a cached event locally, then in the backend.
+
+        Args:
+            user_id: User identifier
+            idempotency_key: Client-provided idempotency key
+
+        Returns:
+            Cached Event if present in either tier, None otherwise
+        """
+        event = self._get_local((user_id, idempotency_key))
+        if event is not None or self.backend is None:
+            return event
+
+        event = await self.backend.get(user_id, idempotency_key)
+        if event is not None:
+            self._set_local(event)
+        return event
+
+    async def get_many(
+        self,
+        pairs: List[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], Event]:
+        """
+        Look up multiple cached events, sending only local misses to the backend.
+
+        Args:
+            pairs: List of (user_id, idempotency_key) tuples
+
+        Returns:
+            Dict mapping (user_id, idempotency_key) -> Event for cache hits
+        """
+        hits: Dict[Tuple[str, str], Event] = {}
+        misses: List[Tuple[str, str]] = []
+        for pair in pairs:
+            event = self._get_local(pair)
+            if event is not None:
+                hits[pair] = event
+            else:
+                misses.append(pair)
+
+        if misses and self.backend is not None:
+            backend_hits = await self.backend.get_many(misses)
+            for event in backend_hits.values():
+                self._set_local(event)
+            hits.update(backend_hits)
+
+        return hits
+
+    async def set(self, event: Event) -> None:
+        """
+        Cache an event in both tiers under its (user_id, idempotency_key) pair.
+
+        Events without a user_id or idempotency_key are ignored.
+
+        Args:
+            event: Event to cache
+        """
+        if not event.user_id or not event.idempotency_key:
+            return
+
+        self._set_local(event)
+        if self.backend is not None:
+            await self.backend.set(event)
+
+    async def invalidate(self, user_id: Optional[str], idempotency_key: Optional[str]) -> None:
+        """
+        Drop the cached event for a (user_id, idempotency_key) pair from both tiers.
+
+        Called when the event is deleted or its idempotency_key changes, so
+        the key no longer resolves to it. Missing user_id or key is ignored.
+
+        Args:
+            user_id: User identifier
+            idempotency_key: Client-provided idempotency key
+        """
+        if not user_id or not idempotency_key:
+            return
+
+        self._entries.pop((user_id, idempotency_key), None)
+        if self.backend is not None:
+            await self.backend.invalidate(user_id, idempotency_key)
+
+
+class ExhaustedReplayCache:
+    """
+    Bounded in-process TTL set of event IDs that have used up their replays.
+
+    delivery_attempts only ever grows, so an event rejected for reaching the
+    replay limit will be rejected again. Remembering it for a short while
+    lets client retries against it be answered without a DynamoDB call.
+    Entries expire after ttl_seconds and the least recently used entry is
+    evicted once maxsize is reached. Access happens on the event loop thread,
+    so no locking is needed.
+
+    Attributes:
+        maxsize: Maximum number of cached event IDs
+        ttl_seconds: Lifetime of a cached entry
+
+    Example:
+        >>> cache = ExhaustedReplayCache(ttl_seconds=60)
+        >>> cache.add("evt_abc123xyz456")
+        >>> "evt_abc123xyz456" in cache
+        True
+    """
+
+    def __init__(self, maxsize: int = 10000, ttl_seconds: int = 60):
+        """
+        Initialize exhausted replay cache.
+
+        Args:
+            maxsize: Maximum number of cached event IDs
+            ttl_seconds: Lifetime of a cached entry in seconds
+
+        Raises:
+            ValueError: If maxsize or ttl_seconds is not positive
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive")
+
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, float]" = OrderedDict()
+
+    def __contains__(self, event_id: str) -> bool:
+        """Return True if event_id has a live entry, dropping it if expired."""
+        expires_at = self._entries.get(event_id)
+        if expires_at is None:
+            return False
+        if expires_at <= time.monotonic():
+            del self._entries[event_id]
+            return False
+        self._entries.move_to_end(event_id)
+        return True
+
+    def add(self, event_id: str) -> None:
+        """
+        Remember event_id as exhausted, evicting the least recently used entry if full.
+
+        Args:
+            event_id: Event that has reached the replay limit
+        """
+        self._entries[event_id] = time.monotonic() + self.ttl_seconds
+        self._entries.move_to_end(event_id)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def discard(self, event_id: str) -> None:
+        """
+        Forget event_id, e.g. once the event is deleted and replays should get a 404.
+
+        Args:
+            event_id: Event to remove from the cache
+        """
+        self._entries.pop(event_id, None)
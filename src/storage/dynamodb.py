@@ -9,25 +9,161 @@ Key Components:
 - DynamoDBClient: Main client class for DynamoDB operations
 - Event storage: put_event() with datetime serialization
 - Event retrieval: get_event() with datetime deserialization
+- Partial updates: update_event_fields() writes only changed attributes
+- Read-free updates: update_event_attributes() returns the updated event in one UpdateItem
+- Replay claims: claim_replay() counts a replay attempt under the limit atomically
+- Keyset pagination: list_events_page() with opaque encode_cursor()/decode_cursor() cursors
+- Idempotency lookups: optional cache in front of the IdempotencyIndex GSI
+- Batch idempotency lookups: concurrent exact queries on the IdempotencyIndex GSI
 - Error handling: Comprehensive exception handling with logging
 
-Dependencies: boto3, botocore, datetime, typing
+Dependencies: boto3, botocore, json, orjson, datetime, typing
 Author: Triggers API Team
 """
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
 from datetime import datetime, timezone
+import asyncio
 import base64
 import json
+import orjson
 
 from models.event import Event
+from storage.cache import IdempotencyCache, LocalIdempotencyCache
 from utils.logger import get_logger
 from utils.filters import EventFilter, build_dynamodb_filter, apply_filters_to_events
 
 logger = get_logger(__name__)
 
+# Connection settings for the DynamoDB resource: keep TLS connections alive
+# between calls and pool enough of them for the concurrent asyncio.to_thread
+# calls batch handlers make (the botocore default pool holds only 10)
+DYNAMODB_CLIENT_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=50,
+    connect_timeout=5,
+    read_timeout=10,
+    retries={'max_attempts': 3, 'mode': 'standard'}
+)
+
+# Retry policy for UnprocessedItems returned by batch_write_item
+UNPROCESSED_MAX_RETRIES = 3
+UNPROCESSED_BASE_DELAY = 0.05  # seconds, doubled on each retry
+
+# Key attributes of an item's position in the table scan and in the StatusIndex GSI
+TABLE_KEY_ATTRIBUTES = ('event_id',)
+STATUS_INDEX_KEY_ATTRIBUTES = ('event_id', 'status', 'created_at')
+
+
+def encode_cursor(key: Dict[str, Any]) -> str:
+    """
+    Encode a DynamoDB key as an opaque, URL-safe pagination cursor.
+
+    Args:
+        key: DynamoDB key (LastEvaluatedKey or the key of the last returned item)
+
+    Returns:
+        base64url-encoded JSON cursor
+    """
+    return base64.urlsafe_b64encode(orjson.dumps(key)).decode('ascii')
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """
+    Decode a pagination cursor produced by encode_cursor().
+
+    Args:
+        cursor: base64url-encoded JSON cursor
+
+    Returns:
+        DynamoDB key to pass as ExclusiveStartKey
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        key = orjson.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+    except (ValueError, UnicodeEncodeError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+    if not isinstance(key, dict) or not key or not all(isinstance(v, str) for v in key.values()):
+        raise ValueError("Invalid pagination cursor")
+    return key
+
+
+def _build_update_expression(
+    updates: Dict[str, Any]
+) -> Tuple[str, Dict[str, str], Dict[str, Any]]:
+    """
+    Build an UpdateItem expression that sets or removes the given attributes.
+
+    Attributes whose value is None are removed (DynamoDB doesn't store
+    None/null values); the rest are set, serialized the same way as
+    put_event(): JSON strings for payload and metadata, ISO 8601 strings
+    for datetimes.
+
+    Args:
+        updates: Attribute names mapped to their new values
+
+    Returns:
+        Tuple of (UpdateExpression, ExpressionAttributeNames,
+        ExpressionAttributeValues)
+    """
+    set_clauses = []
+    remove_clauses = []
+    names: Dict[str, str] = {}
+    values: Dict[str, Any] = {}
+
+    for field_idx, (field, value) in enumerate(updates.items()):
+        name = f"#f{field_idx}"
+        names[name] = field
+
+        if value is None:
+            remove_clauses.append(name)
+            continue
+
+        if field in ('payload', 'metadata'):
+            value = json.dumps(value)
+        elif isinstance(value, datetime):
+            value = value.isoformat()
+
+        values[f":v{field_idx}"] = value
+        set_clauses.append(f"{name} = :v{field_idx}")
+
+    update_expression = ' '.join(
+        clause for clause in (
+            f"SET {', '.join(set_clauses)}" if set_clauses else '',
+            f"REMOVE {', '.join(remove_clauses)}" if remove_clauses else ''
+        )
+        if clause
+    )
+    return update_expression, names, values
+
+
+def _item_to_event(item: Dict[str, Any]) -> Event:
+    """
+    Convert a stored DynamoDB item back to an Event.
+
+    Args:
+        item: Item as returned by DynamoDB (JSON-string payload/metadata,
+            ISO 8601 datetimes)
+
+    Returns:
+        Event model for the item
+    """
+    # Handle both new format (JSON string) and old format (dict) for backward compatibility
+    if isinstance(item.get('payload'), str):
+        item['payload'] = json.loads(item['payload'])
+    if isinstance(item.get('metadata'), str):
+        item['metadata'] = json.loads(item['metadata'])
+    if 'created_at' in item:
+        item['created_at'] = datetime.fromisoformat(item['created_at'])
+    if item.get('delivered_at') is not None:
+        item['delivered_at'] = datetime.fromisoformat(item['delivered_at'])
+    return Event(**item)
+
 
 class DynamoDBClient:
     """
@@ -40,6 +176,7 @@ class DynamoDBClient:
         table_name: Name of the DynamoDB events table
         dynamodb: boto3 DynamoDB resource
         table: boto3 DynamoDB table resource
+        idempotency_cache: Optional cache in front of idempotency-key lookups
 
     Example:
         >>> client = DynamoDBClient(table_name="triggers-api-events")
@@ -47,12 +184,17 @@ class DynamoDBClient:
         >>> retrieved = await client.get_event("evt_123")
     """
 
-    def __init__(self, table_name: str):
+    def __init__(
+        self,
+        table_name: str,
+        idempotency_cache: Optional[Union[LocalIdempotencyCache, IdempotencyCache]] = None
+    ):
         """
         Initialize DynamoDB client.
 
         Args:
             table_name: Name of the DynamoDB events table
+            idempotency_cache: Optional cache consulted before the IdempotencyIndex GSI
 
         Raises:
             ValueError: If table_name is empty or invalid
@@ -61,15 +203,17 @@ class DynamoDBClient:
             raise ValueError("table_name must be a non-empty string")
 
         self.table_name = table_name
-        self.dynamodb = boto3.resource('dynamodb')
+        self.dynamodb = boto3.resource('dynamodb', config=DYNAMODB_CLIENT_CONFIG)
         self.table = self.dynamodb.Table(table_name)
+        self.idempotency_cache = idempotency_cache
 
         logger.info(
             "DynamoDB client initialized",
-            table_name=table_name
+            table_name=table_name,
+            idempotency_cache=idempotency_cache is not None
         )
 
-    async def put_event(self, event: Event) -> None:
+    async def put_event(self, event: Event, only_if_new: bool = False) -> None:
         """
         Store an event in DynamoDB.
 
@@ -78,9 +222,13 @@ class DynamoDBClient:
 
         Args:
             event: Event model to store
+            only_if_new: If True, the write is conditional on no item with
+                this event_id existing, so a newly created event can never
+                silently replace a stored one
 
         Raises:
-            ClientError: If DynamoDB operation fails
+            ClientError: If DynamoDB operation fails (ConditionalCheckFailedException
+                when only_if_new is set and the event_id already exists)
             ValueError: If event is invalid
         """
         if not isinstance(event, Event):
@@ -96,7 +244,9 @@ class DynamoDBClient:
                 item['delivered_at'] = item['delivered_at'].isoformat()
 
             # Serialize payload and metadata as JSON strings to preserve types
-            # This ensures numbers, booleans, etc. are preserved correctly
+            # This ensures numbers, booleans, etc. are preserved correctly.
+            # Stdlib json is used on purpose: orjson rejects integers beyond
+            # 64 bits and would write NaN/Infinity as null
             if 'payload' in item:
                 item['payload'] = json.dumps(item['payload'])
             if 'metadata' in item and item.get('metadata') is not None:
@@ -106,8 +256,17 @@ class DynamoDBClient:
             # Only include attributes that have actual values
             item = {k: v for k, v in item.items() if v is not None}
 
-            # Store in DynamoDB
-            self.table.put_item(Item=item)
+            put_kwargs = {'TableName': self.table_name, 'Item': item}
+            if only_if_new:
+                put_kwargs['ConditionExpression'] = 'attribute_not_exists(event_id)'
+
+            # Store in DynamoDB (off the event loop; the low-level client is thread-safe)
+            await asyncio.to_thread(self.dynamodb.meta.client.put_item, **put_kwargs)
+
+            # Cache the new event so the creator's own immediate retry is
+            # answered without querying the IdempotencyIndex
+            if self.idempotency_cache is not None:
+                await self.idempotency_cache.set(event)
 
             logger.info(
                 "Event stored in DynamoDB",
@@ -157,7 +316,11 @@ class DynamoDBClient:
             raise ValueError("event_id must be a non-empty string")
 
         try:
-            response = self.table.get_item(Key={'event_id': event_id})
+            response = await asyncio.to_thread(
+                self.dynamodb.meta.client.get_item,
+                TableName=self.table_name,
+                Key={'event_id': event_id}
+            )
 
             if 'Item' not in response:
                 logger.warning(
@@ -167,25 +330,7 @@ class DynamoDBClient:
                 )
                 return None
 
-            item = response['Item']
-
-            # Deserialize payload and metadata from JSON strings to preserve types
-            # Handle both new format (JSON string) and old format (dict) for backward compatibility
-            if 'payload' in item:
-                if isinstance(item['payload'], str):
-                    item['payload'] = json.loads(item['payload'])
-            if 'metadata' in item and item.get('metadata') is not None:
-                if isinstance(item['metadata'], str):
-                    item['metadata'] = json.loads(item['metadata'])
-
-            # Convert ISO strings back to datetime objects
-            if 'created_at' in item:
-                item['created_at'] = datetime.fromisoformat(item['created_at'])
-            if 'delivered_at' in item and item['delivered_at'] is not None:
-                item['delivered_at'] = datetime.fromisoformat(item['delivered_at'])
-
-            # Convert to Event model
-            event = Event(**item)
+            event = _item_to_event(response['Item'])
 
             logger.info(
                 "Event retrieved from DynamoDB",
@@ -257,8 +402,11 @@ class DynamoDBClient:
             return None
 
         try:
-            # Query the IdempotencyIndex GSI
-            response = self.table.query(
+            # Query the IdempotencyIndex GSI off the event loop so concurrent
+            # lookups (batch create) overlap instead of serializing
+            response = await asyncio.to_thread(
+                self.dynamodb.meta.client.query,
+                TableName=self.table_name,
                 IndexName='IdempotencyIndex',
                 KeyConditionExpression='#user_id = :user_id AND #idempotency_key = :idempotency_key',
                 ExpressionAttributeNames={
@@ -282,25 +430,7 @@ class DynamoDBClient:
                 )
                 return None
 
-            item = items[0]
-
-            # Deserialize payload and metadata from JSON strings to preserve types
-            # Handle both new format (JSON string) and old format (dict) for backward compatibility
-            if 'payload' in item:
-                if isinstance(item['payload'], str):
-                    item['payload'] = json.loads(item['payload'])
-            if 'metadata' in item and item.get('metadata') is not None:
-                if isinstance(item['metadata'], str):
-                    item['metadata'] = json.loads(item['metadata'])
-
-            # Convert ISO strings back to datetime objects
-            if 'created_at' in item:
-                item['created_at'] = datetime.fromisoformat(item['created_at'])
-            if 'delivered_at' in item and item['delivered_at'] is not None:
-                item['delivered_at'] = datetime.fromisoformat(item['delivered_at'])
-
-            # Convert to Event model
-            event = Event(**item)
+            event = _item_to_event(items[0])
 
             logger.info(
                 "Existing event found for idempotency key",
@@ -333,26 +463,90 @@ class DynamoDBClient:
             )
             raise
 
+    async def get_event_by_idempotency_key_cached(
+        self,
+        user_id: Optional[str],
+        idempotency_key: str,
+        check_cache: bool = True
+    ) -> Optional[Event]:
+        """
+        Retrieve an event by idempotency key, consulting the cache first.
+
+        Falls through to get_event_by_idempotency_key() on a cache miss and
+        caches the result when an event is found. Behaves exactly like the
+        uncached lookup when no idempotency cache is configured.
+
+        Args:
+            user_id: User identifier (required for proper user scoping)
+            idempotency_key: Client-provided idempotency key
+            check_cache: Set to False when the cache was already checked
+                (e.g. via get_cached_events_by_idempotency_keys())
+
+        Returns:
+            Event model if found, None otherwise
+
+        Raises:
+            ClientError: If DynamoDB operation fails
+            ValueError: If parameters are invalid
+        """
+        if self.idempotency_cache is None or user_id is None:
+            return await self.get_event_by_idempotency_key(user_id, idempotency_key)
+
+        if check_cache:
+            cached = await self.idempotency_cache.get(user_id, idempotency_key)
+            if cached:
+                return cached
+
+        event = await self.get_event_by_idempotency_key(user_id, idempotency_key)
+        if event:
+            await self.idempotency_cache.set(event)
+
+        return event
+
+    async def get_cached_events_by_idempotency_keys(
+        self,
+        pairs: List[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], Event]:
+        """
+        Look up cached events for multiple idempotency keys in one round trip.
+
+        Only consults the idempotency cache; keys that miss must still be
+        checked with get_event_by_idempotency_key_cached(check_cache=False).
+
+        Args:
+            pairs: List of (user_id, idempotency_key) tuples
+
+        Returns:
+            Dict mapping (user_id, idempotency_key) -> Event for cache hits
+            (empty when no idempotency cache is configured)
+        """
+        if self.idempotency_cache is None or not pairs:
+            return {}
+
+        return await self.idempotency_cache.get_many(pairs)
+
     async def list_events(
         self,
         status: Optional[str] = None,
         limit: int = 50,
         cursor: Optional[str] = None,
-        filters: Optional[Dict[str, EventFilter]] = None
+        filters: Optional[Dict[str, EventFilter]] = None,
+        user_id: Optional[str] = None,
+        max_delivery_attempts: Optional[int] = None
     ) -> List[Event]:
         """
         List events with optional status filter, custom filters, and pagination.
 
-        Uses cursor-based pagination with DynamoDB LastEvaluatedKey.
-        When status is provided, queries the StatusIndex GSI for efficient filtering.
-        When custom filters are provided, applies them after retrieving data.
-        When no filters, scans the table (less efficient but necessary).
+        Convenience wrapper around list_events_page() for callers that only
+        need the first page of events.
 
         Args:
             status: Optional status to filter by (pending, delivered, failed, replayed)
             limit: Maximum number of events to return (default 50)
-            cursor: Base64-encoded pagination cursor from previous response
+            cursor: Pagination cursor from a previous page
             filters: Optional dictionary of EventFilter objects for custom filtering
+            user_id: Optional owner to restrict results to
+            max_delivery_attempts: Optional exclusive upper bound on delivery_attempts
 
         Returns:
             List of Event objects sorted by created_at descending
@@ -361,19 +555,77 @@ class DynamoDBClient:
             ClientError: If DynamoDB operation fails
             ValueError: If parameters are invalid
         """
+        events, _ = await self.list_events_page(
+            status=status,
+            limit=limit,
+            cursor=cursor,
+            filters=filters,
+            user_id=user_id,
+            max_delivery_attempts=max_delivery_attempts
+        )
+        return events
+
+    async def list_events_page(
+        self,
+        status: Optional[str] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        filters: Optional[Dict[str, EventFilter]] = None,
+        user_id: Optional[str] = None,
+        max_delivery_attempts: Optional[int] = None
+    ) -> Tuple[List[Event], Optional[str]]:
+        """
+        List one page of events with keyset (cursor) pagination.
+
+        When status is provided, queries the StatusIndex GSI (status HASH,
+        created_at RANGE) newest first; otherwise scans the table. Pages
+        resume with ExclusiveStartKey from the cursor, so no rows are re-read
+        to reach a page. Custom filters are applied after retrieval; when
+        that leaves more than limit events, the page is cut at limit and the
+        cursor is the key of the last returned event, so the next page
+        resumes right after it and nothing is skipped.
+
+        When user_id is provided, other users' events are dropped by DynamoDB
+        (FilterExpression) before they are returned, as are events with
+        max_delivery_attempts or more delivery attempts when that is given.
+        DynamoDB applies Limit before the filter, so a page can hold fewer
+        than limit events while a cursor is still returned.
+
+        Args:
+            status: Optional status to filter by (pending, delivered, failed, replayed)
+            limit: Maximum number of events to return (default 50)
+            cursor: Opaque cursor from a previous page (see encode_cursor())
+            filters: Optional dictionary of EventFilter objects for custom filtering
+            user_id: Optional owner to restrict results to
+            max_delivery_attempts: Optional exclusive upper bound on delivery_attempts
+
+        Returns:
+            Tuple of (events, next_cursor). Events are sorted by created_at
+            descending; next_cursor is None on the last page.
+
+        Raises:
+            ClientError: If DynamoDB operation fails
+            ValueError: If parameters or the cursor are invalid
+        """
         if limit <= 0 or limit > 100:
             raise ValueError("limit must be between 1 and 100")
 
         try:
-            kwargs = {'Limit': limit}
+            kwargs = {'TableName': self.table_name, 'Limit': limit}
+            key_attributes = STATUS_INDEX_KEY_ATTRIBUTES if status else TABLE_KEY_ATTRIBUTES
 
-            # Decode pagination cursor if provided
+            # Resume after the key encoded in the cursor. A cursor whose key does not
+            # match this listing (e.g. a scan cursor reused with a status filter)
+            # would be rejected by DynamoDB, so it is reported as invalid instead
             if cursor:
                 try:
-                    kwargs['ExclusiveStartKey'] = json.loads(base64.b64decode(cursor).decode('utf-8'))
-                except (json.JSONDecodeError, UnicodeDecodeError, ValueError) as e:
-                    logger.warning("Invalid pagination cursor", cursor=cursor, error=str(e))
-                    raise ValueError("Invalid pagination cursor")
+                    start_key = decode_cursor(cursor)
+                    if set(start_key) != set(key_attributes):
+                        raise ValueError("Invalid pagination cursor")
+                except ValueError as e:
+                    logger.warning("Invalid pagination cursor", cursor=cursor, error=str(e.__cause__ or e))
+                    raise
+                kwargs['ExclusiveStartKey'] = start_key
 
             # Check if we have any JSON-based filters that require in-memory filtering
             has_json_filters = any(f.field_type == 'json' for f in (filters or {}).values())
@@ -384,73 +636,71 @@ class DynamoDBClient:
                 fetch_limit = min(limit * 3, 300)  # Fetch up to 3x requested limit, max 300
                 kwargs['Limit'] = fetch_limit
 
-            # Query by status using GSI or scan all
+            # Apply the owner and delivery-attempt restrictions server-side so
+            # excluded items are not returned
+            filter_conditions = []
+            if user_id is not None:
+                filter_conditions.append('#user_id = :user_id')
+                kwargs.setdefault('ExpressionAttributeNames', {})['#user_id'] = 'user_id'
+                kwargs.setdefault('ExpressionAttributeValues', {})[':user_id'] = user_id
+            if max_delivery_attempts is not None:
+                filter_conditions.append('#delivery_attempts < :max_delivery_attempts')
+                kwargs.setdefault('ExpressionAttributeNames', {})['#delivery_attempts'] = 'delivery_attempts'
+                kwargs.setdefault('ExpressionAttributeValues', {})[':max_delivery_attempts'] = max_delivery_attempts
+            if filter_conditions:
+                kwargs['FilterExpression'] = ' AND '.join(filter_conditions)
+
+            # Query by status using GSI or scan all, off the event loop
             if status:
-                response = self.table.query(
+                kwargs.setdefault('ExpressionAttributeNames', {})['#status'] = 'status'
+                kwargs.setdefault('ExpressionAttributeValues', {})[':status'] = status
+                response = await asyncio.to_thread(
+                    self.dynamodb.meta.client.query,
                     IndexName='StatusIndex',
                     KeyConditionExpression='#status = :status',
-                    ExpressionAttributeNames={'#status': 'status'},
-                    ExpressionAttributeValues={':status': status},
                     ScanIndexForward=False,  # Most recent first
                     **kwargs
                 )
             else:
-                response = self.table.scan(**kwargs)
+                response = await asyncio.to_thread(self.dynamodb.meta.client.scan, **kwargs)
 
-            # Convert items to Event objects
+            # Convert items to Event objects, remembering each item's key (in its
+            # stored form) in case the page has to be cut after it
             events = []
+            keys_by_id: Dict[str, Dict[str, Any]] = {}
             for item in response.get('Items', []):
-                # Deserialize payload and metadata from JSON strings to preserve types
-                # Handle both new format (JSON string) and old format (dict) for backward compatibility
-                if 'payload' in item:
-                    if isinstance(item['payload'], str):
-                        item['payload'] = json.loads(item['payload'])
-                if 'metadata' in item and item.get('metadata') is not None:
-                    if isinstance(item['metadata'], str):
-                        item['metadata'] = json.loads(item['metadata'])
-
-                # Convert ISO strings back to datetime objects
-                if 'created_at' in item:
-                    item['created_at'] = datetime.fromisoformat(item['created_at'])
-                if 'delivered_at' in item and item['delivered_at'] is not None:
-                    item['delivered_at'] = datetime.fromisoformat(item['delivered_at'])
-
-                events.append(Event(**item))
-
-            # Sort events by created_at descending for scan operations (no guaranteed order)
-            if not status:
-                events.sort(key=lambda e: e.created_at, reverse=True)
+                keys_by_id[item['event_id']] = {attr: item[attr] for attr in key_attributes}
+                events.append(_item_to_event(item))
 
             # Apply custom filters if provided
             if filters:
                 events = apply_filters_to_events(events, filters)
 
-                # Limit to requested number after filtering
+            # Cut an over-full page (only possible with the raised JSON-filter fetch
+            # limit) in retrieval order and resume after its last event; otherwise
+            # resume where DynamoDB stopped reading
+            next_key = response.get('LastEvaluatedKey')
+            if len(events) > limit:
                 events = events[:limit]
+                next_key = keys_by_id[events[-1].event_id]
+            next_cursor = encode_cursor(next_key) if next_key else None
 
-            # Create next cursor if more results available
-            # Note: This is simplified - proper cursor handling with filters would be more complex
-            # For now, we don't support cursors with custom filters
-            next_cursor = None
-            if not filters and 'LastEvaluatedKey' in response:
-                try:
-                    next_cursor = base64.b64encode(
-                        json.dumps(response['LastEvaluatedKey']).encode('utf-8')
-                    ).decode('utf-8')
-                except (TypeError, json.JSONDecodeError) as e:
-                    logger.warning("Failed to encode pagination cursor", error=str(e))
+            # Sort events by created_at descending for scan operations (no guaranteed order)
+            if not status:
+                events.sort(key=lambda e: e.created_at, reverse=True)
 
             logger.info(
                 "Events listed",
                 count=len(events),
                 status_filter=status,
                 custom_filters=bool(filters),
+                user_id=user_id,
                 limit=limit,
                 has_more=bool(next_cursor),
                 table_name=self.table_name
             )
 
-            return events
+            return events, next_cursor
 
         except ClientError as e:
             logger.error(
@@ -463,6 +713,9 @@ class DynamoDBClient:
             )
             raise
 
+        except ValueError:
+            raise
+
         except Exception as e:
             logger.error(
                 "Unexpected error listing events from DynamoDB",
@@ -473,30 +726,68 @@ class DynamoDBClient:
             )
             raise
 
-    async def delete_event(self, event_id: str) -> None:
+    async def delete_event(
+        self,
+        event_id: str,
+        expected_user_id: Optional[str] = None
+    ) -> Optional[Event]:
         """
         Delete an event from DynamoDB.
 
-        Removes an event from the DynamoDB table by its event_id.
+        Removes an event from the DynamoDB table by its event_id. When
+        expected_user_id is given, the delete is conditional on the event
+        belonging to that user (or already being gone), so ownership is
+        checked without reading the event first.
 
         Args:
             event_id: Unique event identifier to delete
+            expected_user_id: Owner the stored event must have (None skips the check)
+
+        Returns:
+            The deleted Event, or None if no event was stored under event_id
 
         Raises:
-            ClientError: If DynamoDB operation fails
+            ClientError: If DynamoDB operation fails. An event owned by another
+                user raises ConditionalCheckFailedException
             ValueError: If event_id is invalid
         """
         if not event_id or not isinstance(event_id, str):
             raise ValueError("event_id must be a non-empty string")
 
+        delete_kwargs: Dict[str, Any] = {
+            'TableName': self.table_name,
+            'Key': {'event_id': event_id},
+            'ReturnValues': 'ALL_OLD'
+        }
+        if expected_user_id is not None:
+            delete_kwargs['ConditionExpression'] = (
+                'attribute_not_exists(#event_id) OR #user_id = :expected_user_id'
+            )
+            delete_kwargs['ExpressionAttributeNames'] = {
+                '#event_id': 'event_id',
+                '#user_id': 'user_id'
+            }
+            delete_kwargs['ExpressionAttributeValues'] = {':expected_user_id': expected_user_id}
+
         try:
-            self.table.delete_item(Key={'event_id': event_id})
+            response = await asyncio.to_thread(
+                self.dynamodb.meta.client.delete_item, **delete_kwargs
+            )
+
+            if 'Attributes' not in response:
+                return None
+            event = _item_to_event(response['Attributes'])
+
+            # The deleted event must no longer answer for its idempotency key
+            if self.idempotency_cache is not None:
+                await self.idempotency_cache.invalidate(event.user_id, event.idempotency_key)
 
             logger.info(
                 "Event deleted from DynamoDB",
                 event_id=event_id,
                 table_name=self.table_name
             )
+            return event
 
         except ClientError as e:
             logger.error(
@@ -556,7 +847,15 @@ class DynamoDBClient:
             item = {k: v for k, v in item.items() if v is not None}
 
             # Update in DynamoDB (put_item will replace the entire item)
-            self.table.put_item(Item=item)
+            await asyncio.to_thread(
+                self.dynamodb.meta.client.put_item,
+                TableName=self.table_name,
+                Item=item
+            )
+
+            # Keep any cached idempotency entry in sync with the stored item
+            if self.idempotency_cache is not None:
+                await self.idempotency_cache.set(event)
 
             logger.info(
                 "Event updated in DynamoDB",
@@ -586,13 +885,268 @@ class DynamoDBClient:
             )
             raise
 
+    async def update_event_fields(
+        self,
+        event: Event,
+        fields: List[str],
+        expected_user_id: Optional[str] = None
+    ) -> None:
+        """
+        Write only the given attributes of an existing event with UpdateItem.
+
+        Unlike update_event(), which replaces the whole item, only the named
+        fields are sent: fields whose value on the event is None are removed,
+        the rest are set. Attributes not named are left as stored, so a
+        concurrent change to them (e.g. a delivery marking the event
+        delivered) is not overwritten, and an unchanged payload is not re-sent.
+
+        The write is conditional on the event existing and, when
+        expected_user_id is given, on it belonging to that user.
+
+        Args:
+            event: Event model holding the new field values
+            fields: Names of the Event fields to write
+            expected_user_id: Owner the stored event must have (None skips the check)
+
+        Raises:
+            ClientError: If DynamoDB operation fails. A failed condition raises
+                ConditionalCheckFailedException whose response carries the
+                stored 'Item' when the event exists (owned by another user)
+            ValueError: If event or fields are invalid
+        """
+        if not isinstance(event, Event):
+            raise ValueError("event must be an Event instance")
+        if not fields:
+            raise ValueError("fields must be a non-empty list")
+
+        update_expression, names, values = _build_update_expression(
+            {field: getattr(event, field) for field in fields}
+        )
+        names['#event_id'] = 'event_id'
+
+        condition_expression = 'attribute_exists(#event_id)'
+        if expected_user_id is not None:
+            names['#user_id'] = 'user_id'
+            values[':expected_user_id'] = expected_user_id
+            condition_expression += ' AND #user_id = :expected_user_id'
+
+        update_kwargs: Dict[str, Any] = {
+            'TableName': self.table_name,
+            'Key': {'event_id': event.event_id},
+            'UpdateExpression': update_expression,
+            'ConditionExpression': condition_expression,
+            'ExpressionAttributeNames': names,
+            'ReturnValuesOnConditionCheckFailure': 'ALL_OLD'
+        }
+        if values:
+            update_kwargs['ExpressionAttributeValues'] = values
+        if 'idempotency_key' in fields:
+            # Return the previous key so its cache entry can be dropped
+            update_kwargs['ReturnValues'] = 'UPDATED_OLD'
+
+        try:
+            response = await asyncio.to_thread(
+                self.dynamodb.meta.client.update_item, **update_kwargs
+            )
+
+            # Keep any cached idempotency entry in sync with the stored item
+            if self.idempotency_cache is not None:
+                old_key = response.get('Attributes', {}).get('idempotency_key')
+                if old_key and old_key != event.idempotency_key:
+                    await self.idempotency_cache.invalidate(event.user_id, old_key)
+                await self.idempotency_cache.set(event)
+
+            logger.info(
+                "Event fields updated in DynamoDB",
+                event_id=event.event_id,
+                fields=fields,
+                table_name=self.table_name
+            )
+
+        except ClientError as e:
+            logger.error(
+                "Failed to update event fields in DynamoDB",
+                event_id=event.event_id,
+                fields=fields,
+                table_name=self.table_name,
+                error_code=e.response['Error']['Code'],
+                error_message=e.response['Error']['Message']
+            )
+            raise
+
+    async def update_event_attributes(
+        self,
+        event_id: str,
+        updates: Dict[str, Any],
+        expected_user_id: Optional[str] = None
+    ) -> Event:
+        """
+        Update attributes of a stored event without reading it first.
+
+        Issues a single conditional UpdateItem and returns the event as
+        stored after the update, so callers that would otherwise fetch the
+        event, change it and write it back need one round trip instead of
+        two. Attributes whose new value is None are removed.
+
+        Args:
+            event_id: Unique event identifier
+            updates: Event field names mapped to their new values
+            expected_user_id: Owner the stored event must have (None skips the check)
+
+        Returns:
+            Event with all of its attributes after the update
+
+        Raises:
+            ClientError: If DynamoDB operation fails. A failed condition raises
+                ConditionalCheckFailedException whose response carries the
+                stored 'Item' when the event exists (owned by another user)
+            ValueError: If event_id or updates are invalid
+        """
+        if not event_id or not isinstance(event_id, str):
+            raise ValueError("event_id must be a non-empty string")
+        if not updates:
+            raise ValueError("updates must be a non-empty dict")
+
+        update_expression, names, values = _build_update_expression(updates)
+        names['#event_id'] = 'event_id'
+
+        condition_expression = 'attribute_exists(#event_id)'
+        if expected_user_id is not None:
+            names['#user_id'] = 'user_id'
+            values[':expected_user_id'] = expected_user_id
+            condition_expression += ' AND #user_id = :expected_user_id'
+
+        # When the idempotency key changes, ask for the item as it was so the
+        # old key's cache entry can be dropped; the updated event is then built
+        # from it, since DynamoDB returns either the old or the new item
+        rekeyed = 'idempotency_key' in updates
+        update_kwargs: Dict[str, Any] = {
+            'TableName': self.table_name,
+            'Key': {'event_id': event_id},
+            'UpdateExpression': update_expression,
+            'ConditionExpression': condition_expression,
+            'ExpressionAttributeNames': names,
+            'ReturnValues': 'ALL_OLD' if rekeyed else 'ALL_NEW',
+            'ReturnValuesOnConditionCheckFailure': 'ALL_OLD'
+        }
+        if values:
+            update_kwargs['ExpressionAttributeValues'] = values
+
+        try:
+            response = await asyncio.to_thread(
+                self.dynamodb.meta.client.update_item, **update_kwargs
+            )
+            event = _item_to_event(response['Attributes'])
+            old_key = None
+            if rekeyed:
+                old_key = event.idempotency_key
+                event = event.model_copy(update=updates)
+
+            # Keep any cached idempotency entry in sync with the stored item
+            if self.idempotency_cache is not None:
+                if old_key and old_key != event.idempotency_key:
+                    await self.idempotency_cache.invalidate(event.user_id, old_key)
+                await self.idempotency_cache.set(event)
+
+            logger.info(
+                "Event attributes updated in DynamoDB",
+                event_id=event_id,
+                fields=list(updates),
+                table_name=self.table_name
+            )
+            return event
+
+        except ClientError as e:
+            logger.error(
+                "Failed to update event attributes in DynamoDB",
+                event_id=event_id,
+                fields=list(updates),
+                table_name=self.table_name,
+                error_code=e.response['Error']['Code'],
+                error_message=e.response['Error']['Message']
+            )
+            raise
+
+    async def claim_replay(self, event_id: str, max_attempts: int) -> Event:
+        """
+        Atomically count a replay attempt and return the event.
+
+        Issues a single UpdateItem that increments delivery_attempts only
+        while it is below max_attempts, and returns the updated event. This
+        replaces reading the event and checking the limit in the caller, so
+        concurrent replays of one event cannot both pass the check and
+        exceed the limit.
+
+        Args:
+            event_id: Unique event identifier
+            max_attempts: Replays are refused once delivery_attempts reaches this
+
+        Returns:
+            Event with delivery_attempts already incremented
+
+        Raises:
+            ClientError: If DynamoDB operation fails. A failed condition raises
+                ConditionalCheckFailedException whose response carries the
+                stored 'Item' when the event exists (limit reached)
+            ValueError: If event_id is invalid
+        """
+        if not event_id or not isinstance(event_id, str):
+            raise ValueError("event_id must be a non-empty string")
+
+        try:
+            response = await asyncio.to_thread(
+                self.dynamodb.meta.client.update_item,
+                TableName=self.table_name,
+                Key={'event_id': event_id},
+                UpdateExpression=(
+                    'SET #delivery_attempts = if_not_exists(#delivery_attempts, :zero) + :one'
+                ),
+                ConditionExpression=(
+                    'attribute_exists(#event_id) AND '
+                    '(attribute_not_exists(#delivery_attempts) OR #delivery_attempts < :max_attempts)'
+                ),
+                ExpressionAttributeNames={
+                    '#event_id': 'event_id',
+                    '#delivery_attempts': 'delivery_attempts'
+                },
+                ExpressionAttributeValues={
+                    ':zero': 0,
+                    ':one': 1,
+                    ':max_attempts': max_attempts
+                },
+                ReturnValues='ALL_NEW',
+                ReturnValuesOnConditionCheckFailure='ALL_OLD'
+            )
+            event = _item_to_event(response['Attributes'])
+
+            logger.info(
+                "Replay attempt claimed in DynamoDB",
+                event_id=event_id,
+                delivery_attempts=event.delivery_attempts,
+                table_name=self.table_name
+            )
+            return event
+
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                logger.error(
+                    "Failed to claim replay attempt in DynamoDB",
+                    event_id=event_id,
+                    table_name=self.table_name,
+                    error_code=e.response['Error']['Code'],
+                    error_message=e.response['Error']['Message']
+                )
+            raise
+
     async def batch_put_events(self, events: List[Event]) -> Dict[str, Any]:
         """
         Store multiple events in DynamoDB with internal chunking.
 
         Processes events in chunks of 25 (DynamoDB batch_write_item limit).
-        Uses batch_write_item for efficiency and handles UnprocessedItems.
-        Continues processing remaining chunks even if some fail.
+        Uses batch_write_item for efficiency and re-submits UnprocessedItems up
+        to UNPROCESSED_MAX_RETRIES times with exponential backoff; anything
+        still unprocessed is reported as failed. Continues processing remaining
+        chunks even if some fail.
 
         Args:
             events: List of Event models to store
@@ -647,19 +1201,30 @@ class DynamoDBClient:
                     request_items[f"{self.table_name}"].append({"PutRequest": {"Item": item}})
                     event_map[event.event_id] = event
 
-                # Execute batch write
-                response = self.dynamodb.batch_write_item(RequestItems=request_items)
+                # Execute batch write, re-submitting UnprocessedItems with
+                # exponential backoff (throttling under a burst of writes)
+                unprocessed = request_items[self.table_name]
+                for attempt in range(UNPROCESSED_MAX_RETRIES + 1):
+                    if attempt:
+                        await asyncio.sleep(UNPROCESSED_BASE_DELAY * (2 ** (attempt - 1)))
+
+                    response = await asyncio.to_thread(
+                        self.dynamodb.meta.client.batch_write_item,
+                        RequestItems={self.table_name: unprocessed}
+                    )
+
+                    unprocessed = response.get('UnprocessedItems', {}).get(self.table_name, [])
+                    if not unprocessed:
+                        break
 
-                # Handle unprocessed items (retry logic could be added here)
-                unprocessed = response.get('UnprocessedItems', {}).get(self.table_name, [])
                 if unprocessed:
                     logger.warning(
                         f"Some items not processed in chunk {chunk_idx}",
                         unprocessed_count=len(unprocessed),
                         total_in_chunk=len(chunk),
+                        retries=UNPROCESSED_MAX_RETRIES,
                         table_name=self.table_name
                     )
-                    # For now, mark unprocessed items as failed
                     for unprocessed_item in unprocessed:
                         item = unprocessed_item.get('PutRequest', {}).get('Item', {})
                         if 'event_id' in item:
@@ -669,11 +1234,14 @@ class DynamoDBClient:
                             })
 
                 # Mark successful items
-                processed_event_ids = [event.event_id for event in chunk]
-                for unprocessed_item in unprocessed:
-                    item = unprocessed_item.get('PutRequest', {}).get('Item', {})
-                    if 'event_id' in item and item['event_id'] in processed_event_ids:
-                        processed_event_ids.remove(item['event_id'])
+                unprocessed_event_ids = {
+                    unprocessed_item.get('PutRequest', {}).get('Item', {}).get('event_id')
+                    for unprocessed_item in unprocessed
+                }
+                processed_event_ids = [
+                    event.event_id for event in chunk
+                    if event.event_id not in unprocessed_event_ids
+                ]
 
                 successful_event_ids.extend(processed_event_ids)
 
@@ -727,12 +1295,39 @@ class DynamoDBClient:
             "failed_items": failed_items
         }
 
+    async def batch_update_events(self, events: List[Event]) -> Dict[str, Any]:
+        """
+        Update multiple existing events in DynamoDB with BatchWriteItem.
+
+        Like update_event(), updates replace the entire item, so this is a
+        batch put of the full events (25 per request) followed by refreshing
+        any cached idempotency entries for the events that were written.
+
+        Args:
+            events: List of Event models to update
+
+        Returns:
+            Dict with 'successful_event_ids' list and 'failed_items' list (with reasons)
+
+        Raises:
+            ValueError: If events list is invalid
+        """
+        result = await self.batch_put_events(events)
+
+        if self.idempotency_cache is not None and result["successful_event_ids"]:
+            successful = set(result["successful_event_ids"])
+            for event in events:
+                if event.event_id in successful:
+                    await self.idempotency_cache.set(event)
+
+        return result
+
     async def batch_get_events(self, event_ids: List[str]) -> List[Event]:
         """
         Retrieve multiple events by ID with internal chunking.
 
         Processes event_ids in chunks of 25 (DynamoDB batch_get_item limit).
-        Uses batch_get_item for efficiency and handles UnprocessedKeys.
+        Chunks are fetched concurrently so their round trips overlap.
         Returns found events in arbitrary order (DynamoDB doesn't guarantee order).
 
         Args:
@@ -757,102 +1352,119 @@ class DynamoDBClient:
                 raise ValueError("all event_ids must be non-empty strings")
 
         from utils.batch_helpers import chunk_list
-        all_events = []
 
-        # Process event_ids in chunks of 25 (DynamoDB batch limit)
+        # Process event_ids in chunks of 25 (DynamoDB batch limit), concurrently
         chunks = chunk_list(event_ids, 25)
+        chunk_results = await asyncio.gather(*(
+            self._batch_get_chunk(chunk_idx, chunk)
+            for chunk_idx, chunk in enumerate(chunks)
+        ))
+        all_events = [event for chunk_events in chunk_results for event in chunk_events]
 
-        for chunk_idx, chunk in enumerate(chunks):
-            try:
-                # Prepare batch get request
-                keys = [{"event_id": event_id} for event_id in chunk]
-
-                response = self.dynamodb.batch_get_item(
-                    RequestItems={
-                        self.table_name: {
-                            "Keys": keys
-                        }
-                    }
-                )
+        logger.info(
+            "Batch get events completed",
+            requested=len(event_ids),
+            found=len(all_events),
+            table_name=self.table_name
+        )
 
-                # Process found items
-                items = response.get('Responses', {}).get(self.table_name, [])
-                for item in items:
-                    # Deserialize payload and metadata
-                    if 'payload' in item:
-                        if isinstance(item['payload'], str):
-                            item['payload'] = json.loads(item['payload'])
-                    if 'metadata' in item and item.get('metadata') is not None:
-                        if isinstance(item['metadata'], str):
-                            item['metadata'] = json.loads(item['metadata'])
+        return all_events
+
+    async def _batch_get_chunk(self, chunk_idx: int, chunk: List[str]) -> List[Event]:
+        """
+        Fetch a single chunk of up to 25 events with batch_get_item.
 
-                    # Convert datetime strings
-                    if 'created_at' in item:
-                        item['created_at'] = datetime.fromisoformat(item['created_at'])
-                    if 'delivered_at' in item and item['delivered_at'] is not None:
-                        item['delivered_at'] = datetime.fromisoformat(item['delivered_at'])
+        The blocking boto3 call runs in a worker thread on the (thread-safe)
+        low-level client so that concurrent chunks don't serialize on the
+        event loop. Failed chunks are logged and yield no events.
 
-                    # Convert to Event model
-                    event = Event(**item)
-                    all_events.append(event)
+        Args:
+            chunk_idx: Position of the chunk (for logging)
+            chunk: Event IDs in this chunk
 
-                # Handle unprocessed keys (retry logic could be added here)
-                unprocessed = response.get('UnprocessedKeys', {})
-                if unprocessed:
-                    logger.warning(
-                        f"Some keys not processed in chunk {chunk_idx}",
-                        unprocessed_count=len(unprocessed.get('Keys', [])),
-                        total_in_chunk=len(chunk),
-                        table_name=self.table_name
-                    )
-                    # For now, we don't retry unprocessed keys
+        Returns:
+            List of found Event models in this chunk
+        """
+        events = []
 
-                logger.info(
-                    f"Processed batch get chunk {chunk_idx}",
-                    chunk_size=len(chunk),
-                    found=len(items),
-                    unprocessed=len(unprocessed.get('Keys', [])),
+        try:
+            # Prepare batch get request
+            keys = [{"event_id": event_id} for event_id in chunk]
+
+            response = await asyncio.to_thread(
+                self.dynamodb.meta.client.batch_get_item,
+                RequestItems={
+                    self.table_name: {
+                        "Keys": keys
+                    }
+                }
+            )
+
+            # Process found items
+            items = response.get('Responses', {}).get(self.table_name, [])
+            events.extend(_item_to_event(item) for item in items)
+
+            # Handle unprocessed keys (retry logic could be added here)
+            unprocessed = response.get('UnprocessedKeys', {})
+            if unprocessed:
+                logger.warning(
+                    f"Some keys not processed in chunk {chunk_idx}",
+                    unprocessed_count=len(unprocessed.get('Keys', [])),
+                    total_in_chunk=len(chunk),
                     table_name=self.table_name
                 )
+                # For now, we don't retry unprocessed keys
 
-            except ClientError as e:
-                logger.error(
-                    f"Failed to batch get chunk {chunk_idx}",
-                    chunk_size=len(chunk),
-                    table_name=self.table_name,
-                    error_code=e.response['Error']['Code'],
-                    error_message=e.response['Error']['Message']
-                )
-                # Skip failed chunks (items in this chunk won't be returned)
+            logger.info(
+                f"Processed batch get chunk {chunk_idx}",
+                chunk_size=len(chunk),
+                found=len(items),
+                unprocessed=len(unprocessed.get('Keys', [])),
+                table_name=self.table_name
+            )
 
-            except Exception as e:
-                logger.error(
-                    f"Unexpected error in batch get chunk {chunk_idx}",
-                    chunk_size=len(chunk),
-                    table_name=self.table_name,
-                    error=str(e)
-                )
-                # Skip failed chunks
+        except ClientError as e:
+            logger.error(
+                f"Failed to batch get chunk {chunk_idx}",
+                chunk_size=len(chunk),
+                table_name=self.table_name,
+                error_code=e.response['Error']['Code'],
+                error_message=e.response['Error']['Message']
+            )
+            # Skip failed chunks (items in this chunk won't be returned)
 
-        logger.info(
-            "Batch get events completed",
-            requested=len(event_ids),
-            found=len(all_events),
-            table_name=self.table_name
-        )
+        except Exception as e:
+            logger.error(
+                f"Unexpected error in batch get chunk {chunk_idx}",
+                chunk_size=len(chunk),
+                table_name=self.table_name,
+                error=str(e)
+            )
+            # Skip failed chunks
 
-        return all_events
+        return events
 
-    async def batch_delete_events(self, event_ids: List[str]) -> Dict[str, Any]:
+    async def batch_delete_events(
+        self,
+        event_ids: List[str],
+        events: Optional[List[Event]] = None
+    ) -> Dict[str, Any]:
         """
         Delete multiple events by ID with internal chunking.
 
         Processes event_ids in chunks of 25 (DynamoDB batch_write_item limit).
-        Uses batch_write_item with DeleteRequest for efficiency.
+        Chunks are dispatched concurrently, and UnprocessedItems are retried
+        with exponential backoff before being reported as failed.
         Continues processing even if some deletions fail.
 
+        BatchWriteItem does not return deleted items, so the cached
+        idempotency entries of deleted events are dropped using the events
+        passed in by the caller; without them (and with a cache configured)
+        the events are read first.
+
         Args:
             event_ids: List of event IDs to delete
+            events: Already loaded Event models for event_ids (optional)
 
         Returns:
             Dict with 'successful_event_ids' list and 'failed_event_ids' list
@@ -872,78 +1484,31 @@ class DynamoDBClient:
             if not isinstance(event_id, str) or not event_id.strip():
                 raise ValueError("all event_ids must be non-empty strings")
 
+        if self.idempotency_cache is not None and events is None:
+            events = await self.batch_get_events(event_ids)
+
         from utils.batch_helpers import chunk_list
         successful_event_ids = []
         failed_event_ids = []
 
-        # Process event_ids in chunks of 25 (DynamoDB batch limit)
+        # Process event_ids in chunks of 25 (DynamoDB batch limit), concurrently
         chunks = chunk_list(event_ids, 25)
-
-        for chunk_idx, chunk in enumerate(chunks):
-            try:
-                # Prepare batch delete request
-                request_items = {}
-                for event_id in chunk:
-                    request_items[f"{self.table_name}"] = request_items.get(f"{self.table_name}", [])
-                    request_items[f"{self.table_name}"].append({
-                        "DeleteRequest": {"Key": {"event_id": event_id}}
-                    })
-
-                # Execute batch delete
-                response = self.dynamodb.batch_write_item(RequestItems=request_items)
-
-                # Handle unprocessed items
-                unprocessed = response.get('UnprocessedItems', {}).get(self.table_name, [])
-                if unprocessed:
-                    logger.warning(
-                        f"Some items not deleted in chunk {chunk_idx}",
-                        unprocessed_count=len(unprocessed),
-                        total_in_chunk=len(chunk),
-                        table_name=self.table_name
-                    )
-                    # Mark unprocessed items as failed
-                    for unprocessed_item in unprocessed:
-                        key = unprocessed_item.get('DeleteRequest', {}).get('Key', {})
-                        if 'event_id' in key:
-                            failed_event_ids.append(key['event_id'])
-
-                # Mark successful deletions
-                processed_event_ids = list(chunk)  # Copy chunk
-                for unprocessed_item in unprocessed:
-                    key = unprocessed_item.get('DeleteRequest', {}).get('Key', {})
-                    if 'event_id' in key and key['event_id'] in processed_event_ids:
-                        processed_event_ids.remove(key['event_id'])
-
-                successful_event_ids.extend(processed_event_ids)
-
-                logger.info(
-                    f"Processed batch delete chunk {chunk_idx}",
-                    chunk_size=len(chunk),
-                    successful=len(processed_event_ids),
-                    failed=len(unprocessed),
-                    table_name=self.table_name
-                )
-
-            except ClientError as e:
-                logger.error(
-                    f"Failed to batch delete chunk {chunk_idx}",
-                    chunk_size=len(chunk),
-                    table_name=self.table_name,
-                    error_code=e.response['Error']['Code'],
-                    error_message=e.response['Error']['Message']
-                )
-                # Mark entire chunk as failed
-                failed_event_ids.extend(chunk)
-
-            except Exception as e:
-                logger.error(
-                    f"Unexpected error in batch delete chunk {chunk_idx}",
-                    chunk_size=len(chunk),
-                    table_name=self.table_name,
-                    error=str(e)
-                )
-                # Mark entire chunk as failed
-                failed_event_ids.extend(chunk)
+        chunk_results = await asyncio.gather(*(
+            self._batch_delete_chunk(chunk_idx, chunk)
+            for chunk_idx, chunk in enumerate(chunks)
+        ))
+        for chunk_successful, chunk_failed in chunk_results:
+            successful_event_ids.extend(chunk_successful)
+            failed_event_ids.extend(chunk_failed)
+
+        # Deleted events must no longer answer for their idempotency keys
+        if self.idempotency_cache is not None and successful_event_ids:
+            deleted = set(successful_event_ids)
+            await asyncio.gather(*(
+                self.idempotency_cache.invalidate(event.user_id, event.idempotency_key)
+                for event in events
+                if event.event_id in deleted and event.idempotency_key
+            ))
 
         logger.info(
             "Batch delete events completed",
@@ -958,6 +1523,100 @@ class DynamoDBClient:
             "failed_event_ids": failed_event_ids
         }
 
+    async def _batch_delete_chunk(
+        self,
+        chunk_idx: int,
+        chunk: List[str]
+    ) -> Tuple[List[str], List[str]]:
+        """
+        Delete a single chunk of up to 25 events with batch_write_item.
+
+        Re-submits UnprocessedItems up to UNPROCESSED_MAX_RETRIES times with
+        exponential backoff; anything still unprocessed is reported as failed.
+        The blocking boto3 call runs in a worker thread on the low-level client.
+
+        Args:
+            chunk_idx: Position of the chunk (for logging)
+            chunk: Event IDs in this chunk
+
+        Returns:
+            Tuple of (successful_event_ids, failed_event_ids) for this chunk
+        """
+        pending = list(chunk)
+
+        try:
+            for attempt in range(UNPROCESSED_MAX_RETRIES + 1):
+                if attempt:
+                    await asyncio.sleep(UNPROCESSED_BASE_DELAY * (2 ** (attempt - 1)))
+
+                # Prepare batch delete request
+                request_items = {
+                    self.table_name: [
+                        {"DeleteRequest": {"Key": {"event_id": event_id}}}
+                        for event_id in pending
+                    ]
+                }
+
+                # Execute batch delete
+                response = await asyncio.to_thread(
+                    self.dynamodb.meta.client.batch_write_item,
+                    RequestItems=request_items
+                )
+
+                # Collect unprocessed items for retry
+                unprocessed = response.get('UnprocessedItems', {}).get(self.table_name, [])
+                pending = [
+                    unprocessed_item['DeleteRequest']['Key']['event_id']
+                    for unprocessed_item in unprocessed
+                    if 'event_id' in unprocessed_item.get('DeleteRequest', {}).get('Key', {})
+                ]
+                if not pending:
+                    break
+
+            if pending:
+                logger.warning(
+                    f"Some items not deleted in chunk {chunk_idx}",
+                    unprocessed_count=len(pending),
+                    total_in_chunk=len(chunk),
+                    retries=UNPROCESSED_MAX_RETRIES,
+                    table_name=self.table_name
+                )
+
+            # Mark successful deletions
+            failed = set(pending)
+            processed_event_ids = [event_id for event_id in chunk if event_id not in failed]
+
+            logger.info(
+                f"Processed batch delete chunk {chunk_idx}",
+                chunk_size=len(chunk),
+                successful=len(processed_event_ids),
+                failed=len(pending),
+                table_name=self.table_name
+            )
+
+            return processed_event_ids, pending
+
+        except ClientError as e:
+            logger.error(
+                f"Failed to batch delete chunk {chunk_idx}",
+                chunk_size=len(chunk),
+                table_name=self.table_name,
+                error_code=e.response['Error']['Code'],
+                error_message=e.response['Error']['Message']
+            )
+            # Mark entire chunk as failed
+            return [], list(chunk)
+
+        except Exception as e:
+            logger.error(
+                f"Unexpected error in batch delete chunk {chunk_idx}",
+                chunk_size=len(chunk),
+                table_name=self.table_name,
+                error=str(e)
+            )
+            # Mark entire chunk as failed
+            return [], list(chunk)
+
     async def batch_get_events_by_idempotency_keys(
         self,
         user_id: Optional[str],
@@ -967,8 +1626,10 @@ class DynamoDBClient:
         Retrieve multiple events by user-scoped idempotency keys.
 
         Since DynamoDB doesn't support batch queries on GSIs, this method
-        makes individual queries for each key. Uses concurrent execution
-        for better performance when multiple keys are requested.
+        makes an exact-match IdempotencyIndex query for each distinct key.
+        The queries run concurrently, so the lookup takes about one round
+        trip and reads only the matching items. Found events are written to
+        the idempotency cache when one is configured.
 
         Args:
             user_id: User identifier (required for user-scoped deduplication)
@@ -978,6 +1639,7 @@ class DynamoDBClient:
             Dict mapping idempotency_key -> Event (only found events included)
 
         Raises:
+            ClientError: If a DynamoDB query fails
             ValueError: If parameters are invalid
         """
         if not isinstance(idempotency_keys, list):
@@ -1002,43 +1664,27 @@ class DynamoDBClient:
             )
             return {}
 
-        import asyncio
-        from typing import Dict
-
-        async def get_event_by_key(key: str) -> tuple[str, Optional[Event]]:
-            """Get event for a single idempotency key."""
-            try:
-                event = await self.get_event_by_idempotency_key(user_id, key)
-                return key, event
-            except Exception as e:
-                logger.warning(
-                    "Error checking idempotency key",
-                    user_id=user_id,
-                    idempotency_key=key,
-                    error=str(e)
-                )
-                return key, None
-
-        # Execute queries concurrently for better performance
-        tasks = [get_event_by_key(key) for key in idempotency_keys]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Execute one exact query per distinct key concurrently. A failed query
+        # propagates so callers do not mistake it for a missing key and create
+        # a duplicate.
+        keys = list(dict.fromkeys(idempotency_keys))
+        found = await asyncio.gather(
+            *(self.get_event_by_idempotency_key(user_id, key) for key in keys)
+        )
 
         # Build result dictionary
-        events_by_key: Dict[str, Event] = {}
-        for result in results:
-            if isinstance(result, tuple) and len(result) == 2:
-                key, event = result
-                if event is not None:
-                    events_by_key[key] = event
-            elif isinstance(result, Exception):
-                logger.error(
-                    "Exception during idempotency key lookup",
-                    error=str(result)
-                )
+        events_by_key: Dict[str, Event] = {
+            key: event for key, event in zip(keys, found) if event is not None
+        }
+
+        if self.idempotency_cache is not None and events_by_key:
+            await asyncio.gather(
+                *(self.idempotency_cache.set(event) for event in events_by_key.values())
+            )
 
         logger.info(
             "Batch idempotency key lookup completed",
-            requested=len(idempotency_keys),
+            requested=len(keys),
             found=len(events_by_key),
             user_id=user_id,
             table_name=self.table_name
@@ -7,6 +7,7 @@ to filter events by payload, metadata, dates, and other fields with various oper
 
 Key Components:
 - parse_filter_params(): Extract filter conditions from query parameters
+- parse_filter_query(): Cached parse of a raw query string into filters and status
 - build_dynamodb_filter(): Build DynamoDB FilterExpression and AttributeValues
 - Support for nested JSON paths (payload.customer.email)
 - Support for comparison operators (gt, gte, lt, lte, ne, contains, startswith)
@@ -15,7 +16,11 @@ Author: Triggers API Team
 """
 
 import re
-from typing import Dict, Any, Optional, Tuple
+from functools import lru_cache
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Dict, Any, Iterable, Mapping, Optional, Tuple, Union
+from urllib.parse import parse_qsl
 from datetime import datetime, timezone
 
 from utils.logger import get_logger
@@ -53,12 +58,15 @@ class EventFilter:
         return f"EventFilter(field='{self.field}', operator='{self.operator}', value={self.value})"
 
 
-def parse_filter_params(query_params: Dict[str, Any]) -> Dict[str, EventFilter]:
+def parse_filter_params(
+    query_params: Union[Mapping[str, Any], Iterable[Tuple[str, Any]]]
+) -> Dict[str, EventFilter]:
     """
     Parse query parameters into EventFilter objects.
 
     Args:
-        query_params: Dictionary of query parameters from the request
+        query_params: Mapping of query parameters, or (key, value) pairs in
+            query-string order (later values for the same field win)
 
     Returns:
         Dictionary mapping field names to EventFilter objects
@@ -73,7 +81,8 @@ def parse_filter_params(query_params: Dict[str, Any]) -> Dict[str, EventFilter]:
     # Reserved parameters that should not be treated as filters
     reserved_params = {'status', 'limit', 'cursor'}
 
-    for param_key, param_value in query_params.items():
+    items = query_params.items() if isinstance(query_params, Mapping) else query_params
+    for param_key, param_value in items:
         # Skip reserved parameters
         if param_key in reserved_params:
             continue
@@ -93,6 +102,59 @@ def parse_filter_params(query_params: Dict[str, Any]) -> Dict[str, EventFilter]:
     return filters
 
 
+# Parameters that select a page rather than events; they never change the parsed
+# filters, so they are left out of the cache key
+_PAGINATION_PARAMS = frozenset({'limit', 'cursor'})
+
+
+def parse_filter_query(query_string: str) -> Tuple[Mapping[str, EventFilter], Optional[str]]:
+    """
+    Parse a raw query string into filters and the status filter, with caching.
+
+    Clients polling with the same filter send the same filter parameters, so
+    the parsed result is cached on them. The cache key leaves out pagination
+    parameters and ignores parameter order, so every page of a listing (each
+    with a new cursor) reuses one entry. The returned mapping is read-only
+    because it is shared between requests. Invalid filter parameters are
+    logged only the first time a filter shape is parsed.
+
+    Args:
+        query_string: Raw URL query string (e.g. 'status=pending&payload.order_id=123')
+
+    Returns:
+        Tuple of (read-only mapping of field names to EventFilter objects,
+        status query parameter or None if absent)
+
+    Examples:
+        >>> filters, status = parse_filter_query('status=pending&payload.order_id=123')
+        >>> status
+        'pending'
+    """
+    # Same parsing as Starlette's QueryParams. The sort is stable, so repeated
+    # keys keep their relative order and the last value still wins.
+    filter_items = tuple(sorted(
+        (
+            (key, value)
+            for key, value in parse_qsl(query_string, keep_blank_values=True)
+            if key not in _PAGINATION_PARAMS
+        ),
+        key=itemgetter(0)
+    ))
+    return _parse_filter_items(filter_items)
+
+
+@lru_cache(maxsize=1024)
+def _parse_filter_items(
+    filter_items: Tuple[Tuple[str, str], ...]
+) -> Tuple[Mapping[str, EventFilter], Optional[str]]:
+    """Parse canonical (key, value) pairs into filters and status (cached)."""
+    status = None
+    for key, value in filter_items:
+        if key == 'status':
+            status = value
+    return MappingProxyType(parse_filter_params(filter_items)), status
+
+
 def _parse_param_key(param_key: str) -> Tuple[str, str]:
     """
     Parse a parameter key into field and operator.
@@ -7,18 +7,26 @@ Provides consistent logging across all modules with proper context
 and structured data.
 
 Key Components:
-- JSON output for CloudWatch compatibility
+- JSON output for CloudWatch compatibility, rendered to bytes with orjson
 - Timestamp and log level processors
+- Level filtering from the LOG_LEVEL environment variable
 - Context binding helpers
 - get_logger() helper function
 
-Dependencies: structlog, datetime
+Dependencies: structlog, orjson, logging, os, datetime
 Author: Triggers API Team
 """
 
+import logging
+import os
+import orjson
 import structlog
 from datetime import datetime, timezone
 
+# Minimum level to emit, read from the same LOG_LEVEL variable as settings.log_level.
+# Calls below this level return before any processor or JSON rendering runs.
+_LOG_LEVEL = getattr(logging, os.environ.get("LOG_LEVEL", "INFO").upper(), logging.INFO)
+
 
 def _add_timestamp(logger, method_name, event_dict):
     """
@@ -60,13 +68,15 @@ structlog.configure(
         _add_log_level,
         # Add exception information
         structlog.processors.format_exc_info,
-        # Render as JSON for CloudWatch compatibility
-        structlog.processors.JSONRenderer(),
+        # Render as JSON for CloudWatch compatibility; orjson returns bytes,
+        # which are written straight to stdout without a str round-trip
+        structlog.processors.JSONRenderer(serializer=orjson.dumps),
     ],
-    # Use standard library logger factory for compatibility
-    logger_factory=structlog.WriteLoggerFactory(),
-    # Enable context binding
-    wrapper_class=structlog.BoundLogger,
+    # Rendering stays synchronous: Lambda freezes the container after each
+    # response, so a background writer thread could lose buffered records
+    logger_factory=structlog.BytesLoggerFactory(),
+    # Enable context binding and drop records below LOG_LEVEL up front
+    wrapper_class=structlog.make_filtering_bound_logger(_LOG_LEVEL),
     # Cache logger on first use for performance
     cache_logger_on_first_use=True,
 )
@@ -8,39 +8,99 @@ event ingestion rates, delivery success, and API performance.
 Key Components:
 - MetricsClient: CloudWatch metrics client
 - put_metric(): Publish individual metrics
+- put_metrics(): Publish many data points in one PutMetricData call
+- enqueue_metric()/enqueue_metrics(): Buffer metrics for a background flush
+- flush(): Publish everything buffered so far, compacting repeated data points
 - Graceful error handling for metrics failures
 - Structured logging for metric operations
 
-Dependencies: boto3, typing, logger
+Dependencies: boto3, asyncio, datetime, typing, logger
 Author: Triggers API Team
 """
 
+import asyncio
 import boto3
-from typing import Optional
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
 
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# PutMetricData accepts at most 1000 data points per call
+MAX_METRIC_DATA_PER_CALL = 1000
+
+# A single data point can carry at most 150 distinct Values
+MAX_VALUES_PER_DATUM = 150
+
+# Buffered metrics: at most this many pending, published every flush interval
+METRICS_QUEUE_MAXSIZE = 10000
+METRICS_FLUSH_INTERVAL_SECONDS = 5.0
+
 
 class MetricsClient:
-    """CloudWatch metrics client."""
+    """
+    CloudWatch metrics client.
+
+    put_metric()/put_metrics() publish synchronously. Request handlers use
+    enqueue_metric()/enqueue_metrics() instead, which only append to an
+    in-memory queue; a background task on the running event loop publishes
+    the queue every flush interval, so CloudWatch latency never sits on the
+    request path. Each buffered data point carries its enqueue time as the
+    CloudWatch Timestamp, so late publishing does not shift it.
+
+    On Lambda the event loop is frozen between invocations, so the Lambda
+    handler calls flush() at the end of every invocation instead of relying
+    on the background task.
+    """
 
-    def __init__(self, namespace: str = "TriggersAPI"):
+    def __init__(
+        self,
+        namespace: str = "TriggersAPI",
+        flush_interval_seconds: float = METRICS_FLUSH_INTERVAL_SECONDS
+    ):
         """
         Initialize metrics client.
 
         Args:
             namespace: CloudWatch metrics namespace
+            flush_interval_seconds: Delay between background publishes of
+                buffered metrics
         """
         self.namespace = namespace
         self.cloudwatch = boto3.client('cloudwatch')
+        self.flush_interval_seconds = flush_interval_seconds
+        self._queue: Optional[asyncio.Queue] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
 
         logger.info(
             "Metrics client initialized",
             namespace=namespace
         )
 
+    @staticmethod
+    def _metric_datum(
+        metric_name: str,
+        value: float,
+        unit: str = 'Count',
+        dimensions: Optional[dict] = None
+    ) -> Dict[str, Any]:
+        """Build a single PutMetricData entry."""
+        metric_data = {
+            'MetricName': metric_name,
+            'Value': value,
+            'Unit': unit
+        }
+
+        if dimensions:
+            metric_data['Dimensions'] = [
+                {'Name': k, 'Value': v}
+                for k, v in dimensions.items()
+            ]
+
+        return metric_data
+
     def put_metric(
         self,
         metric_name: str,
@@ -58,17 +118,7 @@ class MetricsClient:
             dimensions: Optional metric dimensions
         """
         try:
-            metric_data = {
-                'MetricName': metric_name,
-                'Value': value,
-                'Unit': unit
-            }
-
-            if dimensions:
-                metric_data['Dimensions'] = [
-                    {'Name': k, 'Value': v}
-                    for k, v in dimensions.items()
-                ]
+            metric_data = self._metric_datum(metric_name, value, unit, dimensions)
 
             self.cloudwatch.put_metric_data(
                 Namespace=self.namespace,
@@ -93,3 +143,175 @@ class MetricsClient:
                 error=str(e),
                 namespace=self.namespace
             )
+
+    def put_metrics(self, metrics: List[Dict[str, Any]]) -> None:
+        """
+        Publish multiple metrics to CloudWatch with as few calls as possible.
+
+        Each entry takes the same keys as put_metric() (metric_name, value,
+        and optionally unit and dimensions). Entries are sent in chunks of
+        1000, the PutMetricData limit.
+
+        Args:
+            metrics: List of metric dicts to publish
+        """
+        if not metrics:
+            return
+
+        self._publish([self._metric_datum(**metric) for metric in metrics])
+
+    def _publish(self, metric_data: List[Dict[str, Any]]) -> None:
+        """Send prepared data points in PutMetricData-sized chunks, logging failures."""
+        try:
+            for start in range(0, len(metric_data), MAX_METRIC_DATA_PER_CALL):
+                self.cloudwatch.put_metric_data(
+                    Namespace=self.namespace,
+                    MetricData=metric_data[start:start + MAX_METRIC_DATA_PER_CALL]
+                )
+
+            logger.debug(
+                "Metrics published to CloudWatch",
+                count=len(metric_data),
+                namespace=self.namespace
+            )
+
+        except Exception as e:
+            # Don't fail request if metrics fail
+            logger.warning(
+                "Failed to publish metrics",
+                count=len(metric_data),
+                error=str(e),
+                namespace=self.namespace
+            )
+
+    def _ensure_flusher(self) -> asyncio.Queue:
+        """Return the queue for the running loop, starting its flush task if needed."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._flush_task is None or self._flush_task.done():
+            if self._loop is not loop:
+                self._queue = asyncio.Queue(maxsize=METRICS_QUEUE_MAXSIZE)
+            self._loop = loop
+            self._flush_task = loop.create_task(self._flush_periodically())
+        return self._queue
+
+    async def _flush_periodically(self) -> None:
+        """Background task: publish buffered metrics every flush interval."""
+        while True:
+            await asyncio.sleep(self.flush_interval_seconds)
+            await self.flush()
+
+    def enqueue_metric(
+        self,
+        metric_name: str,
+        value: float,
+        unit: str = 'Count',
+        dimensions: Optional[dict] = None
+    ) -> None:
+        """
+        Buffer a metric for background publishing. Must be called from async code.
+
+        Never blocks; when the buffer is full the metric is dropped with a
+        warning.
+
+        Args:
+            metric_name: Name of the metric
+            value: Metric value
+            unit: Metric unit (Count, Seconds, etc.)
+            dimensions: Optional metric dimensions
+        """
+        self.enqueue_metrics([{
+            'metric_name': metric_name,
+            'value': value,
+            'unit': unit,
+            'dimensions': dimensions
+        }])
+
+    def enqueue_metrics(self, metrics: List[Dict[str, Any]]) -> None:
+        """
+        Buffer multiple metrics for background publishing.
+
+        Each entry takes the same keys as put_metric(). Must be called from
+        async code.
+
+        Args:
+            metrics: List of metric dicts to buffer
+        """
+        if not metrics:
+            return
+
+        queue = self._ensure_flusher()
+        timestamp = datetime.now(timezone.utc)
+        for metric in metrics:
+            metric_data = self._metric_datum(**metric)
+            metric_data['Timestamp'] = timestamp
+            try:
+                queue.put_nowait(metric_data)
+            except asyncio.QueueFull:
+                logger.warning(
+                    "Metrics buffer full, dropping metric",
+                    metric_name=metric['metric_name'],
+                    namespace=self.namespace
+                )
+
+    async def flush(self) -> None:
+        """
+        Publish every buffered metric now.
+
+        Called by the background task, at the end of each Lambda invocation
+        and on application shutdown. The CloudWatch calls run in the default
+        thread pool.
+        """
+        if self._queue is None or self._queue.empty():
+            return
+
+        metric_data = []
+        while not self._queue.empty():
+            metric_data.append(self._queue.get_nowait())
+
+        await asyncio.get_running_loop().run_in_executor(
+            None, self._publish, self._compact(metric_data)
+        )
+
+    @staticmethod
+    def _compact(metric_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Merge buffered data points that CloudWatch would aggregate anyway.
+
+        Data points with the same name, unit and dimensions enqueued within
+        the same minute (CloudWatch's standard resolution) are sent as one
+        entry with Values/Counts, e.g. a hundred EventDelivered counts for
+        one event type become a single entry. Statistics (Sum, SampleCount,
+        etc.) are unchanged.
+
+        Args:
+            metric_data: Buffered PutMetricData entries, each with a Timestamp
+
+        Returns:
+            Compacted PutMetricData entries
+        """
+        groups: Dict[tuple, Dict[str, Any]] = {}
+        for datum in metric_data:
+            key = (
+                datum['MetricName'],
+                datum['Unit'],
+                tuple((d['Name'], d['Value']) for d in datum.get('Dimensions', ())),
+                datum['Timestamp'].replace(second=0, microsecond=0)
+            )
+            group = groups.get(key)
+            if group is None:
+                group = groups[key] = {'datum': datum, 'counts': {}}
+            counts = group['counts']
+            counts[datum['Value']] = counts.get(datum['Value'], 0) + 1
+
+        compacted = []
+        for group in groups.values():
+            datum = group['datum']
+            counts = list(group['counts'].items())
+            for start in range(0, len(counts), MAX_VALUES_PER_DATUM):
+                chunk = counts[start:start + MAX_VALUES_PER_DATUM]
+                entry = {k: v for k, v in datum.items() if k != 'Value'}
+                entry['Values'] = [value for value, _ in chunk]
+                entry['Counts'] = [float(count) for _, count in chunk]
+                compacted.append(entry)
+
+        return compacted
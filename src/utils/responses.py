@@ -0,0 +1,40 @@
+"""
+Module: responses.py
+Description: Response classes for the Triggers API.
+
+Key Components:
+- SafeORJSONResponse: orjson-rendered JSON response that falls back to
+  stdlib json for content orjson cannot encode
+
+Dependencies: fastapi, typing
+Author: Triggers API Team
+"""
+
+from typing import Any
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+
+class SafeORJSONResponse(ORJSONResponse):
+    """
+    ORJSONResponse with a stdlib json fallback.
+
+    orjson renders response bodies faster than the stdlib, but raises
+    TypeError for integers beyond 64 bits, which event payloads may carry.
+    Such bodies are rendered with JSONResponse instead of failing the request.
+    """
+
+    def render(self, content: Any) -> bytes:
+        """
+        Render content as JSON bytes.
+
+        Args:
+            content: JSON-compatible response content
+
+        Returns:
+            Encoded response body
+        """
+        try:
+            return super().render(content)
+        except TypeError:
+            return JSONResponse.render(self, content)
@@ -0,0 +1,95 @@
+"""
+Module: test_push.py
+Description: Unit tests for the push delivery client.
+
+Tests PushDeliveryClient delivery outcomes against an httpx
+MockTransport, checks that deliveries share one pooled client, and
+that warmup never sends a request to the webhook.
+"""
+
+import httpx
+import pytest
+from datetime import datetime, timezone
+
+from src.delivery import push as push_module
+
+
+def _make_event():
+    """Build an Event of the class the delivery module checks against."""
+    return push_module.Event(
+        event_id="evt_abc123def456",
+        event_type="order.created",
+        payload={"order_id": "12345"},
+        metadata={},
+        status="pending",
+        created_at=datetime.now(timezone.utc),
+        delivery_attempts=0
+    )
+
+
+class TestPushDeliveryClient:
+    """Test cases for PushDeliveryClient."""
+
+    @pytest.mark.asyncio
+    async def test_deliveries_reuse_one_http_client(self):
+        """Test that repeated deliveries go through the same AsyncClient."""
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, stream=httpx.ByteStream(b"{}"))
+
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        client = push_module.PushDeliveryClient(
+            "https://hooks.example.com/catch",
+            http_client=http_client
+        )
+
+        assert await client.deliver_event(_make_event()) is True
+        assert await client.deliver_event(_make_event()) is True
+
+        assert len(requests) == 2
+        assert client.http_client is http_client
+        assert not http_client.is_closed
+
+        await client.aclose()
+        assert http_client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_http_error_returns_false(self):
+        """Test that a non-2xx webhook response is reported as a failed delivery."""
+        http_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(503))
+        )
+        client = push_module.PushDeliveryClient(
+            "https://hooks.example.com/catch",
+            http_client=http_client
+        )
+
+        assert await client.deliver_event(_make_event()) is False
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_warmup_sends_no_webhook_request(self, monkeypatch):
+        """Test that warmup resolves the webhook host without triggering a delivery."""
+        requests = []
+        lookups = []
+        http_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: requests.append(request))
+        )
+        client = push_module.PushDeliveryClient(
+            "https://hooks.example.com/catch",
+            http_client=http_client
+        )
+
+        async def getaddrinfo(self, host, port, **kwargs):
+            lookups.append((host, port))
+            return []
+
+        monkeypatch.setattr(type(push_module.asyncio.get_running_loop()), "getaddrinfo", getaddrinfo)
+
+        await client.warmup()
+
+        assert lookups == [("hooks.example.com", 443)]
+        assert requests == []
+        await client.aclose()
@@ -8,7 +8,8 @@ and error handling scenarios.
 """
 
 import pytest
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
+from botocore.exceptions import ClientError
 from fastapi import HTTPException
 from fastapi.testclient import TestClient
 from datetime import datetime, timezone
@@ -19,6 +20,16 @@ from src.models.response import EventResponse
 from src.storage.dynamodb import DynamoDBClient
 
 
+@pytest.fixture(autouse=True)
+def exhausted_replay_cache(monkeypatch):
+    """Give each test an empty exhausted-replay cache instead of the module-level one."""
+    from src.handlers import events as events_module
+
+    cache = events_module.ExhaustedReplayCache()
+    monkeypatch.setattr(events_module, "exhausted_replay_cache", cache)
+    return cache
+
+
 class TestEventHandlers:
     """Test cases for event handler endpoints."""
 
@@ -349,46 +360,54 @@ class TestEventHandlers:
 
     @pytest.mark.asyncio
     async def test_acknowledge_event_success(self, db_client):
-        """Test acknowledge_event function with valid event."""
+        """Test acknowledge_event marks the event delivered with one conditional update."""
         from src.handlers.events import acknowledge_event
-        from src.models.event import Event
+        from src.handlers import events as events_module
 
-        # Create mock event
-        mock_event = Event(
-            event_id="evt_test123456",
+        # Event as stored after the update
+        updated_event = events_module.Event(
+            event_id="evt_abc123xyz456",
             event_type="order.created",
             payload={"order_id": "123"},
-            status="pending",
+            status="delivered",
             created_at=datetime(2024, 1, 15, 10, 30, 1, tzinfo=timezone.utc),
-            delivered_at=None,
+            delivered_at=datetime(2024, 1, 15, 10, 31, 0, tzinfo=timezone.utc),
             delivery_attempts=0
         )
 
-        with patch.object(db_client, 'get_event', new_callable=AsyncMock, return_value=mock_event):
-            with patch.object(db_client, 'update_event', new_callable=AsyncMock) as mock_update:
+        with patch.object(db_client, 'get_event', new_callable=AsyncMock) as mock_get:
+            with patch.object(
+                db_client, 'update_event_attributes',
+                new_callable=AsyncMock, return_value=updated_event
+            ) as mock_update:
                 # Call acknowledge_event
-                result = await acknowledge_event("evt_test123456", db_client)
+                result = await acknowledge_event("evt_abc123xyz456", db_client, MagicMock())
 
                 # Should return None (204 No Content)
                 assert result is None
 
-                # Verify update_event was called
-                mock_update.assert_called_once()
-                updated_event = mock_update.call_args[0][0]
-
-                # Verify event was updated
-                assert updated_event.status == "delivered"
-                assert updated_event.delivered_at is not None
-                assert updated_event.delivery_attempts == 1
+                # No read before the write
+                mock_get.assert_not_called()
+                event_id, updates = mock_update.call_args.args
+                assert event_id == "evt_abc123xyz456"
+                assert updates["status"] == "delivered"
+                assert updates["delivered_at"] is not None
 
     @pytest.mark.asyncio
     async def test_acknowledge_event_not_found(self, db_client):
         """Test acknowledge_event function with non-existent event."""
         from src.handlers.events import acknowledge_event
 
-        with patch.object(db_client, 'get_event', new_callable=AsyncMock, return_value=None):
+        condition_failed = ClientError(
+            error_response={'Error': {'Code': 'ConditionalCheckFailedException', 'Message': 'failed'}},
+            operation_name='UpdateItem'
+        )
+        with patch.object(
+            db_client, 'update_event_attributes',
+            new_callable=AsyncMock, side_effect=condition_failed
+        ):
             with pytest.raises(HTTPException) as exc_info:
-                await acknowledge_event("evt_nonexistent", db_client)
+                await acknowledge_event("evt_nonexistent", db_client, MagicMock())
 
             assert exc_info.value.status_code == 404
             assert "Event evt_nonexistent not found" in exc_info.value.detail
@@ -397,30 +416,214 @@ class TestEventHandlers:
     async def test_acknowledge_event_database_error(self, db_client):
         """Test acknowledge_event function with database error."""
         from src.handlers.events import acknowledge_event
-        from src.models.event import Event
 
-        mock_event = Event(
-            event_id="evt_test123456",
+        with patch.object(
+            db_client, 'update_event_attributes',
+            new_callable=AsyncMock, side_effect=Exception("DB error")
+        ):
+            with pytest.raises(HTTPException) as exc_info:
+                await acknowledge_event("evt_test123456", db_client, MagicMock())
+
+            assert exc_info.value.status_code == 500
+            assert "Failed to acknowledge event" in exc_info.value.detail
+
+    @pytest.mark.asyncio
+    async def test_update_event_other_users_event_forbidden(self):
+        """Test update_event maps a failed ownership condition on an existing event to 403."""
+        from src.handlers import events as events_module
+        from src.models.request import UpdateEventRequest
+
+        db = MagicMock()
+        db.get_event = AsyncMock()
+        db.update_event_attributes = AsyncMock(side_effect=ClientError(
+            error_response={
+                'Error': {'Code': 'ConditionalCheckFailedException', 'Message': 'failed'},
+                'Item': {'event_id': 'evt_abc123xyz456', 'user_id': 'other_user'}
+            },
+            operation_name='UpdateItem'
+        ))
+
+        with patch.object(events_module, 'get_user_id_from_request', return_value="user_123"):
+            with pytest.raises(HTTPException) as exc_info:
+                await events_module.update_event(
+                    "evt_abc123xyz456",
+                    UpdateEventRequest(payload={"order_id": "1"}),
+                    MagicMock(),
+                    db,
+                    MagicMock()
+                )
+
+        assert exc_info.value.status_code == 403
+        db.get_event.assert_not_called()
+        assert db.update_event_attributes.call_args.kwargs == {'expected_user_id': 'user_123'}
+
+
+class TestReplayEventHandler:
+    """Test cases for single event replay."""
+
+    @pytest.mark.asyncio
+    async def test_replay_event_store_failure_fails_before_queueing(self):
+        """Test that a failed state write fails the replay and queues no retry."""
+        from src.handlers import events as events_module
+
+        event = events_module.Event(
+            event_id="evt_abc123xyz456",
             event_type="order.created",
             payload={"order_id": "123"},
-            status="pending",
+            status="failed",
             created_at=datetime(2024, 1, 15, 10, 30, 1, tzinfo=timezone.utc),
-            delivered_at=None,
-            delivery_attempts=0
+            delivery_attempts=3
         )
+        db = MagicMock()
+        db.claim_replay = AsyncMock(return_value=event)
+        db.update_event_fields = AsyncMock(side_effect=Exception("DB error"))
+        delivery = MagicMock()
+        delivery.deliver_event = AsyncMock(return_value=False)
+        sqs = MagicMock()
+        sqs.batcher.send = AsyncMock(return_value=None)
 
-        with patch.object(db_client, 'get_event', new_callable=AsyncMock, return_value=mock_event):
-            with patch.object(db_client, 'update_event', side_effect=Exception("DB error")):
-                with pytest.raises(HTTPException) as exc_info:
-                    await acknowledge_event("evt_test123456", db_client)
+        with pytest.raises(HTTPException) as exc_info:
+            await events_module.replay_event("evt_abc123xyz456", None, db, delivery, sqs)
+
+        assert exc_info.value.status_code == 500
+        db.claim_replay.assert_awaited_once_with("evt_abc123xyz456", events_module.MAX_REPLAY_ATTEMPTS)
+        db.update_event_fields.assert_awaited_once()
+        sqs.batcher.send.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_replay_event_queues_retry_after_store(self):
+        """Test that a failed delivery stores the pending state and then queues the retry."""
+        from src.handlers import events as events_module
+
+        event = events_module.Event(
+            event_id="evt_abc123xyz457",
+            event_type="order.created",
+            payload={"order_id": "123"},
+            status="failed",
+            created_at=datetime(2024, 1, 15, 10, 30, 1, tzinfo=timezone.utc),
+            delivery_attempts=3
+        )
+        calls = []
+        db = MagicMock()
+        db.claim_replay = AsyncMock(return_value=event)
+        db.update_event_fields = AsyncMock(side_effect=lambda *args, **kwargs: calls.append("store"))
+        delivery = MagicMock()
+        delivery.deliver_event = AsyncMock(return_value=False)
+        sqs = MagicMock()
+        sqs.batcher.send = AsyncMock(side_effect=lambda **kwargs: calls.append("queue"))
+
+        response = await events_module.replay_event("evt_abc123xyz457", None, db, delivery, sqs)
+
+        assert response.status == "pending"
+        assert response.delivery_attempts == 3
+        assert calls == ["store", "queue"]
+
+    @pytest.mark.asyncio
+    async def test_replay_event_over_limit_rejected(self):
+        """Test that a failed attempt claim on an existing event returns 400."""
+        from src.handlers import events as events_module
+
+        db = MagicMock()
+        db.claim_replay = AsyncMock(side_effect=ClientError(
+            {"Error": {"Code": "ConditionalCheckFailedException"}, "Item": {"event_id": {"S": "evt_exhausted001"}}},
+            "UpdateItem"
+        ))
+
+        with pytest.raises(HTTPException) as exc_info:
+            await events_module.replay_event("evt_exhausted001", None, db, MagicMock(), MagicMock())
+
+        assert exc_info.value.status_code == 400
+        # A retry is answered from the exhausted cache without another claim
+        with pytest.raises(HTTPException):
+            await events_module.replay_event("evt_exhausted001", None, db, MagicMock(), MagicMock())
+        db.claim_replay.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_replay_after_delete_returns_not_found(self, exhausted_replay_cache):
+        """Test that deleting an exhausted event drops it from the cache, so replays get 404."""
+        from src.handlers import events as events_module
+
+        exhausted_replay_cache.add("evt_exhausted002")
+        db = MagicMock()
+        db.delete_event = AsyncMock(return_value=None)
+        db.claim_replay = AsyncMock(side_effect=ClientError(
+            {"Error": {"Code": "ConditionalCheckFailedException"}},
+            "UpdateItem"
+        ))
+
+        with patch('src.handlers.events.get_user_id_from_request', return_value=None):
+            await events_module.delete_event("evt_exhausted002", MagicMock(), db)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await events_module.replay_event("evt_exhausted002", None, db, MagicMock(), MagicMock())
+
+        assert exc_info.value.status_code == 404
 
-                assert exc_info.value.status_code == 500
-                assert "Failed to acknowledge event" in exc_info.value.detail
+    @pytest.mark.asyncio
+    async def test_batch_delete_drops_exhausted_cache_entries(self, exhausted_replay_cache):
+        """Test that batch-deleted and already-deleted events are dropped from the exhausted cache."""
+        from src.handlers import events as events_module
+        from src.models.request import BatchDeleteEventRequest
+
+        event = events_module.Event(
+            event_id="evt_exhausted003",
+            event_type="order.created",
+            payload={"order_id": "123"},
+            status="failed",
+            created_at=datetime(2024, 1, 15, 10, 30, 1, tzinfo=timezone.utc),
+            user_id="user_123"
+        )
+        exhausted_replay_cache.add("evt_exhausted003")
+        exhausted_replay_cache.add("evt_exhausted004")
+        db = MagicMock()
+        db.batch_get_events = AsyncMock(return_value=[event])
+        db.batch_delete_events = AsyncMock(return_value={
+            "successful_event_ids": ["evt_exhausted003"],
+            "failed_event_ids": []
+        })
+        http_request = MagicMock()
+        http_request.url.query = ""
+        request = BatchDeleteEventRequest(event_ids=["evt_exhausted003", "evt_exhausted004"])
+
+        with patch('src.handlers.events.get_user_id_from_request', return_value="user_123"):
+            response = await events_module.batch_delete_events(request, http_request, db, MagicMock())
+
+        assert response.summary.successful == 2
+        assert "evt_exhausted003" not in exhausted_replay_cache
+        assert "evt_exhausted004" not in exhausted_replay_cache
 
 
 class TestBatchEventHandlers:
     """Test cases for batch event handler endpoints."""
 
+    @pytest.mark.asyncio
+    async def test_batch_create_reports_unprocessed_items(self):
+        """Test that an item with no storage outcome is reported as failed, not dropped."""
+        from src.handlers import events as events_module
+        from src.models.request import BatchCreateEventRequest, CreateEventRequest
+
+        request = BatchCreateEventRequest(events=[
+            CreateEventRequest(event_type="order.created", payload={"order_id": "1"}),
+            CreateEventRequest(event_type="order.created", payload={"order_id": "2"})
+        ])
+        db = MagicMock()
+        db.get_cached_events_by_idempotency_keys = AsyncMock(return_value={})
+        # Storage reports neither success nor failure for the events
+        db.batch_put_events = AsyncMock(return_value={"successful_event_ids": [], "failed_items": []})
+        db.batch_update_events = AsyncMock(return_value={"failed_items": []})
+        delivery = MagicMock()
+        delivery.deliver_event = AsyncMock(return_value=True)
+        sqs = MagicMock()
+        sqs.send_message_batch = AsyncMock(return_value={"successful_event_ids": [], "failed_event_ids": []})
+
+        with patch('src.handlers.events.get_user_id_from_request', return_value="user_123"):
+            response = await events_module.batch_create_events(request, MagicMock(), db, sqs, delivery, MagicMock())
+
+        assert [result.index for result in response.results] == [0, 1]
+        assert all(result.error.code == "INTERNAL_ERROR" for result in response.results)
+        assert response.summary.total == 2
+        assert response.summary.failed == 2
+
     @pytest.mark.asyncio
     async def test_batch_create_events_all_success(self, db_client, sqs_client, delivery_client, metrics_client):
         """Test successful batch creation of events."""
@@ -723,6 +926,46 @@ class TestBatchEventHandlers:
                 assert result.error.code == "NOT_FOUND"
                 assert response.summary.failed == 1
 
+    @pytest.mark.asyncio
+    async def test_batch_update_events_duplicate_event_id(self):
+        """Test that a repeated event_id is fetched once and only its first occurrence is applied."""
+        from src.models.request import BatchUpdateEventRequest
+        from src.handlers import events as events_module
+        from unittest.mock import AsyncMock, MagicMock
+
+        existing_event = events_module.Event(
+            event_id="evt_abc123xyz456",
+            event_type="order.created",
+            payload={"order_id": "123"},
+            status="delivered",
+            created_at=datetime(2024, 1, 15, 10, 30, 1, tzinfo=timezone.utc),
+            user_id="user123"
+        )
+        request = BatchUpdateEventRequest(events=[
+            {"event_id": "evt_abc123xyz456", "payload": {"order_id": "123", "amount": 150.00}},
+            {"event_id": "evt_abc123xyz456", "payload": {"order_id": "123", "amount": 175.00}}
+        ])
+
+        db = MagicMock()
+        db.batch_get_events = AsyncMock(return_value=[existing_event])
+        db.update_event_fields = AsyncMock()
+        sqs = MagicMock()
+        sqs.send_message_batch = AsyncMock(
+            return_value={"successful_event_ids": ["evt_abc123xyz456"], "failed_event_ids": []}
+        )
+
+        with patch('src.handlers.events.get_user_id_from_request', return_value="user123"):
+            response = await events_module.batch_update_events(request, MagicMock(), db, sqs, MagicMock())
+
+        db.batch_get_events.assert_awaited_once_with(["evt_abc123xyz456"])
+        db.update_event_fields.assert_awaited_once()
+        assert len(sqs.send_message_batch.await_args.args[0]) == 1
+        assert response.results[0].success
+        assert response.results[0].event.payload["amount"] == 150.00
+        assert response.results[1].error.code == "VALIDATION_ERROR"
+        assert response.summary.successful == 1
+        assert response.summary.failed == 1
+
     @pytest.mark.asyncio
     async def test_batch_delete_events_all_success(self, db_client, metrics_client):
         """Test successful batch deletion of events."""
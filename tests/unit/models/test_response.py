@@ -0,0 +1,35 @@
+"""
+Module: test_response.py
+Description: Unit tests for API response models.
+
+Tests construction helpers on the response models, including building
+an EventResponse from a stored Event.
+"""
+
+from datetime import datetime, timezone
+
+from src.models.event import Event
+from src.models.response import EventResponse
+
+
+class TestEventResponse:
+    """Test cases for EventResponse construction."""
+
+    def test_from_event_copies_event_fields(self):
+        """Test that from_event mirrors every Event field and adds the message."""
+        event = Event(
+            event_id="evt_abc123xyz456",
+            event_type="order.created",
+            payload={"order_id": "12345", "amount": 99.99},
+            metadata={"source": "test"},
+            status="delivered",
+            created_at=datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc),
+            delivered_at=datetime(2024, 1, 15, 10, 30, 1, tzinfo=timezone.utc),
+            delivery_attempts=1,
+            user_id="user_123",
+            idempotency_key="order-12345"
+        )
+
+        response = EventResponse.from_event(event, message="Event delivered")
+
+        assert response.model_dump() == {**event.model_dump(), "message": "Event delivered"}
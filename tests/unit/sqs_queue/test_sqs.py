@@ -0,0 +1,123 @@
+"""
+Module: test_sqs.py
+Description: Unit tests for the SQS client.
+
+Tests that SQSClient reuses one long-lived aioboto3 client (and its
+pooled connections) across calls and closes it on aclose(), that batch
+sends respect the SQS size limits and fail per chunk, and that
+SQSMessageBatcher coalesces concurrent sends into SendMessageBatch calls.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.sqs_queue import sqs as sqs_module
+
+
+class TestSQSClient:
+    """Test cases for SQSClient connection reuse."""
+
+    @pytest.mark.asyncio
+    async def test_calls_share_one_client_until_closed(self):
+        """Test that concurrent calls open the client once and aclose() releases it."""
+        sqs = MagicMock()
+        sqs.send_message = AsyncMock(return_value={"MessageId": "msg-1"})
+        sqs.send_message_batch = AsyncMock(
+            side_effect=lambda QueueUrl, Entries: {"Successful": [{"Id": e["Id"]} for e in Entries]}
+        )
+        client_context = MagicMock()
+        client_context.__aenter__ = AsyncMock(return_value=sqs)
+        client_context.__aexit__ = AsyncMock(return_value=None)
+
+        client = sqs_module.SQSClient("https://sqs.us-east-1.amazonaws.com/123456789012/inbox")
+        client.session = MagicMock()
+        client.session.client.return_value = client_context
+
+        await asyncio.gather(*(client.send_message(f"evt_{i}", {"i": i}) for i in range(3)))
+        result = await client.send_message_batch([(f"evt_{i}", '{"i": 1}') for i in range(12)])
+
+        client.session.client.assert_called_once_with('sqs', config=sqs_module.SQS_CLIENT_CONFIG)
+        assert len(result["successful_event_ids"]) == 12
+
+        await client.aclose()
+        client_context.__aexit__.assert_awaited_once()
+
+
+    @pytest.mark.asyncio
+    async def test_batch_chunks_by_size_and_reports_failed_chunk(self):
+        """Test that chunks respect the byte limit and a failed chunk only fails its own messages."""
+        big_body = '{"data": "' + "x" * (100 * 1024) + '"}'
+        calls = []
+
+        async def send_message_batch(QueueUrl, Entries):
+            calls.append(len(Entries))
+            if len(calls) == 2:
+                raise RuntimeError("BatchRequestTooLong")
+            return {"Successful": [{"Id": e["Id"]} for e in Entries]}
+
+        sqs = MagicMock()
+        sqs.send_message_batch = send_message_batch
+        client_context = MagicMock()
+        client_context.__aenter__ = AsyncMock(return_value=sqs)
+        client_context.__aexit__ = AsyncMock(return_value=None)
+
+        client = sqs_module.SQSClient("https://sqs.us-east-1.amazonaws.com/123456789012/inbox")
+        client.session = MagicMock()
+        client.session.client.return_value = client_context
+
+        result = await client.send_message_batch([(f"evt_{i}", big_body) for i in range(5)])
+
+        # 100 KB bodies: two fit under 256 KB per call
+        assert calls == [2, 2, 1]
+        assert result["successful_event_ids"] == ["evt_0", "evt_1", "evt_4"]
+        assert result["failed_event_ids"] == ["evt_2", "evt_3"]
+        await client.aclose()
+
+    def test_new_event_loop_closes_previous_client(self):
+        """Test that opening a client on a new loop closes the one from the previous loop."""
+        contexts = []
+
+        def make_client(*args, **kwargs):
+            sqs = MagicMock()
+            sqs.send_message = AsyncMock(return_value={"MessageId": "msg-1"})
+            context = MagicMock()
+            context.__aenter__ = AsyncMock(return_value=sqs)
+            context.__aexit__ = AsyncMock(return_value=None)
+            contexts.append(context)
+            return context
+
+        client = sqs_module.SQSClient("https://sqs.us-east-1.amazonaws.com/123456789012/inbox")
+        client.session = MagicMock()
+        client.session.client.side_effect = make_client
+
+        asyncio.run(client.send_message("evt_1", {"i": 1}))
+        asyncio.run(client.send_message("evt_2", {"i": 2}))
+
+        assert len(contexts) == 2
+        contexts[0].__aexit__.assert_awaited_once()
+        contexts[1].__aexit__.assert_not_awaited()
+
+class TestSQSMessageBatcher:
+    """Test cases for coalescing single sends."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_sends_share_batch_calls(self):
+        """Test that concurrent sends go out in one batch and rejections reach their sender."""
+        client = sqs_module.SQSClient("https://sqs.us-east-1.amazonaws.com/123456789012/inbox")
+        client.send_message_batch = AsyncMock(return_value={
+            "successful_event_ids": ["evt_0", "evt_2"],
+            "failed_event_ids": ["evt_1"]
+        })
+
+        outcomes = await asyncio.gather(
+            *(client.batcher.send(f"evt_{i}", '{"i": 1}') for i in range(3)),
+            return_exceptions=True
+        )
+
+        client.send_message_batch.assert_awaited_once()
+        assert [event_id for event_id, _ in client.send_message_batch.call_args.args[0]] == [
+            "evt_0", "evt_1", "evt_2"
+        ]
+        assert outcomes[0] is None and outcomes[2] is None
+        assert isinstance(outcomes[1], RuntimeError)
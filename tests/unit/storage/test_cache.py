@@ -0,0 +1,226 @@
+"""
+Module: test_cache.py
+Description: Unit tests for the idempotency and exhausted-replay caches.
+
+Tests IdempotencyCache get/get_many/set with a mocked asyncio Redis
+client. Covers cache hits, misses, round-tripping of datetimes, and
+graceful degradation when Redis errors. Also covers the in-process
+LocalIdempotencyCache tier: expiry, eviction and backend fall-through,
+and the ExhaustedReplayCache of event IDs.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from datetime import datetime, timezone
+
+from src.storage import cache as cache_module
+from src.storage.cache import (
+    ExhaustedReplayCache,
+    IdempotencyCache,
+    LocalIdempotencyCache,
+    create_idempotency_cache,
+)
+from src.models.event import Event
+
+
+def _make_event(**overrides) -> Event:
+    """Build a fully populated Event for cache tests."""
+    fields = dict(
+        event_id="evt_abc123def456",
+        event_type="order.created",
+        payload={"order_id": "12345", "amount": 99.99},
+        metadata={"source": "test"},
+        status="pending",
+        created_at=datetime.now(timezone.utc),
+        user_id="user_123",
+        idempotency_key="order-12345"
+    )
+    fields.update(overrides)
+    return Event(**fields)
+
+
+class TestIdempotencyCache:
+    """Test cases for IdempotencyCache operations."""
+
+    def test_create_cache_disabled_without_url(self):
+        """Test that no cache is created when Redis is not configured."""
+        assert create_idempotency_cache(None) is None
+        assert create_idempotency_cache("") is None
+
+    def test_invalid_ttl(self):
+        """Test that a non-positive TTL is rejected."""
+        with pytest.raises(ValueError, match="ttl_seconds must be positive"):
+            IdempotencyCache(MagicMock(), ttl_seconds=0)
+
+    @pytest.mark.asyncio
+    async def test_set_then_get_round_trip(self):
+        """Test that a cached event deserializes back to the same event."""
+        store = {}
+        redis_client = MagicMock()
+        redis_client.set = AsyncMock(side_effect=lambda k, v, ex: store.__setitem__(k, v))
+        redis_client.get = AsyncMock(side_effect=lambda k: store.get(k))
+
+        cache = IdempotencyCache(redis_client, ttl_seconds=60)
+        event = _make_event()
+
+        await cache.set(event)
+        assert redis_client.set.call_args.kwargs["ex"] == 60
+
+        cached = await cache.get("user_123", "order-12345")
+        assert cached is not None
+        assert cached.event_id == event.event_id
+        assert cached.payload == event.payload
+        assert cached.created_at == event.created_at
+
+    @pytest.mark.asyncio
+    async def test_set_skips_events_without_key(self):
+        """Test that events without an idempotency key are not cached."""
+        redis_client = MagicMock()
+        redis_client.set = AsyncMock()
+
+        cache = IdempotencyCache(redis_client)
+        await cache.set(_make_event(idempotency_key=None))
+
+        redis_client.set.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_returns_none_on_redis_error(self):
+        """Test that Redis failures are treated as cache misses."""
+        redis_client = MagicMock()
+        redis_client.get = AsyncMock(side_effect=ConnectionError("redis down"))
+
+        cache = IdempotencyCache(redis_client)
+
+        assert await cache.get("user_123", "order-12345") is None
+
+    @pytest.mark.asyncio
+    async def test_get_many_uses_single_pipeline(self):
+        """Test that batch lookups are pipelined and only return hits."""
+        event = _make_event()
+        populated = {}
+        writer = MagicMock()
+        writer.set = AsyncMock(side_effect=lambda k, v, ex: populated.__setitem__(k, v))
+        await IdempotencyCache(writer).set(event)
+
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[populated["idem:user_123:order-12345"], None])
+        redis_client = MagicMock()
+        redis_client.pipeline.return_value = pipe
+
+        cache = IdempotencyCache(redis_client)
+        hits = await cache.get_many([("user_123", "order-12345"), ("user_123", "other-key")])
+
+        redis_client.pipeline.assert_called_once()
+        assert pipe.get.call_count == 2
+        assert list(hits.keys()) == [("user_123", "order-12345")]
+        assert hits[("user_123", "order-12345")].event_id == event.event_id
+
+
+    @pytest.mark.asyncio
+    async def test_get_many_treats_corrupt_entry_as_miss(self):
+        """Test that an unparseable cached value is a miss, not a batch failure."""
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[b"not json"])
+        redis_client = MagicMock()
+        redis_client.pipeline.return_value = pipe
+
+        cache = IdempotencyCache(redis_client)
+
+        assert await cache.get_many([("user_123", "order-12345")]) == {}
+
+    @pytest.mark.asyncio
+    async def test_invalidate_deletes_key(self):
+        """Test that invalidation deletes the Redis entry for the pair."""
+        redis_client = MagicMock()
+        redis_client.delete = AsyncMock()
+
+        cache = IdempotencyCache(redis_client)
+        await cache.invalidate("user_123", "order-12345")
+        await cache.invalidate("user_123", None)
+
+        redis_client.delete.assert_awaited_once_with("idem:user_123:order-12345")
+
+
+class TestLocalIdempotencyCache:
+    """Test cases for the in-process LocalIdempotencyCache."""
+
+    @pytest.mark.asyncio
+    async def test_local_hit_skips_backend(self):
+        """Test that a locally cached event is served without touching the backend."""
+        backend = MagicMock()
+        backend.set = AsyncMock()
+        backend.get = AsyncMock()
+
+        cache = LocalIdempotencyCache(backend=backend)
+        event = _make_event()
+        await cache.set(event)
+
+        cached = await cache.get("user_123", "order-12345")
+        assert cached.event_id == event.event_id
+        backend.set.assert_awaited_once()
+        backend.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_entries_expire_and_evict(self, monkeypatch):
+        """Test TTL expiry and least-recently-used eviction."""
+        now = [1000.0]
+        monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+
+        cache = LocalIdempotencyCache(maxsize=2, ttl_seconds=60)
+        await cache.set(_make_event(idempotency_key="a"))
+        await cache.set(_make_event(idempotency_key="b"))
+        assert await cache.get("user_123", "a") is not None  # "b" is now least recent
+        await cache.set(_make_event(idempotency_key="c"))
+
+        assert await cache.get("user_123", "b") is None
+        assert await cache.get("user_123", "c") is not None
+
+        now[0] += 61
+        assert await cache.get("user_123", "a") is None
+
+    @pytest.mark.asyncio
+    async def test_get_many_sends_only_misses_to_backend(self):
+        """Test that batch lookups query the backend only for local misses."""
+        remote_event = _make_event(event_id="evt_remote000001", idempotency_key="remote")
+        backend = MagicMock()
+        backend.set = AsyncMock()
+        backend.get_many = AsyncMock(return_value={("user_123", "remote"): remote_event})
+
+        cache = LocalIdempotencyCache(backend=backend)
+        await cache.set(_make_event(idempotency_key="local"))
+
+        hits = await cache.get_many([("user_123", "local"), ("user_123", "remote")])
+
+        backend.get_many.assert_awaited_once_with([("user_123", "remote")])
+        assert set(hits) == {("user_123", "local"), ("user_123", "remote")}
+        # The backend hit is now served locally
+        assert await cache.get("user_123", "remote") is not None
+
+
+class TestExhaustedReplayCache:
+    """Test cases for the in-process exhausted replay cache."""
+
+    def test_entries_expire_and_evict(self, monkeypatch):
+        """Test that entries expire after the TTL and the oldest is evicted when full."""
+        now = [1000.0]
+        monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+        cache = ExhaustedReplayCache(maxsize=2, ttl_seconds=60)
+
+        cache.add("evt_a")
+        cache.add("evt_b")
+        cache.add("evt_c")
+
+        assert "evt_a" not in cache
+        assert "evt_b" in cache and "evt_c" in cache
+        now[0] += 61
+        assert "evt_c" not in cache
+
+    def test_discard_forgets_entry(self):
+        """Test that discard removes an entry and ignores unknown event IDs."""
+        cache = ExhaustedReplayCache(ttl_seconds=60)
+        cache.add("evt_a")
+
+        cache.discard("evt_a")
+        cache.discard("evt_unknown")
+
+        assert "evt_a" not in cache
@@ -8,7 +8,7 @@ and data serialization/deserialization.
 """
 
 import pytest
-from unittest.mock import patch, AsyncMock
+from unittest.mock import patch, AsyncMock, MagicMock
 from botocore.exceptions import ClientError
 from datetime import datetime, timezone
 from moto import mock_aws
@@ -87,13 +87,33 @@ class TestDynamoDBClient:
     async def test_put_event_dynamodb_error(self, db_client, sample_event_model):
         """Test put_event error handling."""
         # Mock DynamoDB table to raise an error
-        with patch.object(db_client.table, 'put_item', side_effect=ClientError(
+        with patch.object(db_client.dynamodb.meta.client, 'put_item', side_effect=ClientError(
             error_response={'Error': {'Code': 'ValidationException', 'Message': 'Test error'}},
             operation_name='PutItem'
         )):
             with pytest.raises(ClientError):
                 await db_client.put_event(sample_event_model)
 
+    @pytest.mark.asyncio
+    async def test_put_event_only_if_new_is_conditional(self, db_client):
+        """Test put_event(only_if_new=True) refuses to overwrite an existing event_id."""
+        # Build the event with the Event class the storage module validates against
+        from src.storage import dynamodb as dynamodb_module
+
+        event = dynamodb_module.Event(
+            event_id="evt_abc123xyz456",
+            event_type="order.created",
+            payload={"order_id": "12345"},
+            created_at=datetime.now(timezone.utc)
+        )
+
+        with patch.object(db_client.dynamodb.meta.client, 'put_item') as mock_put:
+            await db_client.put_event(event)
+            assert 'ConditionExpression' not in mock_put.call_args.kwargs
+
+            await db_client.put_event(event, only_if_new=True)
+            assert mock_put.call_args.kwargs['ConditionExpression'] == 'attribute_not_exists(event_id)'
+
     @pytest.mark.asyncio
     async def test_get_event_success(self, db_client, sample_event_model, mock_dynamodb_table):
         """Test successful event retrieval."""
@@ -148,7 +168,7 @@ class TestDynamoDBClient:
     async def test_get_event_dynamodb_error(self, db_client):
         """Test get_event error handling."""
         # Mock DynamoDB table to raise an error
-        with patch.object(db_client.table, 'get_item', side_effect=ClientError(
+        with patch.object(db_client.dynamodb.meta.client, 'get_item', side_effect=ClientError(
             error_response={'Error': {'Code': 'InternalServerError', 'Message': 'Test error'}},
             operation_name='GetItem'
         )):
@@ -312,6 +332,71 @@ class TestDynamoDBClient:
         with pytest.raises(ValueError, match="limit must be between 1 and 100"):
             await db_client.list_events(limit=150)
 
+    @pytest.mark.asyncio
+    async def test_list_events_filters_by_user_id(self, db_client):
+        """Test list_events pushes the user_id ownership filter into the query and scan."""
+        with patch.object(db_client.dynamodb.meta.client, 'query', return_value={'Items': []}) as mock_query, \
+                patch.object(db_client.dynamodb.meta.client, 'scan', return_value={'Items': []}) as mock_scan:
+            await db_client.list_events(status="pending", limit=10, user_id="user_123")
+            await db_client.list_events(limit=10, user_id="user_123")
+
+        query_kwargs = mock_query.call_args.kwargs
+        assert query_kwargs['FilterExpression'] == '#user_id = :user_id'
+        assert query_kwargs['ExpressionAttributeNames'] == {'#user_id': 'user_id', '#status': 'status'}
+        assert query_kwargs['ExpressionAttributeValues'] == {':user_id': 'user_123', ':status': 'pending'}
+        assert mock_scan.call_args.kwargs['FilterExpression'] == '#user_id = :user_id'
+        assert mock_scan.call_args.kwargs['ExpressionAttributeValues'] == {':user_id': 'user_123'}
+
+    @pytest.mark.asyncio
+    async def test_list_events_filters_by_max_delivery_attempts(self, db_client):
+        """Test list_events combines the owner and delivery-attempt conditions server-side."""
+        with patch.object(db_client.dynamodb.meta.client, 'scan', return_value={'Items': []}) as mock_scan:
+            await db_client.list_events(limit=10, user_id="user_123", max_delivery_attempts=10)
+
+        scan_kwargs = mock_scan.call_args.kwargs
+        assert scan_kwargs['FilterExpression'] == (
+            '#user_id = :user_id AND #delivery_attempts < :max_delivery_attempts'
+        )
+        assert scan_kwargs['ExpressionAttributeValues'] == {
+            ':user_id': 'user_123',
+            ':max_delivery_attempts': 10
+        }
+
+    @pytest.mark.asyncio
+    async def test_list_events_page_cuts_filtered_page_at_last_returned_event(self, db_client):
+        """Test that an over-full filtered page resumes right after its last returned event."""
+        from src.storage import dynamodb as dynamodb_module
+        from src.utils.filters import parse_filter_query
+
+        items = [
+            {
+                'event_id': f'evt_abc123xyz45{i}',
+                'event_type': 'order.created',
+                'payload': '{"source":"web"}',
+                'status': 'pending',
+                'created_at': f'2024-01-15T10:30:0{9 - i}+00:00',
+                'delivery_attempts': 0
+            }
+            for i in range(5)
+        ]
+        filters, _ = parse_filter_query('payload.source=web')
+        start_key = {'event_id': 'evt_x', 'status': 'pending', 'created_at': '2024-01-15T10:30:10+00:00'}
+
+        with patch.object(db_client.dynamodb.meta.client, 'query', return_value={'Items': items}) as mock_query:
+            events, next_cursor = await db_client.list_events_page(
+                status='pending', limit=2, cursor=dynamodb_module.encode_cursor(start_key),
+                filters=filters
+            )
+
+        assert mock_query.call_args.kwargs['TableName'] == db_client.table_name
+        assert mock_query.call_args.kwargs['ExclusiveStartKey'] == start_key
+        assert [e.event_id for e in events] == ['evt_abc123xyz450', 'evt_abc123xyz451']
+        assert dynamodb_module.decode_cursor(next_cursor) == {
+            'event_id': 'evt_abc123xyz451',
+            'status': 'pending',
+            'created_at': '2024-01-15T10:30:08+00:00'
+        }
+
     @pytest.mark.asyncio
     async def test_list_events_invalid_cursor(self, db_client):
         """Test list_events with invalid cursor."""
@@ -341,6 +426,181 @@ class TestDynamoDBClient:
         assert item['delivery_attempts'] == 1
         assert 'delivered_at' in item
 
+    @pytest.mark.asyncio
+    async def test_list_events_page_rejects_cursor_of_other_listing(self, db_client):
+        """Test that a scan cursor reused for a status query is rejected before reaching DynamoDB."""
+        from src.storage import dynamodb as dynamodb_module
+
+        scan_cursor = dynamodb_module.encode_cursor({'event_id': 'evt_abc123xyz456'})
+
+        with patch.object(db_client.dynamodb.meta.client, 'query') as mock_query:
+            with pytest.raises(ValueError, match="Invalid pagination cursor"):
+                await db_client.list_events_page(status="pending", cursor=scan_cursor)
+
+        mock_query.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_update_event_fields_writes_only_named_fields(self, db_client):
+        """Test update_event_fields sets/removes just the named fields under an ownership condition."""
+        from src.storage import dynamodb as dynamodb_module
+
+        event = dynamodb_module.Event(
+            event_id="evt_abc123xyz456",
+            event_type="order.created",
+            payload={"order_id": "12345"},
+            metadata=None,
+            status="pending",
+            created_at=datetime.now(timezone.utc),
+            user_id="user_123"
+        )
+
+        with patch.object(db_client.dynamodb.meta.client, 'update_item') as mock_update:
+            await db_client.update_event_fields(
+                event, ["payload", "metadata", "status"], expected_user_id="user_123"
+            )
+
+        kwargs = mock_update.call_args.kwargs
+        assert kwargs['Key'] == {'event_id': 'evt_abc123xyz456'}
+        assert kwargs['UpdateExpression'] == 'SET #f0 = :v0, #f2 = :v2 REMOVE #f1'
+        assert kwargs['ExpressionAttributeValues'][':v0'] == '{"order_id": "12345"}'
+        assert kwargs['ExpressionAttributeValues'][':v2'] == 'pending'
+        assert kwargs['ConditionExpression'] == (
+            'attribute_exists(#event_id) AND #user_id = :expected_user_id'
+        )
+
+    @pytest.mark.asyncio
+    async def test_update_event_attributes_returns_updated_event(self, db_client):
+        """Test update_event_attributes issues one conditional UpdateItem and returns ALL_NEW."""
+        stored_item = {
+            'event_id': 'evt_abc123xyz456',
+            'event_type': 'order.created',
+            'payload': '{"order_id":"1"}',
+            'status': 'delivered',
+            'created_at': '2024-01-15T10:30:01+00:00',
+            'delivered_at': '2024-01-15T10:31:00+00:00',
+            'delivery_attempts': 1,
+            'user_id': 'user_123'
+        }
+
+        with patch.object(
+            db_client.dynamodb.meta.client, 'update_item',
+            return_value={'Attributes': stored_item}
+        ) as mock_update:
+            event = await db_client.update_event_attributes(
+                "evt_abc123xyz456", {"payload": {"order_id": "1"}}, expected_user_id="user_123"
+            )
+
+        kwargs = mock_update.call_args.kwargs
+        assert kwargs['UpdateExpression'] == 'SET #f0 = :v0'
+        assert kwargs['ReturnValues'] == 'ALL_NEW'
+        assert kwargs['ConditionExpression'] == (
+            'attribute_exists(#event_id) AND #user_id = :expected_user_id'
+        )
+        assert event.payload == {"order_id": "1"}
+        assert event.status == "delivered"
+        assert event.delivered_at.year == 2024
+
+    @pytest.mark.asyncio
+    async def test_rekey_and_delete_invalidate_idempotency_cache(self, db_client):
+        """Test that changing or deleting an event drops its old idempotency-key cache entry."""
+        from src.storage.cache import LocalIdempotencyCache
+
+        stored_item = {
+            'event_id': 'evt_abc123xyz456',
+            'event_type': 'order.created',
+            'payload': '{"order_id":"1"}',
+            'status': 'pending',
+            'created_at': '2024-01-15T10:30:01+00:00',
+            'delivery_attempts': 0,
+            'user_id': 'user_123',
+            'idempotency_key': 'old-key'
+        }
+        db_client.idempotency_cache = LocalIdempotencyCache()
+
+        with patch.object(
+            db_client.dynamodb.meta.client, 'update_item',
+            return_value={'Attributes': dict(stored_item)}
+        ) as mock_update:
+            event = await db_client.update_event_attributes(
+                "evt_abc123xyz456", {"idempotency_key": "new-key"}
+            )
+
+        assert mock_update.call_args.kwargs['ReturnValues'] == 'ALL_OLD'
+        assert event.idempotency_key == "new-key"
+        assert await db_client.idempotency_cache.get("user_123", "old-key") is None
+        assert (await db_client.idempotency_cache.get("user_123", "new-key")).event_id == event.event_id
+
+        with patch.object(
+            db_client.dynamodb.meta.client, 'delete_item',
+            return_value={'Attributes': {**stored_item, 'idempotency_key': 'new-key'}}
+        ):
+            await db_client.delete_event("evt_abc123xyz456")
+
+        assert await db_client.idempotency_cache.get("user_123", "new-key") is None
+
+    @pytest.mark.asyncio
+    async def test_big_int_and_nan_payload_round_trip(self, db_client):
+        """Test that payload values outside orjson's range are stored and read back unchanged."""
+        import math
+        from src.storage import dynamodb as dynamodb_module
+
+        event = dynamodb_module.Event(
+            event_id="evt_abc123xyz456",
+            event_type="order.created",
+            payload={"big": 2 ** 70, "ratio": float("nan")},
+            status="pending",
+            created_at=datetime(2024, 1, 15, 10, 30, 1, tzinfo=timezone.utc)
+        )
+
+        with patch.object(db_client.dynamodb.meta.client, 'put_item') as mock_put:
+            await db_client.put_event(event)
+
+        stored = dict(mock_put.call_args.kwargs['Item'])
+        restored = dynamodb_module._item_to_event(stored)
+        assert restored.payload["big"] == 2 ** 70
+        assert math.isnan(restored.payload["ratio"])
+
+    @pytest.mark.asyncio
+    async def test_idempotency_lookup_and_batch_get_deserialize_stored_items(self, db_client):
+        """Test that lookups read stored items the same way as _item_to_event."""
+        stored = {
+            'event_id': 'evt_abc123xyz456',
+            'event_type': 'order.created',
+            'payload': '{"big": 1180591620717411303424}',
+            'metadata': None,
+            'status': 'pending',
+            'created_at': '2024-01-15T10:30:01+00:00',
+            'delivered_at': None,
+            'user_id': 'user_123',
+            'idempotency_key': 'key-1'
+        }
+
+        with patch.object(db_client.dynamodb.meta.client, 'query', return_value={'Items': [dict(stored)]}):
+            found = await db_client.get_event_by_idempotency_key('user_123', 'key-1')
+        with patch.object(
+            db_client.dynamodb.meta.client, 'batch_get_item',
+            return_value={'Responses': {db_client.table_name: [dict(stored)]}}
+        ):
+            batch_found = await db_client.batch_get_events(['evt_abc123xyz456'])
+
+        for event in (found, batch_found[0]):
+            assert event.payload == {"big": 2 ** 70}
+            assert event.created_at == datetime(2024, 1, 15, 10, 30, 1, tzinfo=timezone.utc)
+
+    @pytest.mark.asyncio
+    async def test_delete_event_conditional_on_owner(self, db_client):
+        """Test delete_event checks ownership in the DeleteItem and reports a missing event as None."""
+        with patch.object(db_client.dynamodb.meta.client, 'delete_item', return_value={}) as mock_delete:
+            deleted = await db_client.delete_event("evt_abc123xyz456", expected_user_id="user_123")
+
+        kwargs = mock_delete.call_args.kwargs
+        assert deleted is None
+        assert kwargs['ReturnValues'] == 'ALL_OLD'
+        assert kwargs['ConditionExpression'] == (
+            'attribute_not_exists(#event_id) OR #user_id = :expected_user_id'
+        )
+        assert kwargs['ExpressionAttributeValues'] == {':expected_user_id': 'user_123'}
+
     @pytest.mark.asyncio
     async def test_update_event_invalid_event(self, db_client):
         """Test update_event with invalid event object."""
@@ -354,7 +614,7 @@ class TestDynamoDBClient:
     async def test_update_event_dynamodb_error(self, db_client, sample_event_model):
         """Test update_event error handling."""
         # Mock DynamoDB table to raise an error
-        with patch.object(db_client.table, 'put_item', side_effect=ClientError(
+        with patch.object(db_client.dynamodb.meta.client, 'put_item', side_effect=ClientError(
             error_response={'Error': {'Code': 'ConditionalCheckFailedException', 'Message': 'Test error'}},
             operation_name='PutItem'
         )):
@@ -452,7 +712,7 @@ class TestBatchDynamoDBOperations:
             }
         }
 
-        with patch.object(db_client.dynamodb, 'batch_write_item', return_value=mock_response):
+        with patch.object(db_client.dynamodb.meta.client, 'batch_write_item', return_value=mock_response):
             result = await db_client.batch_put_events(events)
 
             # One successful, one failed due to unprocessed
@@ -461,6 +721,42 @@ class TestBatchDynamoDBOperations:
             assert result["failed_items"][0]["event_id"] == "evt_test001"
             assert "Unprocessed" in result["failed_items"][0]["reason"]
 
+    @pytest.mark.asyncio
+    async def test_batch_put_events_retries_unprocessed_items(self, db_client):
+        """Test that throttled puts are re-submitted instead of reported as failed."""
+        from src.storage import dynamodb as dynamodb_module
+
+        events = [
+            dynamodb_module.Event(
+                event_id=f"evt_abc123xyz45{i}",
+                event_type="order.created",
+                payload={"order_id": f"{i}"},
+                created_at=datetime(2024, 1, 15, 10, 30, 1, tzinfo=timezone.utc)
+            )
+            for i in range(2)
+        ]
+        throttled = {
+            'UnprocessedItems': {
+                db_client.table_name: [
+                    {'PutRequest': {'Item': {'event_id': 'evt_abc123xyz451'}}}
+                ]
+            }
+        }
+
+        with patch.object(dynamodb_module, 'UNPROCESSED_BASE_DELAY', 0), \
+                patch.object(
+                    db_client.dynamodb.meta.client,
+                    'batch_write_item',
+                    side_effect=[throttled, {'UnprocessedItems': {}}]
+                ) as mock_write:
+            result = await db_client.batch_put_events(events)
+
+        assert mock_write.call_count == 2
+        retried = mock_write.call_args.kwargs['RequestItems'][db_client.table_name]
+        assert retried == throttled['UnprocessedItems'][db_client.table_name]
+        assert result["successful_event_ids"] == ["evt_abc123xyz450", "evt_abc123xyz451"]
+        assert result["failed_items"] == []
+
     @pytest.mark.asyncio
     async def test_batch_put_events_validation_errors(self, db_client):
         """Test batch_put_events with validation errors."""
@@ -569,7 +865,7 @@ class TestBatchDynamoDBOperations:
             }
         }
 
-        with patch.object(db_client.dynamodb, 'batch_write_item', return_value=mock_response):
+        with patch.object(db_client.dynamodb.meta.client, 'batch_write_item', return_value=mock_response):
             result = await db_client.batch_delete_events(event_ids)
 
             # One successful, one failed
@@ -577,6 +873,37 @@ class TestBatchDynamoDBOperations:
             assert len(result["failed_event_ids"]) == 1
             assert result["failed_event_ids"][0] == "evt_test002"
 
+    @pytest.mark.asyncio
+    async def test_batch_update_events_refreshes_cache_for_written_events(self, db_client):
+        """Test batch_update_events writes in batch and re-caches only written events."""
+        events = [
+            Event(
+                event_id=event_id,
+                event_type="order.created",
+                payload={"order_id": "12345"},
+                status="delivered",
+                created_at=datetime.now(timezone.utc),
+                delivered_at=datetime.now(timezone.utc),
+                delivery_attempts=1,
+                user_id="user_123",
+                idempotency_key=f"key-{event_id}"
+            )
+            for event_id in ["evt_aaaaaaaaaaaa", "evt_bbbbbbbbbbbb"]
+        ]
+        batch_result = {
+            "successful_event_ids": ["evt_aaaaaaaaaaaa"],
+            "failed_items": [{"event_id": "evt_bbbbbbbbbbbb", "reason": "Unprocessed by DynamoDB"}]
+        }
+        db_client.idempotency_cache = MagicMock()
+        db_client.idempotency_cache.set = AsyncMock()
+
+        with patch.object(db_client, 'batch_put_events', new_callable=AsyncMock, return_value=batch_result) as mock_put:
+            result = await db_client.batch_update_events(events)
+
+        mock_put.assert_awaited_once_with(events)
+        assert result == batch_result
+        db_client.idempotency_cache.set.assert_awaited_once_with(events[0])
+
     @pytest.mark.asyncio
     async def test_batch_delete_events_validation_errors(self, db_client):
         """Test batch_delete_events with validation errors."""
@@ -642,4 +969,34 @@ class TestBatchDynamoDBOperations:
         # Create 101 keys (exceeds limit)
         keys = [f"key{i}" for i in range(101)]
         with pytest.raises(ValueError, match="batch size cannot exceed 100 keys"):
-            await db_client.batch_get_events_by_idempotency_keys("user123", keys)
\ No newline at end of file
+            await db_client.batch_get_events_by_idempotency_keys("user123", keys)
+
+    @pytest.mark.asyncio
+    async def test_batch_get_events_by_idempotency_keys_uses_exact_queries(self, db_client):
+        """Test that each distinct key is resolved with its own exact-match query."""
+        item = {
+            "event_id": "evt_abc123xyz456",
+            "event_type": "order.created",
+            "payload": '{"order_id": "123"}',
+            "status": "delivered",
+            "created_at": "2024-01-15T10:30:01+00:00",
+            "delivery_attempts": 1,
+            "user_id": "user123",
+            "idempotency_key": "order-2"
+        }
+
+        def query(**kwargs):
+            key = kwargs["ExpressionAttributeValues"][":idempotency_key"]
+            return {"Items": [dict(item)] if key == "order-2" else []}
+
+        with patch.object(db_client.dynamodb.meta.client, 'query', side_effect=query) as mock_query:
+            result = await db_client.batch_get_events_by_idempotency_keys(
+                "user123", ["order-3", "order-1", "order-2", "order-3"]
+            )
+
+        assert mock_query.call_count == 3
+        for call in mock_query.call_args_list:
+            assert call.kwargs["IndexName"] == "IdempotencyIndex"
+            assert "BETWEEN" not in call.kwargs["KeyConditionExpression"]
+        assert list(result.keys()) == ["order-2"]
+        assert result["order-2"].payload == {"order_id": "123"}
@@ -0,0 +1,44 @@
+"""
+Module: test_main.py
+Description: Unit tests for the Lambda entry point.
+
+Tests that metrics buffered during an invocation are published before the
+handler returns.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import src.main as main_module
+
+
+class TestLambdaHandler:
+    """Test cases for the Lambda handler."""
+
+    def test_handler_flushes_metrics_before_returning(self):
+        """Test that each invocation publishes buffered metrics."""
+        metrics_client = MagicMock()
+        metrics_client.flush = AsyncMock()
+        mangum_response = {"statusCode": 200, "headers": {}, "body": "{}"}
+
+        try:
+            with patch.object(main_module, "_mangum_handler", return_value=mangum_response) as mock_mangum, \
+                    patch.object(main_module, "get_metrics_client", return_value=metrics_client):
+                response = main_module.handler({"path": "/health"}, None)
+        finally:
+            asyncio.set_event_loop(None)
+
+        assert response == mangum_response
+        mock_mangum.assert_called_once_with({"path": "/health"}, None)
+        metrics_client.flush.assert_awaited_once()
+
+    def test_invocations_share_one_event_loop(self):
+        """Test that the handler reuses its loop and makes it the current loop."""
+        try:
+            loop = main_module._get_invocation_loop()
+
+            assert main_module._get_invocation_loop() is loop
+            assert asyncio.get_event_loop() is loop
+            assert not loop.is_closed()
+        finally:
+            asyncio.set_event_loop(None)
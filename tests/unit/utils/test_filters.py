@@ -0,0 +1,51 @@
+"""
+Module: test_filters.py
+Description: Unit tests for query-string filter parsing.
+
+Tests parse_filter_query: splitting a raw query string into filters and
+the status filter, and caching of the parsed result.
+"""
+
+import pytest
+
+from src.utils.filters import parse_filter_query
+
+
+class TestParseFilterQuery:
+    """Test cases for parse_filter_query."""
+
+    def test_parses_filters_and_status(self):
+        """Test that filters and status are split out and reserved params are skipped."""
+        filters, status = parse_filter_query(
+            "status=pending&limit=5&payload.order_id=123&created_at%5Bgte%5D=2024-01-01"
+        )
+
+        assert status == "pending"
+        assert set(filters) == {"payload.order_id", "created_at"}
+        assert filters["created_at"].operator == "gte"
+        assert filters["created_at"].value == "2024-01-01"
+
+    def test_result_is_cached_and_read_only(self):
+        """Test that a repeated query string reuses the same immutable result."""
+        first = parse_filter_query("payload.source=web")
+
+        assert parse_filter_query("payload.source=web") is first
+        assert first[1] is None
+        with pytest.raises(TypeError):
+            first[0]["payload.other"] = None
+
+    def test_repeated_keys_keep_last_value(self):
+        """Test that repeated parameters resolve to the last value, as with QueryParams."""
+        filters, status = parse_filter_query(
+            "status=pending&payload.amount%5Bgte%5D=100&status=failed&payload.amount%5Bgte%5D=200"
+        )
+
+        assert status == "failed"
+        assert filters["payload.amount"].value == "200"
+
+    def test_cache_ignores_pagination_and_param_order(self):
+        """Test that pages of the same filtered listing share one cached result."""
+        first = parse_filter_query("payload.region=eu&status=pending&limit=10")
+
+        assert parse_filter_query("status=pending&payload.region=eu&cursor=abc") is first
+        assert parse_filter_query("payload.region=us&status=pending") is not first
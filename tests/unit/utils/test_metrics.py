@@ -0,0 +1,44 @@
+"""
+Module: test_metrics.py
+Description: Unit tests for the CloudWatch metrics client.
+
+Tests that buffered metrics stay off the request path and are published
+together, with their enqueue timestamps and repeated data points merged,
+when the buffer is flushed.
+"""
+
+import pytest
+from unittest.mock import MagicMock
+
+from src.utils.metrics import MetricsClient
+
+
+class TestMetricsClient:
+    """Test cases for MetricsClient buffering."""
+
+    @pytest.mark.asyncio
+    async def test_enqueued_metrics_publish_together_on_flush(self):
+        """Test that enqueueing does not call CloudWatch and flush sends one batch."""
+        client = MetricsClient(flush_interval_seconds=3600)
+        client.cloudwatch = MagicMock()
+
+        client.enqueue_metric("EventCreated", 1.0, dimensions={"EventType": "order.created"})
+        client.enqueue_metrics([
+            {"metric_name": "EventDelivered", "value": 1.0},
+            {"metric_name": "EventDelivered", "value": 1.0}
+        ])
+        client.cloudwatch.put_metric_data.assert_not_called()
+
+        await client.flush()
+
+        client.cloudwatch.put_metric_data.assert_called_once()
+        metric_data = client.cloudwatch.put_metric_data.call_args.kwargs["MetricData"]
+        # Repeated data points are merged into one entry with Values/Counts
+        assert [d["MetricName"] for d in metric_data] == ["EventCreated", "EventDelivered"]
+        assert all("Timestamp" in d for d in metric_data)
+        assert metric_data[0]["Dimensions"] == [{"Name": "EventType", "Value": "order.created"}]
+        assert (metric_data[1]["Values"], metric_data[1]["Counts"]) == ([1.0], [2.0])
+
+        # Nothing left to publish
+        await client.flush()
+        client.cloudwatch.put_metric_data.assert_called_once()
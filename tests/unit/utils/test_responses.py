@@ -0,0 +1,21 @@
+"""
+Module: test_responses.py
+Description: Unit tests for the API response classes.
+
+Tests that SafeORJSONResponse renders with orjson and falls back to
+stdlib json for integers orjson cannot encode.
+"""
+
+import json
+
+from src.utils.responses import SafeORJSONResponse
+
+
+class TestSafeORJSONResponse:
+    """Test cases for SafeORJSONResponse."""
+
+    def test_renders_big_integers(self):
+        """Test that integers beyond 64 bits are rendered instead of raising."""
+        response = SafeORJSONResponse({"payload": {"big": 2 ** 70, "small": 1}})
+
+        assert json.loads(response.body) == {"payload": {"big": 2 ** 70, "small": 1}}